@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.busy` - Adafruit EPD - busy pin watching
+====================================================================================
+Waits for a display's busy pin, see Adafruit_EPD.busy_wait(). Pins that have a
+``wait_for(value, timeout)`` method, like GPIODBusyPin, block until the line
+changes. Other pins are read with a backoff that starts short and grows to the
+chipset's poll time, so short waits return quickly and long ones don't spin. Pins
+with a ``settle`` time, like KeypadBusyPin, are only read once it has passed
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+import digitalio
+
+try:
+    import gpiod
+except ImportError:
+    gpiod = None
+
+try:
+    import keypad
+except ImportError:
+    keypad = None
+
+try:
+    """Needed for type annotations"""
+    from typing import Any, Awaitable, Callable, Optional
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+# First pause between busy pin reads, doubled up to the chipset's poll time
+MIN_INTERVAL = 0.001
+
+
+def wait(  # noqa: PLR0913
+    pin: Any,
+    value: bool,
+    *,
+    timeout: Optional[float] = None,
+    interval: float = 0.01,
+    poll: Optional[Callable[[], None]] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """Wait for ``pin`` to read ``value``. ``poll`` is called at most every
+    ``interval`` seconds while waiting, for chipsets that only update their busy
+    pin when asked. Returns False if ``timeout`` seconds passed first"""
+    start = time.monotonic()
+    last_poll = start - interval
+    step = MIN_INTERVAL
+    wait_for = getattr(pin, "wait_for", None)
+    settle = getattr(pin, "settle", 0)
+    if settle:
+        # the pin's value lags the line, let it catch up with the command just sent
+        sleep(settle)
+    while pin.value != value:
+        now = time.monotonic()
+        if timeout is not None and now - start >= timeout:
+            return False
+        if poll is not None and now - last_poll >= interval:
+            poll()
+            last_poll = now
+        if wait_for is not None:
+            # block until the line changes, waking for the next poll or the timeout
+            limit = interval if poll is not None else None
+            if timeout is not None:
+                left = timeout - (now - start)
+                limit = left if limit is None else min(limit, left)
+            wait_for(value, limit)
+            continue
+        sleep(step if timeout is None else min(step, max(timeout - (now - start), 0)))
+        step = min(step * 2, interval)
+    return True
+
+
+async def wait_async(  # noqa: PLR0913
+    pin: Any,
+    value: bool,
+    *,
+    timeout: Optional[float] = None,
+    interval: float = 0.01,
+    poll: Optional[Callable[[], None]] = None,
+    sleep: Callable[[float], Awaitable[None]],
+) -> bool:
+    """Like wait(), but sleeps with ``await sleep()`` so other asyncio tasks run.
+    The pin is always read with the backoff, as wait_for() would block them"""
+    start = time.monotonic()
+    last_poll = start - interval
+    step = MIN_INTERVAL
+    settle = getattr(pin, "settle", 0)
+    if settle:
+        await sleep(settle)
+    while pin.value != value:
+        now = time.monotonic()
+        if timeout is not None and now - start >= timeout:
+            return False
+        if poll is not None and now - last_poll >= interval:
+            poll()
+            last_poll = now
+        await sleep(step if timeout is None else min(step, max(timeout - (now - start), 0)))
+        step = min(step * 2, interval)
+    return True
+
+
+class GPIODBusyPin:
+    """A busy pin read through the Linux GPIO character device with the ``gpiod``
+    (libgpiod 2) module. Its wait_for() sleeps in the kernel until the line
+    changes, so busy_wait() returns as soon as the panel is done. Pass it as
+    ``busy_pin`` instead of a DigitalInOut, with a Blinka pin such as ``board.D5``
+    or a line offset on ``chip``"""
+
+    def __init__(self, pin: Any, *, chip: str = "/dev/gpiochip0") -> None:
+        if gpiod is None:
+            raise RuntimeError("GPIODBusyPin needs the gpiod module")
+        line = getattr(pin, "id", pin)
+        if isinstance(line, tuple):
+            # Blinka pins on boards with several GPIO chips are (chip, line)
+            chip, line = f"/dev/gpiochip{line[0]}", line[1]
+        self._line = line
+        self._active = gpiod.line.Value.ACTIVE
+        self._request = gpiod.request_lines(
+            chip,
+            consumer="epd-busy",
+            config={
+                line: gpiod.LineSettings(
+                    direction=gpiod.line.Direction.INPUT,
+                    edge_detection=gpiod.line.Edge.BOTH,
+                )
+            },
+        )
+        self.direction = None
+
+    @property
+    def value(self) -> bool:
+        """The line level"""
+        return self._request.get_value(self._line) == self._active
+
+    def wait_for(self, value: bool, timeout: Optional[float]) -> bool:
+        """Sleep until the line reads ``value``, or ``timeout`` seconds pass. None
+        waits for as long as it takes. Returns whether the line reads ``value``"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.value != value:
+            left = None if deadline is None else deadline - time.monotonic()
+            if left is not None and left <= 0:
+                return False
+            # edges since the line was read are queued, none are missed
+            if self._request.wait_edge_events(left):
+                self._request.read_edge_events()
+        return True
+
+    def deinit(self) -> None:
+        """Release the line"""
+        self._request.release()
+
+
+class KeypadBusyPin:
+    """A busy pin watched by ``keypad.Keys`` on CircuitPython. The pin is scanned
+    in the background every ``interval`` seconds and its changes queued, so
+    reading it is a queue check rather than a pin read. Pass it as ``busy_pin``
+    instead of a DigitalInOut, with the microcontroller pin such as ``board.D5``"""
+
+    def __init__(self, pin: Any, *, interval: float = 0.001) -> None:
+        if keypad is None:
+            raise RuntimeError("KeypadBusyPin needs the keypad module")
+        # keypad only reports changes, start from the level the line is at now
+        with digitalio.DigitalInOut(pin) as line:
+            self._value = line.value
+        self._keys = keypad.Keys((pin,), value_when_pressed=True, pull=False, interval=interval)
+        self._event = keypad.Event()
+        # Time for a full scan after a command, before the queued level is trusted
+        self.settle = 2 * interval
+        self.direction = None
+
+    @property
+    def value(self) -> bool:
+        """The pin level as of the last scan"""
+        while self._keys.events.get_into(self._event):
+            self._value = self._event.pressed
+        return self._value
+
+    def deinit(self) -> None:
+        """Stop scanning the pin"""
+        self._keys.deinit()
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.commands` - Adafruit EPD - precompiled command lists
+====================================================================================
+Builds the compact command lists drivers use for their init, LUT and power down
+sequences, and walks them for Adafruit_EPD._send_command_list(). Each command is
+its byte, the number of data bytes, then the data. ``DELAY`` and a byte waits that
+many milliseconds, ``BUSY`` waits for the display to be ready, ``RESET`` toggles the
+reset pin and ``END`` stops the list early
+* Author(s): Adafruit Industries
+"""
+
+from micropython import const
+
+try:
+    """Needed for type annotations"""
+    from typing import Iterator, Tuple
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+DELAY = const(0xFF)
+END = const(0xFE)
+BUSY = const(0xFD)
+RESET = const(0xFC)
+
+# Wait for the busy pin, or the chipset's busy delay
+BUSY_WAIT = bytes((BUSY,))
+# Adafruit_EPD.hardware_reset(), so a power up list can start from reset
+HARDWARE_RESET = bytes((RESET,))
+
+
+def command(cmd: int, data: bytes = b"") -> bytes:
+    """A command and its data as a command list entry"""
+    if cmd in {DELAY, END, BUSY, RESET}:
+        raise ValueError(f"Command 0x{cmd:02X} is reserved in command lists")
+    if len(data) > 255:
+        raise ValueError("Command lists take at most 255 data bytes per command")
+    return bytes((cmd, len(data))) + bytes(data)
+
+
+def delay(ms: int) -> bytes:
+    """Wait ``ms`` milliseconds, longer waits are split into 255 ms steps"""
+    entry = b""
+    while ms > 0:
+        entry += bytes((DELAY, min(ms, 255)))
+        ms -= 255
+    return entry
+
+
+def compile_commands(*entries: bytes) -> bytes:
+    """Join command(), delay(), BUSY_WAIT and HARDWARE_RESET entries into one
+    command list. Whole command lists can be entries too, anything after an END in
+    them is dropped so the entries that follow are still sent"""
+    return b"".join(_until_end(entry) for entry in entries)
+
+
+def _until_end(sequence: bytes) -> bytes:
+    end = 0
+    for _, _, stop in walk(sequence):
+        end = stop
+    if end < len(sequence):
+        return bytes(sequence[:end])
+    return sequence
+
+
+def walk(sequence: bytes) -> Iterator[Tuple[int, int, int]]:
+    """Yield (command, start, end) for each entry of a command list, the data being
+    ``sequence[start:end]``. Delays yield DELAY with the millisecond byte as their
+    data, busy waits BUSY and resets RESET with no data. Data running past the end
+    of the list is cut short"""
+    i = 0
+    length = len(sequence)
+    while i < length:
+        cmd = sequence[i]
+        i += 1
+        if cmd == END:
+            return
+        if cmd in {BUSY, RESET}:
+            yield cmd, i, i
+        elif cmd == DELAY:
+            yield cmd, i, min(i + 1, length)
+            i += 1
+        else:
+            count = sequence[i] if i < length else 0
+            i += 1
+            yield cmd, min(i, length), min(i + count, length)
+            i += count
@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.dither` - Adafruit EPD - dithering for Pillow images
+====================================================================================
+Reduces photos to the handful of colors an ePaper panel can show, so they can be
+handed to ``image()`` without dithering them in a separate step first
+* Author(s): Adafruit Industries
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
+try:
+    """Needed for type annotations"""
+    from typing import Sequence, Tuple
+
+    from circuitpython_typing.pil import Image
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+FLOYD_STEINBERG = "floyd-steinberg"
+ATKINSON = "atkinson"
+BAYER = "bayer"
+
+# Error diffusion kernels as (dx, dy, weight) and the divisor for the weights
+_KERNELS = {
+    FLOYD_STEINBERG: (((1, 0, 7), (-1, 1, 3), (0, 1, 5), (1, 1, 1)), 16),
+    ATKINSON: (((1, 0, 1), (2, 0, 1), (-1, 1, 1), (0, 1, 1), (1, 1, 1), (0, 2, 1)), 8),
+}
+
+
+def _bayer(size: int) -> list:
+    matrix = [[0]]
+    while len(matrix) < size:
+        n = len(matrix)
+        matrix = [
+            [4 * matrix[y % n][x % n] + (0, 2, 3, 1)[(y // n) * 2 + x // n] for x in range(2 * n)]
+            for y in range(2 * n)
+        ]
+    return matrix
+
+
+# 8x8 ordered dither thresholds, scaled to offsets of about +/- half the range
+_BAYER_OFFSETS = [[4 * v - 126 for v in row] for row in _bayer(8)]
+
+
+def dither_image(
+    image: Image, palette: Sequence[Tuple[int, int, int]], method: str = FLOYD_STEINBERG
+) -> Image:
+    """Dither a Pillow image down to the RGB colors in ``palette``. ``method`` is one of
+    FLOYD_STEINBERG, ATKINSON or BAYER. Returns an RGB image that only uses palette
+    colors. Error diffusion runs row by row, keeping error only for the rows the
+    kernel reaches (two for Floyd-Steinberg, three for Atkinson)"""
+    if method != BAYER and method not in _KERNELS:
+        raise ValueError(f"Unknown dither method: {method}")
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    palette = [tuple(color) for color in palette]
+
+    if numpy is not None:
+        pixels = numpy.asarray(image, dtype=numpy.int32)
+        colors = numpy.array(palette, dtype=numpy.int32)
+        if method == BAYER:
+            indices = _ordered_numpy(pixels, colors)
+        else:
+            indices = _diffuse_numpy(pixels, colors, *_KERNELS[method])
+        data = indices.astype(numpy.uint8).tobytes()
+    elif method == BAYER:
+        data = _ordered_rows(image, palette)
+    else:
+        data = _diffuse_rows(image, palette, *_KERNELS[method])
+
+    result = _PILImage.frombytes("P", image.size, data)
+    result.putpalette([channel for color in palette for channel in color])
+    return result.convert("RGB")
+
+
+def _nearest_numpy(values, colors):
+    # squared distance to each color, less the |values|^2 term they all share
+    return (values @ (-2 * colors.T) + (colors * colors).sum(axis=1)).argmin(axis=-1)
+
+
+def _ordered_numpy(pixels, colors):
+    height, width = pixels.shape[:2]
+    offsets = numpy.array(_BAYER_OFFSETS, dtype=numpy.int32)
+    offsets = numpy.tile(offsets, (height // 8 + 1, width // 8 + 1))[:height, :width]
+    return _nearest_numpy(numpy.clip(pixels + offsets[..., None], 0, 255), colors)
+
+
+def _diffuse_numpy(pixels, colors, kernel, divisor):  # noqa: PLR0914
+    # A pixel only takes error from pixels to its left and from rows above, all of
+    # which come earlier in x + 2 * y order, so each x + 2 * y diagonal is done as
+    # one array operation. In the flattened buffer a diagonal is an evenly strided
+    # slice, and padding soaks up error pushed past the edges.
+    height, width = pixels.shape[:2]
+    pitch = width + 4
+    work = numpy.zeros(((height + 2) * pitch, 3), dtype=numpy.int32)
+    work.reshape(height + 2, pitch, 3)[:height, 2 : width + 2] = pixels
+    indices = numpy.zeros((height + 2) * pitch, dtype=numpy.intp)
+    offsets = [(dy * pitch + dx, weight) for dx, dy, weight in kernel]
+    weights = sorted({weight for _, _, weight in kernel})
+    scale = -2 * colors.T
+    lengths = (colors * colors).sum(axis=1)
+    for step in range(width + 2 * height - 2):
+        first = max(0, (step - width + 2) // 2)
+        last = min(height - 1, step // 2)
+        if last < first:
+            continue
+        start = first * (pitch - 2) + step + 2
+        stop = last * (pitch - 2) + step + 3
+        values = work[start : stop : pitch - 2]
+        numpy.maximum(values, 0, out=values)
+        numpy.minimum(values, 255, out=values)
+        nearest = (values @ scale + lengths).argmin(axis=1)
+        indices[start : stop : pitch - 2] = nearest
+        error = values - colors.take(nearest, axis=0)
+        shares = {weight: error * weight // divisor for weight in weights}
+        for offset, weight in offsets:
+            work[start + offset : stop + offset : pitch - 2] += shares[weight]
+    return indices.reshape(height + 2, pitch)[:height, 2 : width + 2]
+
+
+def _nearest(palette, r, g, b):
+    best = 0
+    best_distance = None
+    for i, (pr, pg, pb) in enumerate(palette):
+        distance = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+        if best_distance is None or distance < best_distance:
+            best, best_distance = i, distance
+    return best
+
+
+def _ordered_rows(image, palette):
+    width, height = image.size
+    raw = image.tobytes()
+    indices = bytearray(width * height)
+    cache = {}
+    for y in range(height):
+        offsets = _BAYER_OFFSETS[y % 8]
+        for x in range(width):
+            offset = offsets[x % 8]
+            i = (y * width + x) * 3
+            rgb = (
+                min(max(raw[i] + offset, 0), 255),
+                min(max(raw[i + 1] + offset, 0), 255),
+                min(max(raw[i + 2] + offset, 0), 255),
+            )
+            index = cache.get(rgb)
+            if index is None:
+                index = cache[rgb] = _nearest(palette, *rgb)
+            indices[y * width + x] = index
+    return indices
+
+
+def _diffuse_rows(image, palette, kernel, divisor):  # noqa: PLR0914
+    width, height = image.size
+    raw = image.tobytes()
+    indices = bytearray(width * height)
+    depth = max(dy for _, dy, _ in kernel) + 1
+    # one row of per-channel error for each row the kernel reaches, 2 pixels of
+    # padding either side
+    rows = [[0] * ((width + 4) * 3) for _ in range(depth)]
+    for y in range(height):
+        error_row = rows[0]
+        for x in range(width):
+            i = (y * width + x) * 3
+            e = (x + 2) * 3
+            r = min(max(raw[i] + error_row[e], 0), 255)
+            g = min(max(raw[i + 1] + error_row[e + 1], 0), 255)
+            b = min(max(raw[i + 2] + error_row[e + 2], 0), 255)
+            index = _nearest(palette, r, g, b)
+            indices[y * width + x] = index
+            pr, pg, pb = palette[index]
+            r, g, b = r - pr, g - pg, b - pb
+            for dx, dy, weight in kernel:
+                target = rows[dy]
+                j = e + dx * 3
+                target[j] += r * weight // divisor
+                target[j + 1] += g * weight // divisor
+                target[j + 2] += b * weight // divisor
+        rows.append([0] * ((width + 4) * 3))
+        rows.pop(0)
+    return indices
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -55,10 +56,41 @@ _EK79686_CDI = const(0x50)
 _EK79686_RESOLUTION = const(0x61)
 _EK79686_VCM_DC_SETTING = const(0x82)
 
+# Sent by power_up(), from the hardware reset on
+_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.delay(200),
+    commands.command(_EK79686_PANEL_SETTING, b"\x0f"),  # LUT from OTP 176x264
+    commands.command(0x4D, b"\xaa"),  # FITI cmd (???)
+    commands.command(0x87, b"\x28"),
+    commands.command(0x84, b"\x00"),
+    commands.command(0x83, b"\x05"),
+    commands.command(0xA8, b"\xdf"),
+    commands.command(0xA9, b"\x05"),
+    commands.command(0xB1, b"\xe8"),
+    commands.command(0xAB, b"\xa1"),
+    commands.command(0xB9, b"\x10"),
+    commands.command(0x88, b"\x80"),
+    commands.command(0x90, b"\x02"),
+    commands.command(0x86, b"\x15"),
+    commands.command(0x91, b"\x8d"),
+    commands.command(0xAA, b"\x0f"),
+    commands.command(_EK79686_POWER_ON),
+    commands.BUSY_WAIT,
+)
+_POWER_OFF_CODE = commands.compile_commands(
+    commands.command(_EK79686_POWER_OFF, b"\x17"),
+    commands.BUSY_WAIT,
+)
+_DEEP_SLEEP_CODE = commands.command(_EK79686_DEEP_SLEEP, b"\xa5")
+
 
 class Adafruit_EK79686(Adafruit_EPD):
     """driver class for Adafruit EK79686 ePaper display breakouts"""
 
+    _refresh_delay = 16
+    _max_baudrate = 4000000
+
     def __init__(
         self,
         width: int,
@@ -70,8 +102,11 @@ class Adafruit_EK79686(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         self._buffer1_size = int(width * height / 8)
         self._buffer2_size = int(width * height / 8)
@@ -101,52 +136,20 @@ class Adafruit_EK79686(Adafruit_EPD):
 
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while not self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        time.sleep(0.2)
-
-        self.command(_EK79686_PANEL_SETTING, bytearray([0x0F]))  # LUT from OTP 176x264
-        self.command(0x4D, bytearray([0xAA]))  # FITI cmd (???)
-        self.command(0x87, bytearray([0x28]))
-        self.command(0x84, bytearray([0x00]))
-        self.command(0x83, bytearray([0x05]))
-        self.command(0xA8, bytearray([0xDF]))
-        self.command(0xA9, bytearray([0x05]))
-        self.command(0xB1, bytearray([0xE8]))
-        self.command(0xAB, bytearray([0xA1]))
-        self.command(0xB9, bytearray([0x10]))
-        self.command(0x88, bytearray([0x80]))
-        self.command(0x90, bytearray([0x02]))
-        self.command(0x86, bytearray([0x15]))
-        self.command(0x91, bytearray([0x8D]))
-        self.command(0xAA, bytearray([0x0F]))
-        self.command(_EK79686_POWER_ON)
-        self.busy_wait()
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The command list power_up() sends"""
+        return _POWER_UP_CODE
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_EK79686_POWER_OFF, bytearray([0x17]))
-        self.busy_wait()
+        self._send_command_list(_POWER_OFF_CODE)
 
         if self._rst:  # Only deep sleep if we can get out of it
-            self.command(_EK79686_DEEP_SLEEP, bytearray([0xA5]))
+            self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
         self.command(_EK79686_DISPLAY_REFRESH)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(16)  # wait 16 seconds
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
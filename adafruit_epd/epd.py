@@ -9,16 +9,30 @@ CircuitPython driver for Adafruit ePaper display breakouts
 * Author(s): Dean Miller
 """
 
+import binascii
+import struct
 import time
 
+import adafruit_framebuf
 from digitalio import Direction
 from micropython import const
 
-from adafruit_epd import mcp_sram
+from adafruit_epd import busy, commands, frame, glyphs, mcp_sram, sprite, trace
+from adafruit_epd.dither import dither_image
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
 
 try:
     """Needed for type annotations"""
-    from typing import Any, Callable, Optional, Union
+    from typing import Any, BinaryIO, Callable, Iterable, List, Optional, Tuple, Union
 
     from busio import SPI
     from circuitpython_typing.pil import Image
@@ -31,6 +45,36 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
 
+# Rows per band when comparing frames in display(if_changed=True)
+_DIFF_BAND_ROWS = const(8)
+# Pixel classes used when converting images, see Adafruit_EPD._image_planes
+_IMAGE_RED = const(6)  # red high, green and blue low
+_IMAGE_DARK = const(7)  # all channels low
+_BMP_CACHE_SIZE = const(1024)  # most 24 bit colors remembered while loading a BMP
+_FRAME_CHUNK = const(512)  # bytes moved at a time between frame files, SRAM and the panel
+_SRAM_CHUNK = const(256)  # bytes per SPI transfer when display() streams SRAM to the panel
+_CALIBRATE_BYTES = const(64)  # test pattern written and read back by calibrate_baudrate()
+
+
+class _Transaction:
+    """Holds the SPI bus for a run of commands, see Adafruit_EPD.transaction()"""
+
+    def __init__(self, epd: "Adafruit_EPD") -> None:
+        self._epd = epd
+
+    def __enter__(self) -> "Adafruit_EPD":
+        epd = self._epd
+        if not epd._transaction_depth:
+            epd._lock_bus()
+        epd._transaction_depth += 1
+        return epd
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        epd = self._epd
+        epd._transaction_depth -= 1
+        if not epd._transaction_depth:
+            epd.spi_device.unlock()
+
 
 class Adafruit_EPD:
     """Base class for EPD displays"""
@@ -42,6 +86,28 @@ class Adafruit_EPD:
     DARK = const(4)
     LIGHT = const(5)
 
+    # RAM transfer modes used by display()
+    TX_BYTE = const(0)  # toggle CS around every byte
+    TX_ROW = const(1)  # hold CS, one SPI write per buffer row
+    TX_PLANE = const(2)  # hold CS, one SPI write per buffer plane
+
+    # Busy and refresh timing in seconds, drivers override these for their chipset
+    _busy_level = False  # busy pin value while the panel is working
+    _busy_poll = 0.01  # time between busy pin reads
+    _busy_delay = 0.5  # wait used instead of the busy pin when there is none
+    _busy_settle = 0  # extra pause once the panel is no longer busy
+    _refresh_settle = 0  # pause after starting a refresh, before watching busy
+    _refresh_delay = 3  # time a refresh takes, waited for when there is no busy pin
+    _partial_refresh_delay = 1  # same for a partial refresh
+    # (reset pin value, seconds to hold it) steps of hardware_reset()
+    _reset_sequence = ((False, 0.1), (True, 0.1))
+
+    # Fastest SPI clock in Hz the chipset takes, drivers set this from their datasheet.
+    # It is the default clock, and the fastest calibrate_baudrate() tries
+    _max_baudrate = 1000000
+    # Command reading back the black RAM, for chipsets that have one
+    _read_ram_command = None
+
     def __init__(
         self,
         width: int,
@@ -52,6 +118,8 @@ class Adafruit_EPD:
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        *,
+        baudrate: Optional[int] = None,
     ) -> None:
         self._width = width
         self._height = height
@@ -78,114 +146,469 @@ class Adafruit_EPD:
 
         # SPI interface (required)
         self.spi_device = spi
-        while not self.spi_device.try_lock():
-            time.sleep(0.01)
-        self.spi_device.configure(baudrate=1000000)  # 1 Mhz
+        self._baudrate = self._max_baudrate
+        if baudrate is not None:
+            self.baudrate = baudrate
+        self._lock_bus()
         self.spi_device.unlock()
 
         self._spibuf = bytearray(1)
+        # Nested transaction() blocks holding the SPI bus
+        self._transaction_depth = 0
+        # Command list from _power_up_commands(), built on first use
+        self._power_up_code = None
         self._single_byte_tx = False
+        # None means 'derive from _single_byte_tx', drivers that tolerate
+        # burst RAM writes can set this to TX_ROW or TX_PLANE
+        self._ram_tx_mode = None
 
         self.sram = None
+        # The pair of buffers display() streams SRAM to the panel through
+        self._sram_chunks = None
         if sramcs_pin:
             self.sram = mcp_sram.Adafruit_MCP_SRAM(sramcs_pin, spi)
+            self._sram_chunks = (bytearray(_SRAM_CHUNK), bytearray(_SRAM_CHUNK))
 
-        self._buf = bytearray(3)
+        # SRAM read header, and the data of _command_bytes()
+        self._buf = bytearray(4)
         self._buffer1_size = self._buffer2_size = 0
         self._buffer1 = self._buffer2 = None
         self._framebuf1 = self._framebuf2 = None
         self._colorframebuf = self._blackframebuf = None
         self._black_inverted = self._color_inverted = True
+        # (framebuf, value) of each plane drawing in a color writes, see _bind_planes()
+        self._planes = {}
+        # Chipsets that can write a RAM window for partial updates set this
+        self._supports_ram_window = False
+        # Bounding box [x0, y0, x1, y1] in panel coordinates drawn since the last display()
+        self._dirty_box = None
+        # Per band CRCs of the last frame sent, once display(if_changed=True) is used
+        self._frame_crcs = None
+        # trace.EPDStats while enable_stats() is on
+        self._stats = None
+        # Seconds busy_wait() waits for the busy pin before giving up, None for ever
+        self.busy_timeout = None
         self.hardware_reset()
 
-    def display(self) -> None:
-        """show the contents of the display buffer"""
-        self.power_up()
-
-        self.set_ram_address(0, 0)
+    def display(self, partial: bool = False, if_changed: bool = False) -> Optional[List]:
+        """show the contents of the display buffer. With partial=True, chipsets that
+        support RAM windows only send and refresh the area drawn since the last
+        display(), other chipsets fall back to a full update.
+
+        With if_changed=True the buffers are compared against the last frame sent,
+        the power up, transfer and refresh are skipped entirely if nothing changed.
+        Returns the list of changed regions, see changed_regions()."""
+        regions, signature, refresh = self._plan_display(partial, if_changed)
+        if if_changed and not regions:
+            return regions
+        if refresh is not None:
+            self.power_up()
+        self._send_display(signature, refresh)
+        if refresh is not None:
+            if refresh:
+                self.update_partial()
+            else:
+                self.update()
+        return regions
+
+    async def display_async(
+        self, partial: bool = False, if_changed: bool = False
+    ) -> Optional[List]:
+        """Like display(), but lets other asyncio tasks run while the panel powers up
+        and refreshes. The buffers are still sent to the panel in one go."""
+        regions, signature, refresh = self._plan_display(partial, if_changed)
+        if if_changed and not regions:
+            return regions
+        if refresh is not None:
+            await self._power_up_async()
+        self._send_display(signature, refresh)
+        if refresh is not None:
+            if refresh:
+                await self.update_partial_async()
+            else:
+                await self.update_async()
+        return regions
 
+    def _plan_display(self, partial: bool, if_changed: bool) -> tuple:
+        """Work out what display() sends. Returns the changed regions, the frame
+        signature and whether to refresh: None for no refresh, True for a partial one"""
         if self.sram:
-            while not self.spi_device.try_lock():
-                time.sleep(0.01)
-            self.sram.cs_pin.value = False
-            # send read command
-            self._buf[0] = mcp_sram.Adafruit_MCP_SRAM.SRAM_READ
-            # send start address
-            self._buf[1] = 0
-            self._buf[2] = 0
-            self.spi_device.write(self._buf, end=3)
-            self.spi_device.unlock()
-
-        # first data byte from SRAM will be transfered in at the
-        # same time as the EPD command is transferred out
-        databyte = self.write_ram(0)
-
-        while not self.spi_device.try_lock():
-            time.sleep(0.01)
+            # make sure drawing cached on the host has reached the SRAM
+            self.sram.flush()
+
+        signature = None
+        if if_changed or self._frame_crcs is not None:
+            signature = self._frame_signature()
+        regions = None
+        if if_changed:
+            regions = self._changed_bands(signature)
+            if not regions:
+                return regions, signature, None
+
+        if partial and self._supports_ram_window:
+            if self._dirty_box is not None:
+                return regions, signature, True
+            # changes drawn straight into the buffers leave no dirty box to send
+            return regions, signature, False if regions else None
+        return regions, signature, False
+
+    def _send_display(self, signature: Optional[List], refresh: Optional[bool]) -> None:
+        """Send the buffers, or the dirty window for a partial refresh, to the
+        powered up panel"""
+        if refresh:
+            self._display_window(*self._dirty_box)
+        elif refresh is not None:
+            self._display_buffers()
+        self._dirty_box = None
+        if refresh is not None:
+            # only frames the panel got are compared against
+            self._frame_crcs = signature
+
+    def changed_regions(self) -> List:
+        """The areas of the panel that differ from the last frame sent by display(),
+        as (x, y, width, height) tuples of whole rows in panel coordinates. Covers the
+        whole panel until a frame has been sent with change tracking enabled."""
+        if self.sram:
+            self.sram.flush()
+        return self._changed_bands(self._frame_signature())
+
+    def _frame_signature(self) -> List:
+        """CRC32 of each band of rows in each buffer"""
+        band = (self._buffer1_size // self._height) * _DIFF_BAND_ROWS
+        signature = []
+        offset = 0
+        for buffer, size in (
+            (self._buffer1, self._buffer1_size),
+            (self._buffer2, self._buffer2_size),
+        ):
+            for start in range(0, size, band):
+                end = min(start + band, size)
+                if self.sram:
+                    data = self.sram.read(offset + start, end - start)
+                else:
+                    data = memoryview(buffer)[start:end]
+                signature.append(binascii.crc32(data))
+            offset += size
+        return signature
+
+    def _changed_bands(self, signature: List) -> List:
+        """Turn the bands whose CRC differs from the last frame into merged regions"""
+        if self._frame_crcs is None or len(self._frame_crcs) != len(signature):
+            return [(0, 0, self._width, self._height)]
+        bands = (self._height + _DIFF_BAND_ROWS - 1) // _DIFF_BAND_ROWS
+        changed = [False] * bands
+        for i, crc in enumerate(signature):
+            if crc != self._frame_crcs[i]:
+                changed[i % bands] = True
+        regions = []
+        start = None
+        for band in range(bands + 1):
+            if band < bands and changed[band]:
+                if start is None:
+                    start = band
+            elif start is not None:
+                y = start * _DIFF_BAND_ROWS
+                height = min(band * _DIFF_BAND_ROWS, self._height) - y
+                regions.append((0, y, self._width, height))
+                start = None
+        return regions
+
+    def _display_buffers(self) -> None:
+        """Send both RAM buffers to the powered up display"""
+        with self.transaction():
+            self.set_ram_address(0, 0)
+
+        self.write_ram(0)
+
+        # SRAM data is clocked out at the SRAM's own rate, the panel takes it as sent
+        rate = self.sram.baudrate if self.sram else self._baudrate
+        self._lock_bus(rate)
         self._dc.value = True
 
         if self.sram:
-            for _ in range(self._buffer1_size):
-                databyte = self._spi_transfer(databyte)
-            self.sram.cs_pin.value = True
+            self._stream_sram(0, self._buffer1_size)
         else:
-            self._spi_transfer(self._buffer1)
+            self._spi_stream(self._buffer1, 0, self._buffer1_size)
 
         self._cs.value = True
         self.spi_device.unlock()
-        time.sleep(0.002)
-
-        if self.sram:
-            while not self.spi_device.try_lock():
-                time.sleep(0.01)
-            self.sram.cs_pin.value = False
-            # send read command
-            self._buf[0] = mcp_sram.Adafruit_MCP_SRAM.SRAM_READ
-            # send start address
-            self._buf[1] = (self._buffer1_size >> 8) & 0xFF
-            self._buf[2] = self._buffer1_size & 0xFF
-            self.spi_device.write(self._buf, end=3)
-            self.spi_device.unlock()
+        self._sleep(0.002)
 
         if self._buffer2_size != 0:
-            # first data byte from SRAM will be transfered in at the
-            # same time as the EPD command is transferred out
-            databyte = self.write_ram(1)
+            self.write_ram(1)
 
-            while not self.spi_device.try_lock():
-                time.sleep(0.01)
+            self._lock_bus(rate)
             self._dc.value = True
 
             if self.sram:
-                for _ in range(self._buffer2_size):
-                    databyte = self._spi_transfer(databyte)
-                self.sram.cs_pin.value = True
+                self._stream_sram(self._buffer1_size, self._buffer2_size)
             else:
-                self._spi_transfer(self._buffer2)
+                self._spi_stream(self._buffer2, 0, self._buffer2_size)
 
             self._cs.value = True
             self.spi_device.unlock()
-        elif self.sram:
-            self.sram.cs_pin.value = True
+
+    def _sram_read_start(self, addr: int) -> None:
+        """Select the SRAM and send a sequential read from addr. Expects the bus to
+        be locked and the display deselected"""
+        self.sram.cs_pin.value = False
+        self._buf[0] = mcp_sram.Adafruit_MCP_SRAM.SRAM_READ
+        self._buf[1] = (addr >> 8) & 0xFF
+        self._buf[2] = addr & 0xFF
+        self.spi_device.write(self._buf, end=3)
+
+    def _stream_sram(self, offset: int, size: int) -> None:
+        """Stream size bytes of SRAM from offset to the display, a chunk at a time.
+        Expects the bus to be locked and DC to be high. Both chips are selected
+        while each chunk is sent with write_readinto(), so the SRAM clocks out the
+        next chunk as the display takes this one. Chipsets that toggle CS around
+        every byte, and buses without write_readinto(), read each chunk then send it"""
+        sram_cs = self.sram.cs_pin
+        chunk, spare = self._sram_chunks
+        pos = 0
+        if self.ram_transfer_mode != Adafruit_EPD.TX_BYTE and hasattr(
+            self.spi_device, "write_readinto"
+        ):
+            count = min(_SRAM_CHUNK, size)
+            self._cs.value = True
+            self._sram_read_start(offset)
+            self.spi_device.readinto(chunk, end=count)
+            self._cs.value = False
+            try:
+                while pos + count < size:
+                    self.spi_device.write_readinto(chunk, spare, out_end=count, in_end=count)
+                    pos += count
+                    count = min(_SRAM_CHUNK, size - pos)
+                    chunk, spare = spare, chunk
+            except NotImplementedError:
+                pass
+            sram_cs.value = True
+            self._spi_stream(chunk, 0, count)
+            pos += count
+        while pos < size:
+            count = min(_SRAM_CHUNK, size - pos)
+            self._cs.value = True
+            self._sram_read_start(offset + pos)
+            self.spi_device.readinto(chunk, end=count)
+            sram_cs.value = True
+            self._spi_stream(chunk, 0, count)
+            pos += count
+
+    def save_frame(self, dest: Union[str, BinaryIO], rle: bool = True) -> None:
+        """Save the display buffers as a frame file (see ``adafruit_epd.frame``) to a
+        path or a seekable binary stream, for display_frame() or load_frame() later.
+        With rle=True the planes are run length encoded."""
+        stream = open(dest, "wb") if isinstance(dest, str) else dest
+        try:
+            self._write_frame(stream, rle)
+        finally:
+            if stream is not dest:
+                stream.close()
+
+    def _write_frame(self, stream: BinaryIO, rle: bool) -> None:
+        if self.sram:
+            self.sram.flush()
+        flags = frame.FLAG_RLE if rle else 0
+        if self._black_inverted:
+            flags |= frame.FLAG_BLACK_INVERTED
+        if self._color_inverted:
+            flags |= frame.FLAG_COLOR_INVERTED
+        sizes = (self._buffer1_size, self._buffer2_size)
+        family = type(self).__name__
+        start = stream.tell()
+        stream.write(frame.pack_header(family, self._width, self._height, flags, sizes, (0, 0)))
+
+        stored = []
+        offset = 0
+        chunk = _FRAME_CHUNK if self.sram else max(sizes)
+        for buffer, size in zip((self._buffer1, self._buffer2), sizes):
+            written = 0
+            for pos in range(0, size, chunk):
+                end = min(pos + chunk, size)
+                if self.sram:
+                    data = self.sram.read(offset + pos, end - pos)
+                else:
+                    data = memoryview(buffer)[pos:end]
+                if rle:
+                    data = frame.rle_encode(data)
+                stream.write(data)
+                written += len(data)
+            stored.append(written)
+            offset += size
+
+        end = stream.tell()
+        stream.seek(start)
+        stream.write(frame.pack_header(family, self._width, self._height, flags, sizes, stored))
+        stream.seek(end)
+
+    def _read_frame_header(self, stream: BinaryIO) -> tuple:
+        """Read a frame file header, checking the frame was saved by a display set up
+        the same way as this one"""
+        family, width, height, flags, sizes, stored = frame.read_header(stream)
+        if (
+            family != type(self).__name__
+            or (width, height) != (self._width, self._height)
+            or sizes != (self._buffer1_size, self._buffer2_size)
+        ):
+            raise ValueError(f"Frame is for a {width}x{height} {family} display.")
+        if bool(flags & frame.FLAG_BLACK_INVERTED) != bool(self._black_inverted) or bool(
+            flags & frame.FLAG_COLOR_INVERTED
+        ) != bool(self._color_inverted):
+            raise ValueError("Frame was saved with different buffer inversion.")
+        return bool(flags & frame.FLAG_RLE), sizes, stored
+
+    def load_frame(self, source: Union[str, BinaryIO]) -> None:
+        """Load a frame file saved by save_frame() into the display buffers"""
+        stream = open(source, "rb") if isinstance(source, str) else source
+        try:
+            rle, sizes, stored = self._read_frame_header(stream)
+            chunk = bytearray(_FRAME_CHUNK)
+            offset = 0
+            for buffer, size, length in zip((self._buffer1, self._buffer2), sizes, stored):
+                pos = 0
+                for count in frame.read_plane(stream, length, rle, chunk):
+                    if pos + count > size:
+                        raise ValueError("Frame plane is larger than the buffer")
+                    if self.sram:
+                        self.sram.write(offset + pos, chunk[:count])
+                    else:
+                        buffer[pos : pos + count] = chunk[:count]
+                    pos += count
+                offset += size
+        finally:
+            if stream is not source:
+                stream.close()
+        self._dirty_box = [0, 0, self._width - 1, self._height - 1]
+
+    def display_frame(self, source: Union[str, BinaryIO]) -> None:
+        """Send a frame file saved by save_frame() straight to the panel and update
+        it, without decoding it into the display buffers. Uncompressed frames
+        opened from a path are memory mapped where the platform supports it"""
+        stream = open(source, "rb") if isinstance(source, str) else source
+        mapped = view = None
+        try:
+            rle, sizes, stored = self._read_frame_header(stream)
+            position = stream.tell()
+            if mmap is not None and not rle and stream is not source:
+                mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(mapped)
+
+            with self.transaction():
+                self.power_up()
+                self.set_ram_address(0, 0)
+            chunk = bytearray(_FRAME_CHUNK)
+            for index in range(2):
+                if not sizes[index]:
+                    continue
+                if index:
+                    self._sleep(0.002)
+                self.write_ram(index)
+                self._lock_bus()
+                self._dc.value = True
+                if view is not None:
+                    self._spi_stream(view, position, position + stored[index])
+                    position += stored[index]
+                else:
+                    for count in frame.read_plane(stream, stored[index], rle, chunk):
+                        self._spi_stream(chunk, 0, count)
+                self._cs.value = True
+                self.spi_device.unlock()
+        finally:
+            if view is not None:
+                view.release()
+                mapped.close()
+            if stream is not source:
+                stream.close()
 
         self.update()
+        # the panel no longer shows what is in the buffers
+        self._frame_crcs = None
+
+    def _display_window(self, x_0: int, y_0: int, x_1: int, y_1: int) -> None:
+        """Send the rows and bytes of both buffers covering a panel area to the
+        matching RAM window"""
+        stride = self._buffer1_size // self._height
+        x_0 //= 8
+        x_1 //= 8
+        with self.transaction():
+            self.set_ram_window(x_0, y_0, x_1, y_1)
+
+        buffers = [self._buffer1]
+        if self._buffer2_size != 0:
+            buffers.append(self._buffer2)
+        for index, buffer in enumerate(buffers):
+            offset = index * self._buffer1_size
+            self.set_ram_address(x_0, y_0)
+            self.write_ram(index)
+
+            self._lock_bus()
+            self._dc.value = True
+            for row in range(y_0 * stride + x_0, y_1 * stride + x_0 + 1, stride):
+                if self.sram:
+                    self._cs.value = True
+                    self.spi_device.unlock()
+                    data = self.sram.read(offset + row, x_1 - x_0 + 1)
+                    self._lock_bus()
+                    self._spi_stream(data, 0, len(data))
+                else:
+                    self._spi_stream(buffer, row, row + x_1 - x_0 + 1)
+            self._cs.value = True
+            self.spi_device.unlock()
+
+    def _mark_dirty(self, x: int, y: int, width: int, height: int) -> None:
+        """Grow the dirty bounding box by a rectangle given in rotated coordinates.
+        Only chipsets with RAM windows use the box, the rest skip the work"""
+        if not self._supports_ram_window:
+            return
+        rotation = self.rotation
+        if rotation in {1, 3}:
+            x, y = y, x
+            width, height = height, width
+        if rotation in {1, 2}:
+            x = self._width - x - width
+        if rotation in {2, 3}:
+            y = self._height - y - height
+        x_1 = min(x + width, self._width) - 1
+        y_1 = min(y + height, self._height) - 1
+        x = max(x, 0)
+        y = max(y, 0)
+        if x > x_1 or y > y_1:
+            return
+        box = self._dirty_box
+        if box is None:
+            self._dirty_box = [x, y, x_1, y_1]
+        else:
+            box[0] = min(box[0], x)
+            box[1] = min(box[1], y)
+            box[2] = max(box[2], x_1)
+            box[3] = max(box[3], y_1)
 
     def hardware_reset(self) -> None:
         """If we have a reset pin, do a hardware reset by toggling it"""
         if self._rst:
-            self._rst.value = False
-            time.sleep(0.1)
-            self._rst.value = True
-            time.sleep(0.1)
+            for value, seconds in self._reset_sequence:
+                self._rst.value = value
+                self._sleep(seconds)
+
+    async def _hardware_reset_async(self) -> None:
+        """Like hardware_reset(), but lets other asyncio tasks run while waiting"""
+        if type(self).hardware_reset is not Adafruit_EPD.hardware_reset:
+            self.hardware_reset()
+        elif self._rst:
+            for value, seconds in self._reset_sequence:
+                self._rst.value = value
+                await self._sleep_async(seconds)
 
     def command(self, cmd: int, data: Optional[bytearray] = None, end: bool = True) -> int:
-        """Send command byte to display."""
+        """Send command byte to display. Inside a transaction() the bus is already
+        held, otherwise it is locked for just this command."""
         self._cs.value = True
         self._dc.value = False
         self._cs.value = False
 
-        while not self.spi_device.try_lock():
-            time.sleep(0.01)
+        held = self._transaction_depth
+        if not held:
+            self._lock_bus()
         ret = self._spi_transfer(cmd)
 
         if data is not None:
@@ -193,10 +616,188 @@ class Adafruit_EPD:
             self._spi_transfer(data)
         if end:
             self._cs.value = True
-        self.spi_device.unlock()
+        if not held:
+            self.spi_device.unlock()
 
         return ret
 
+    def _lock_bus(self, baudrate: int = 0) -> None:
+        """Lock the SPI bus and clock it for the panel, at baudrate or the display's
+        rate. The SRAM, or another device sharing the bus, may have left it at its own"""
+        while not self.spi_device.try_lock():
+            self._sleep(0.01)
+        self.spi_device.configure(baudrate=baudrate or self._baudrate)
+
+    @property
+    def baudrate(self) -> int:
+        """The SPI clock in Hz used for the panel. Defaults to the fastest the
+        chipset takes, lower it or pass ``baudrate`` to the driver for long wires,
+        or let calibrate_baudrate() find the fastest that works"""
+        return self._baudrate
+
+    @baudrate.setter
+    def baudrate(self, baudrate: int) -> None:
+        if baudrate <= 0:
+            raise ValueError("Baudrate must be positive")
+        self._baudrate = baudrate
+
+    def calibrate_baudrate(self, rates: Optional[Iterable[int]] = None) -> int:
+        """Find the fastest SPI clock the wiring to the panel takes, on chipsets that
+        can read back their RAM. Steps up through ``rates``, by default the chipset's
+        maximum and its halvings down to 1 MHz, writing a test pattern at each and reading it
+        back at the slowest. Keeps and returns the fastest rate that read back intact.
+        Overwrites the panel RAM, display() the buffers again afterwards. The panel
+        is powered down when done, display() powers it up again."""
+        if self._read_ram_command is None:
+            raise NotImplementedError(f"{type(self).__name__} can't read back its RAM")
+        if rates is None:
+            rates = [self._max_baudrate]
+            while rates[0] > 1000000:
+                rates.insert(0, max(rates[0] // 2, 1000000))
+        rates = sorted(rates)
+        if not rates or rates[0] <= 0:
+            raise ValueError("Calibration needs positive rates")
+        pattern = bytearray((i * 37 + 0x5A) & 0xFF for i in range(_CALIBRATE_BYTES))
+        readback = bytearray(_CALIBRATE_BYTES)
+        original = self._baudrate
+        found = None
+        try:
+            self._baudrate = rates[0]
+            with self.transaction():
+                self.power_up()
+            for rate in rates:
+                # a different pattern each step, so a dropped write can't pass
+                for i, value in enumerate(pattern):
+                    pattern[i] = value ^ 0xFF
+                self._baudrate = rate
+                self._write_test_pattern(pattern)
+                self._baudrate = rates[0]
+                self._read_ram(readback)
+                if readback != pattern:
+                    break
+                found = rate
+        finally:
+            self._baudrate = original if found is None else found
+            self.power_down()
+        if found is None:
+            raise RuntimeError("Panel RAM didn't read back, even at the slowest rate")
+        return found
+
+    def _write_test_pattern(self, pattern: bytearray) -> None:
+        """Write pattern to the start of the black RAM"""
+        self.set_ram_address(0, 0)
+        self.write_ram(0)
+        self._lock_bus()
+        self._dc.value = True
+        self._spi_stream(pattern, 0, len(pattern))
+        self._cs.value = True
+        self.spi_device.unlock()
+
+    def _read_ram(self, buffer: bytearray) -> None:
+        """Read the start of the black RAM into buffer, with _read_ram_command"""
+        self.set_ram_address(0, 0)
+        self.command(self._read_ram_command, end=False)
+        self._lock_bus()
+        self._dc.value = True
+        self._cs.value = False
+        # the first byte read after the command is a dummy
+        self.spi_device.readinto(self._buf, end=1)
+        self.spi_device.readinto(buffer)
+        self._cs.value = True
+        self.spi_device.unlock()
+
+    def transaction(self) -> _Transaction:
+        """A context manager that locks the SPI bus once for every command sent in
+        it, rather than once per command. CS still frames each command. Only send
+        commands inside it, SRAM access locks the bus itself. Blocks can be nested::
+
+            with display.transaction():
+                display.command(0x01, bytearray([0x03]))
+                display.command(0x04)
+        """
+        return _Transaction(self)
+
+    def _send_command_list(self, init_sequence: bytes) -> None:
+        """Send a command list (see ``adafruit_epd.commands``) in one transaction.
+        Data is written straight from the list, without copying it"""
+        with self.transaction():
+            for cmd, start, end in commands.walk(init_sequence):
+                if cmd == commands.DELAY:
+                    if start < end:
+                        self._sleep(init_sequence[start] / 1000.0)
+                elif cmd == commands.BUSY:
+                    self.busy_wait()
+                elif cmd == commands.RESET:
+                    self.hardware_reset()
+                else:
+                    self._command_span(cmd, init_sequence, start, end)
+
+    async def _send_command_list_async(self, init_sequence: bytes) -> None:
+        """Like _send_command_list(), awaiting the delays, busy waits and resets.
+        The bus is only held while each command is sent"""
+        for cmd, start, end in commands.walk(init_sequence):
+            if cmd == commands.DELAY:
+                if start < end:
+                    await self._sleep_async(init_sequence[start] / 1000.0)
+            elif cmd == commands.BUSY:
+                await self.busy_wait_async()
+            elif cmd == commands.RESET:
+                await self._hardware_reset_async()
+            else:
+                with self.transaction():
+                    self._command_span(cmd, init_sequence, start, end)
+
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends, starting with the hardware reset.
+        must be implemented in subclass"""
+        raise NotImplementedError()
+
+    def _power_up_list(self) -> bytes:
+        """The _power_up_commands() list, built the first time"""
+        if self._power_up_code is None:
+            self._power_up_code = self._power_up_commands()
+        return self._power_up_code
+
+    def _send_power_up_commands(self) -> None:
+        """Send the _power_up_commands() list"""
+        self._send_command_list(self._power_up_list())
+
+    async def _power_up_async(self) -> None:
+        """Like power_up(), but lets other asyncio tasks run during its waits.
+        Drivers that override power_up() have it called as is"""
+        if type(self).power_up is not Adafruit_EPD.power_up:
+            self.power_up()
+            return
+        await self._send_command_list_async(self._power_up_list())
+
+    def _command_span(self, cmd: int, data: bytes, start: int, end: int) -> None:
+        """Send a command with data[start:end] as its data, like command(). Expects
+        the bus to be held"""
+        self._cs.value = True
+        self._dc.value = False
+        self._cs.value = False
+        self._spi_transfer(cmd)
+        if end > start:
+            self._dc.value = True
+            if self._single_byte_tx:
+                self._spi_write_bytes(data, start, end)
+            else:
+                self.spi_device.write(data, start=start, end=end)
+        self._cs.value = True
+
+    def _command_bytes(
+        self, cmd: int, count: int, b0: int = 0, b1: int = 0, b2: int = 0, b3: int = 0
+    ) -> None:
+        """Send a command with up to four data bytes, like command() but without
+        building a bytearray, for the address and window commands sent every refresh"""
+        buf = self._buf
+        buf[0] = b0
+        buf[1] = b1
+        buf[2] = b2
+        buf[3] = b3
+        with self.transaction():
+            self._command_span(cmd, buf, 0, count)
+
     def _spi_transfer(self, data: Union[int, bytearray]) -> Optional[int]:
         """Transfer one byte or bytearray, toggling the cs pin if required by the EPD chipset"""
         if isinstance(data, int):  # single byte!
@@ -220,23 +821,184 @@ class Adafruit_EPD:
             return self._spibuf[0]
 
         if isinstance(data, bytearray):
-            for x in data:
-                self._spi_transfer(x)
+            self._spi_write_bytes(data, 0, len(data))
         return None
 
+    def _spi_write_bytes(self, data: bytearray, start: int, end: int) -> None:
+        """Write data[start:end] one byte at a time, toggling the cs pin around each byte"""
+        cs = self._cs
+        buf = self._spibuf
+        write = self.spi_device.write
+        for i in range(start, end):
+            buf[0] = data[i]
+            cs.value = False
+            write(buf)
+            cs.value = True
+
+    def _spi_stream(self, data: bytearray, start: int, end: int) -> None:
+        """Stream data[start:end] from a RAM buffer to the display, using the
+        RAM transfer mode. Expects the bus to be locked and DC to be high."""
+        mode = self.ram_transfer_mode
+        if mode == Adafruit_EPD.TX_BYTE:
+            self._spi_write_bytes(data, start, end)
+            return
+        # the write_ram() command byte may have released CS, grab it for the burst
+        self._cs.value = False
+        if mode == Adafruit_EPD.TX_PLANE:
+            self.spi_device.write(data, start=start, end=end)
+            return
+        row = max(self._buffer1_size // self._height, 1)
+        for i in range(start, end, row):
+            self.spi_device.write(data, start=i, end=min(i + row, end))
+
+    @property
+    def ram_transfer_mode(self) -> Literal[0, 1, 2]:
+        """How display() streams the RAM buffers to the panel. ``TX_BYTE`` toggles
+        CS around every byte, ``TX_ROW`` holds CS and sends one SPI write per buffer
+        row, ``TX_PLANE`` holds CS and sends each buffer in a single SPI write.
+        Defaults to the fastest mode known to work with the chipset."""
+        if self._ram_tx_mode is None:
+            if self._single_byte_tx:
+                return Adafruit_EPD.TX_BYTE
+            return Adafruit_EPD.TX_PLANE
+        return self._ram_tx_mode
+
+    @ram_transfer_mode.setter
+    def ram_transfer_mode(self, mode: Literal[0, 1, 2]) -> None:
+        if mode not in {Adafruit_EPD.TX_BYTE, Adafruit_EPD.TX_ROW, Adafruit_EPD.TX_PLANE}:
+            raise ValueError("RAM transfer mode must be TX_BYTE, TX_ROW or TX_PLANE")
+        self._ram_tx_mode = mode
+
     def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating.
-        must be implemented in subclass"""
-        raise NotImplementedError()
+        """Power up the display in preparation for writing RAM and updating, by
+        sending the chipset's _power_up_commands()"""
+        self._send_power_up_commands()
 
     def power_down(self) -> None:
         """Power down the display, must be implemented in subclass"""
         raise NotImplementedError()
 
+    def _sleep(self, seconds: float) -> None:  # noqa: PLR6301
+        """Every wait of the drivers goes through here, so enable_stats() can time it"""
+        time.sleep(seconds)
+
+    async def _sleep_async(self, seconds: float) -> None:  # noqa: PLR6301
+        """Like _sleep(), for the asyncio methods"""
+        await asyncio.sleep(seconds)
+
+    def enable_stats(self, callback: Optional[Callable[[str, Any], None]] = None) -> trace.EPDStats:
+        """Start counting commands, bytes, pin changes, bus lock spins, busy waits and
+        sleeps, returning the ``adafruit_epd.trace.EPDStats`` they are counted in.
+        ``callback(event, value)`` is called for each of them as it happens. Until
+        then, and after disable_stats(), nothing is counted or slowed down."""
+        if self._stats is None:
+            self._stats = trace.EPDStats(callback)
+            self._stats.attach(self)
+        else:
+            self._stats.callback = callback
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """Stop counting, the stats object keeps its counts"""
+        if self._stats is not None:
+            self._stats.detach()
+            self._stats = None
+
+    @property
+    def stats(self) -> Optional[trace.EPDStats]:
+        """The stats enable_stats() is counting in, or None"""
+        return self._stats
+
+    def busy_wait(self) -> None:
+        """Wait for display to be done with current task, either by watching the
+        busy pin (see ``adafruit_epd.busy``), or pausing. Inside a transaction() the
+        bus is released while waiting. Raises RuntimeError after busy_timeout"""
+        depth = self._transaction_depth
+        if depth:
+            # nothing is sent while waiting, let other devices use the bus
+            self._transaction_depth = 0
+            self.spi_device.unlock()
+        try:
+            if self._busy:
+                ready = busy.wait(
+                    self._busy,
+                    not self._busy_level,
+                    timeout=self.busy_timeout,
+                    interval=self._busy_poll,
+                    poll=self._busy_poller(),
+                    sleep=self._sleep,
+                )
+                if not ready:
+                    raise RuntimeError("Timed out waiting for the display")
+            else:
+                self._sleep(self._busy_delay)
+            if self._busy_settle:
+                self._sleep(self._busy_settle)
+        finally:
+            if depth:
+                self._lock_bus()
+                self._transaction_depth = depth
+
+    async def busy_wait_async(self) -> None:
+        """Like busy_wait(), but lets other asyncio tasks run while waiting"""
+        if self._busy:
+            ready = await busy.wait_async(
+                self._busy,
+                not self._busy_level,
+                timeout=self.busy_timeout,
+                interval=self._busy_poll,
+                poll=self._busy_poller(),
+                sleep=self._sleep_async,
+            )
+            if not ready:
+                raise RuntimeError("Timed out waiting for the display")
+        else:
+            await self._sleep_async(self._busy_delay)
+        if self._busy_settle:
+            await self._sleep_async(self._busy_settle)
+
+    def _busy_poller(self) -> Optional[Callable[[], None]]:
+        """_poll_busy() for chipsets that override it, else None"""
+        if type(self)._poll_busy is Adafruit_EPD._poll_busy:
+            return None
+        return self._poll_busy
+
+    def _poll_busy(self) -> None:
+        """Called at most every _busy_poll seconds while waiting, for chipsets that
+        only update the busy pin when asked for their status"""
+
     def update(self) -> None:
-        """Update the display from internal memory, must be implemented in subclass"""
+        """Update the display from internal memory"""
+        with self.transaction():
+            self._start_update(False)
+        self._wait_update(False)
+
+    async def update_async(self) -> None:
+        """Like update(), but lets other asyncio tasks run during the refresh"""
+        with self.transaction():
+            self._start_update(False)
+        await self._wait_update_async(False)
+
+    def _start_update(self, partial: bool) -> None:
+        """Send the commands that start a refresh, or a partial refresh on chipsets
+        that support RAM windows. must be implemented in subclass"""
         raise NotImplementedError()
 
+    def _wait_update(self, partial: bool) -> None:
+        """Wait for a refresh started by _start_update() to finish"""
+        if self._refresh_settle:
+            self._sleep(self._refresh_settle)
+        self.busy_wait()
+        if not self._busy:
+            self._sleep(self._partial_refresh_delay if partial else self._refresh_delay)
+
+    async def _wait_update_async(self, partial: bool) -> None:
+        if self._refresh_settle:
+            await self._sleep_async(self._refresh_settle)
+        await self.busy_wait_async()
+        if not self._busy:
+            await self._sleep_async(self._partial_refresh_delay if partial else self._refresh_delay)
+
     def write_ram(self, index: int) -> None:
         """Send the one byte command for starting the RAM write process. Returns
         the byte read at the same time over SPI. index is the RAM buffer, can be
@@ -247,6 +1009,30 @@ class Adafruit_EPD:
         """Set the RAM address location, must be implemented in subclass"""
         raise NotImplementedError()
 
+    def set_ram_window(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Set the RAM window for partial updates, x in bytes and y in rows.
+        must be implemented in subclasses that support partial updates"""
+        raise NotImplementedError()
+
+    def update_partial(self) -> None:
+        """Update the display after a partial RAM write, chipsets without a partial
+        refresh do a full update"""
+        if not self._supports_ram_window:
+            self.update()
+            return
+        with self.transaction():
+            self._start_update(True)
+        self._wait_update(True)
+
+    async def update_partial_async(self) -> None:
+        """Like update_partial(), but lets other asyncio tasks run during the refresh"""
+        if not self._supports_ram_window:
+            await self.update_async()
+            return
+        with self.transaction():
+            self._start_update(True)
+        await self._wait_update_async(True)
+
     def set_black_buffer(self, index: Literal[0, 1], inverted: bool) -> None:
         """Set the index for the black buffer data (0 or 1) and whether its inverted"""
         if index == 0:
@@ -256,6 +1042,7 @@ class Adafruit_EPD:
         else:
             raise RuntimeError("Buffer index must be 0 or 1")
         self._black_inverted = inverted
+        self._bind_planes()
 
     def set_color_buffer(self, index: Literal[0, 1], inverted: bool) -> None:
         """Set the index for the color buffer data (0 or 1) and whether its inverted"""
@@ -266,27 +1053,75 @@ class Adafruit_EPD:
         else:
             raise RuntimeError("Buffer index must be 0 or 1")
         self._color_inverted = inverted
+        self._bind_planes()
+
+    def _bind_planes(self) -> None:
+        """Work out once which planes each color writes and the value each gets, so
+        drawing only has to look the color up"""
+        if self._blackframebuf is None or self._colorframebuf is None:
+            self._planes = {}
+            return
+        self._planes = {
+            color: self._color_planes(color)
+            for color in (
+                Adafruit_EPD.BLACK,
+                Adafruit_EPD.WHITE,
+                Adafruit_EPD.INVERSE,
+                Adafruit_EPD.RED,
+                Adafruit_EPD.DARK,
+                Adafruit_EPD.LIGHT,
+            )
+        }
 
-    def _color_dup(
-        self,
-        func: Callable,
-        args: Any,
-        color: Literal[0, 1, 2, 3, 4, 5],
-    ) -> None:
-        black = getattr(self._blackframebuf, func)
-        red = getattr(self._colorframebuf, func)
+    def _color_planes(self, color: int) -> tuple:
+        """The (framebuf, value) pairs drawing in a color writes"""
         if self._blackframebuf is self._colorframebuf:  # monochrome
-            black(*args, color=(color != Adafruit_EPD.WHITE) != self._black_inverted)
-        else:
-            black(*args, color=(color == Adafruit_EPD.BLACK) != self._black_inverted)
-            red(*args, color=(color == Adafruit_EPD.RED) != self._color_inverted)
+            return ((self._blackframebuf, (color != Adafruit_EPD.WHITE) != self._black_inverted),)
+        return (
+            (self._blackframebuf, (color == Adafruit_EPD.BLACK) != self._black_inverted),
+            (self._colorframebuf, (color == Adafruit_EPD.RED) != self._color_inverted),
+        )
 
     def pixel(self, x: int, y: int, color: int) -> None:
         """draw a single pixel in the display buffer"""
-        self._color_dup("pixel", (x, y), color)
+        for framebuf, value in self._planes.get(color) or self._color_planes(color):
+            framebuf.pixel(x, y, value)
+        if self._supports_ram_window:
+            self._mark_dirty(x, y, 1, 1)
+
+    def pixels(self, points: Iterable[Tuple[int, int]], color: int) -> None:
+        """Draw a pixel at each (x, y) of ``points`` in one color. The planes, rotation
+        and clipping are worked out once for all of them, and bits are set straight
+        in the buffers, so plotting thousands of points is much cheaper than calling
+        pixel() for each"""
+        width = self.width
+        height = self.height
+        points = [(x, y) for x, y in points if 0 <= x < width and 0 <= y < height]
+        if not points:
+            return
+        for framebuf, value in self._planes.get(color) or self._color_planes(color):
+            if framebuf.stride % 8:
+                # rows that don't start on a byte boundary, leave to adafruit_framebuf
+                for x, y in points:
+                    framebuf.pixel(x, y, value)
+                continue
+            index = glyphs.framebuf_index(framebuf)
+            buf = framebuf.buf
+            if value:
+                for x, y in points:
+                    bit = index(x, y)
+                    buf[bit >> 3] |= 0x80 >> (bit & 7)
+            else:
+                for x, y in points:
+                    bit = index(x, y)
+                    buf[bit >> 3] &= ~(0x80 >> (bit & 7))
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        self._mark_dirty(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
 
     def fill(self, color: int) -> None:
         """fill the screen with the passed color"""
+        self._dirty_box = [0, 0, self._width - 1, self._height - 1]
         red_fill = ((color == Adafruit_EPD.RED) != self._color_inverted) * 0xFF
         black_fill = ((color == Adafruit_EPD.BLACK) != self._black_inverted) * 0xFF
 
@@ -299,15 +1134,21 @@ class Adafruit_EPD:
 
     def rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
         """draw a rectangle"""
-        self._color_dup("rect", (x, y, width, height), color)
+        for framebuf, value in self._planes.get(color) or self._color_planes(color):
+            framebuf.rect(x, y, width, height, value)
+        self._mark_dirty(x, y, width, height)
 
     def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
         """fill a rectangle with the passed color"""
-        self._color_dup("fill_rect", (x, y, width, height), color)
+        for framebuf, value in self._planes.get(color) or self._color_planes(color):
+            framebuf.fill_rect(x, y, width, height, value)
+        self._mark_dirty(x, y, width, height)
 
     def line(self, x_0: int, y_0: int, x_1: int, y_1: int, color: int) -> None:
         """Draw a line from (x_0, y_0) to (x_1, y_1) in passed color"""
-        self._color_dup("line", (x_0, y_0, x_1, y_1), color)
+        for framebuf, value in self._planes.get(color) or self._color_planes(color):
+            framebuf.line(x_0, y_0, x_1, y_1, value)
+        self._mark_dirty(min(x_0, x_1), min(y_0, y_1), abs(x_1 - x_0) + 1, abs(y_1 - y_0) + 1)
 
     def text(
         self,
@@ -319,33 +1160,35 @@ class Adafruit_EPD:
         font_name: str = "font5x8.bin",
         size: int = 1,
     ) -> None:
-        """Write text string at location (x, y) in given color, using font file"""
-        if self._blackframebuf is self._colorframebuf:  # monochrome
-            self._blackframebuf.text(
+        """Write text string at location (x, y) in given color, using font file.
+        Glyphs are cached per font and written straight into the display buffers"""
+        font = glyphs.get_font(font_name)
+        for framebuf, value in self._planes.get(color) or self._color_planes(color):
+            if framebuf.stride % 8:
+                # rows that don't start on a byte boundary, leave to adafruit_framebuf
+                framebuf.text(string, x, y, value, font_name=font_name, size=size)
+                continue
+            glyphs.draw_text(
+                framebuf.buf,
+                (framebuf.stride * framebuf.height + 7) // 8,
+                glyphs.framebuf_index(framebuf),
+                (self.width, self.height),
                 string,
                 x,
                 y,
-                font_name=font_name,
+                int(value),
+                font=font,
                 size=size,
-                color=(color != Adafruit_EPD.WHITE) != self._black_inverted,
-            )
-        else:
-            self._blackframebuf.text(
-                string,
-                x,
-                y,
-                font_name=font_name,
-                size=size,
-                color=(color == Adafruit_EPD.BLACK) != self._black_inverted,
-            )
-            self._colorframebuf.text(
-                string,
-                x,
-                y,
-                font_name=font_name,
-                size=size,
-                color=(color == Adafruit_EPD.RED) != self._color_inverted,
+                bpp=1,
+                pixel=framebuf.pixel,
             )
+        lines = string.split("\n")
+        self._mark_dirty(
+            x,
+            y,
+            max(len(chunk) for chunk in lines) * (font.font_width + 1) * size,
+            len(lines) * font.font_height * size,
+        )
 
     @property
     def width(self) -> int:
@@ -392,9 +1235,72 @@ class Adafruit_EPD:
         """draw a vertical line"""
         self.fill_rect(x, y, 1, height, color)
 
-    def image(self, image: Image) -> None:
+    def blit(  # noqa: PLR0913
+        self,
+        src: adafruit_framebuf.FrameBuffer,
+        x: int,
+        y: int,
+        *,
+        color: int = BLACK,
+        mask: Optional[adafruit_framebuf.FrameBuffer] = None,
+        op: str = sprite.COPY,
+    ) -> None:
+        """Draw a 1 bit sprite, an MHMSB ``adafruit_framebuf.FrameBuffer``, with its top
+        left corner at (x, y). Set bits are drawn in ``color``. ``op`` is how the
+        sprite combines with each plane, as if the planes weren't inverted: ``copy``
+        draws clear bits white, ``or`` only draws the set bits, ``and`` keeps what is
+        drawn under set bits and ``xor`` toggles it. With ``mask``, a sprite of the
+        same size, only pixels with a set mask bit change. The sprite is rotated
+        with the display, its own rotation is not used. Rows are combined a byte
+        at a time rather than pixel by pixel"""
+        if op not in sprite.OPS:
+            raise ValueError(f"Unknown blit op: {op}")
+        width, height = src.width, src.height
+        rows, native_width, native_height = sprite.rotate_rows(
+            sprite.sprite_rows(src), width, height, self.rotation
+        )
+        masks = None
+        if mask is not None:
+            if (mask.width, mask.height) != (width, height):
+                raise ValueError("Mask must be the same size as the sprite")
+            masks = sprite.rotate_rows(sprite.sprite_rows(mask), width, height, self.rotation)[0]
+
+        # top left corner in the unrotated buffer
+        native_x, native_y = x, y
+        if self.rotation in {1, 3}:
+            native_x, native_y = y, x
+        if self.rotation in {1, 2}:
+            native_x = self._width - native_x - native_width
+        if self.rotation in {2, 3}:
+            native_y = self._height - native_y - native_height
+
+        if self._blackframebuf is self._colorframebuf:  # monochrome
+            planes = ((self._blackframebuf, color != Adafruit_EPD.WHITE, self._black_inverted),)
+        else:
+            planes = (
+                (self._blackframebuf, color == Adafruit_EPD.BLACK, self._black_inverted),
+                (self._colorframebuf, color == Adafruit_EPD.RED, self._color_inverted),
+            )
+        for framebuf, drawn, inverted in planes:
+            sprite.blit_rows(
+                framebuf,
+                native_x,
+                native_y,
+                native_width,
+                native_height,
+                rows if drawn else None,
+                masks,
+                op,
+                inverted,
+            )
+        self._mark_dirty(x, y, width, height)
+
+    def image(self, image: Image, dither: Optional[str] = None) -> None:
         """Set buffer to value of Python Imaging Library image.  The image should
-        be in RGB mode and a size equal to the display size.
+        be in RGB mode and a size equal to the display size. Pillow images are
+        converted in a single pass straight into the display buffers. Set ``dither``
+        to ``FLOYD_STEINBERG``, ``ATKINSON`` or ``BAYER`` from ``adafruit_epd.dither``
+        to dither the image down to the display colors first.
         """
         imwidth, imheight = image.size
         if imwidth != self.width or imheight != self.height:
@@ -403,10 +1309,17 @@ class Adafruit_EPD:
             )
         if self.sram:
             raise RuntimeError("PIL image is not for use with SRAM assist")
-        # Grab all the pixels from the image, faster than getpixel.
-        pix = image.load()
+        if dither:
+            image = dither_image(image, self._dither_palette(), dither)
+        if image.mode not in {"RGB", "L"}:
+            raise ValueError("Image must be in mode RGB or mode L.")
         # clear out any display buffers
         self.fill(Adafruit_EPD.WHITE)
+        if self._image_planes(image):
+            return
+
+        # Grab all the pixels from the image, faster than getpixel.
+        pix = image.load()
 
         if image.mode == "RGB":  # RGB Mode
             for y in range(image.size[1]):
@@ -424,5 +1337,190 @@ class Adafruit_EPD:
                     pixel = pix[x, y]
                     if pixel < 0x80:
                         self.pixel(x, y, Adafruit_EPD.BLACK)
+
+    def _dither_palette(self) -> List[tuple]:
+        """The RGB colors image() maps onto each display color, for dithering"""
+        palette = [(0xFF, 0xFF, 0xFF), (0x00, 0x00, 0x00)]
+        if self._colorframebuf is not self._blackframebuf:
+            palette.append((0xFF, 0x00, 0x00))
+        return palette
+
+    def _plane_bits(self) -> List:
+        """Pair each framebuffer plane with the bit pixel() and fill() would leave
+        in it for white, red and dark pixels"""
+        if self._colorframebuf is self._blackframebuf:  # monochrome
+            return [
+                (
+                    self._blackframebuf,
+                    (self._color_inverted, not self._black_inverted, not self._black_inverted),
+                )
+            ]
+        return [
+            (
+                self._blackframebuf,
+                (self._black_inverted, self._black_inverted, not self._black_inverted),
+            ),
+            (
+                self._colorframebuf,
+                (self._color_inverted, not self._color_inverted, self._color_inverted),
+            ),
+        ]
+
+    def _image_planes(self, image: Image) -> bool:
+        """Classify a whole Pillow image at once and pack it straight into the
+        MHMSB buffers. Returns False if the image or buffers don't allow it, so
+        the caller can fall back to drawing pixel by pixel."""
+        planes = [self._blackframebuf]
+        if self._colorframebuf is not self._blackframebuf:
+            planes.append(self._colorframebuf)
+        for framebuf in planes:
+            if (
+                not isinstance(framebuf.format, adafruit_framebuf.MHMSBFormat)
+                or framebuf.stride % 8
+                or not isinstance(framebuf.buf, bytearray)
+                or len(framebuf.buf) < framebuf.stride // 8 * framebuf.height
+            ):
+                return False
+        if not hasattr(image, "point") or not hasattr(image, "tobytes"):
+            return False
+
+        # Map every pixel to a key: 0 for white, _IMAGE_RED or _IMAGE_DARK.
+        if image.mode == "RGB":
+            # one bit per channel below 0x80, then r + 2 * g + 4 * b
+            low = [int(v < 0x80) for v in range(256)]
+            keys = image.point(low + [v * 2 for v in low] + [v * 4 for v in low])
+            keys = keys.convert("L", (1, 1, 1, 0))
         else:
-            raise ValueError("Image must be in mode RGB or mode L.")
+            keys = image.point([_IMAGE_DARK * (v < 0x80) for v in range(256)])
+        if self.rotation:
+            keys = keys.rotate(-90 * self.rotation, expand=True)
+        framebuf = self._blackframebuf
+        # padding columns fall outside the image and crop to 0, i.e. white
+        keys = keys.crop((0, 0, framebuf.stride, framebuf.height))
+
+        for framebuf, (white, red, dark) in self._plane_bits():
+            table = [white * 0xFF] * 256
+            table[_IMAGE_RED] = red * 0xFF
+            table[_IMAGE_DARK] = dark * 0xFF
+            data = keys.point(table, "1").tobytes()
+            framebuf.buf[: len(data)] = data
+        return True
+
+    def load_bmp(self, source: Union[str, BinaryIO]) -> None:
+        """Load an uncompressed 1, 4, 8 or 24 bit BMP, given a file path or a binary
+        stream, the same size as the display. Rows are read one at a time and packed
+        straight into the display buffers (or written to SRAM), so memory use does
+        not grow with the panel size. Colors are mapped the same way as image()."""
+        stream = open(source, "rb") if isinstance(source, str) else source
+        try:
+            self._read_bmp(stream)
+        finally:
+            if stream is not source:
+                stream.close()
+
+    def _read_bmp(self, stream: BinaryIO) -> None:  # noqa: PLR0914
+        header = stream.read(54)
+        if len(header) < 54 or header[:2] != b"BM":
+            raise ValueError("Not a BMP file")
+        offset, header_size = struct.unpack_from("<II", header, 10)
+        width, height, planes, depth, compression = struct.unpack_from("<iiHHI", header, 18)
+        if header_size < 40 or planes != 1 or depth not in {1, 4, 8, 24}:
+            raise ValueError("BMP must be 1, 4, 8 or 24 bit.")
+        if compression:
+            raise ValueError("Compressed BMP files are not supported.")
+        if width != self.width or abs(height) != self.height:
+            raise ValueError(
+                f"BMP must be same dimensions as display ({self.width}x{self.height})."
+            )
+
+        palette = None
+        if depth <= 8:
+            count = struct.unpack_from("<I", header, 46)[0] or 1 << depth
+            stream.seek(14 + header_size)
+            entries = stream.read(4 * count)
+            if len(entries) < 4 * count:
+                raise ValueError("Truncated BMP")
+            palette = bytearray(
+                self._bmp_color(entries[i + 2], entries[i + 1], entries[i])
+                for i in range(0, len(entries), 4)
+            )
+            palette.extend(bytearray([Adafruit_EPD.WHITE] * ((1 << depth) - len(palette))))
+        stream.seek(offset)
+
+        self.fill(Adafruit_EPD.WHITE)
+        write_row = self._bmp_row_writer()
+        row = bytearray((width * depth + 31) // 32 * 4)
+        colors = bytearray(width)
+        cache = {}
+        mask = (1 << depth) - 1
+        for i in range(height if height > 0 else -height):
+            if stream.readinto(row) != len(row):
+                raise ValueError("Truncated BMP")
+            if palette is None:
+                for x in range(width):
+                    key = row[3 * x] | row[3 * x + 1] << 8 | row[3 * x + 2] << 16
+                    color = cache.get(key)
+                    if color is None:
+                        if len(cache) >= _BMP_CACHE_SIZE:
+                            cache.clear()
+                        color = cache[key] = self._bmp_color(key >> 16, key >> 8 & 0xFF, key & 0xFF)
+                    colors[x] = color
+            else:
+                for x in range(width):
+                    bit = x * depth
+                    colors[x] = palette[row[bit >> 3] >> (8 - depth - (bit & 7)) & mask]
+            # rows are stored bottom up unless the height is negative
+            write_row(height - 1 - i if height > 0 else i, colors)
+
+    def _bmp_color(self, r: int, g: int, b: int) -> int:  # noqa: PLR6301
+        """The display color image() would draw for an RGB value"""
+        if b < 0x80 and g < 0x80:
+            return Adafruit_EPD.RED if r >= 0x80 else Adafruit_EPD.BLACK
+        return Adafruit_EPD.WHITE
+
+    def _bmp_row_writer(self) -> Callable:
+        """Return a function that stores one row of display colors. Unrotated MHMSB
+        planes get packed bytes, anything else is drawn pixel by pixel"""
+        planes = self._plane_bits()
+        for framebuf, _ in planes:
+            if (
+                self.rotation
+                or not isinstance(framebuf.format, adafruit_framebuf.MHMSBFormat)
+                or framebuf.stride % 8
+            ):
+                return self._bmp_pixel_row
+
+        stride = planes[0][0].stride // 8
+        width = self._width
+        packed = bytearray(stride)
+        tables = []
+        for framebuf, (white, red, dark) in planes:
+            bits = bytearray(4)
+            bits[Adafruit_EPD.WHITE] = white
+            bits[Adafruit_EPD.RED] = red
+            bits[Adafruit_EPD.BLACK] = dark
+            base = 0 if framebuf.buf is self._buffer1 else self._buffer1_size
+            tables.append((framebuf.buf, base, bits, white * 0xFF))
+
+        def write_row(y, colors):
+            for buf, base, bits, padding in tables:
+                for x in range((width + 7) & ~7, stride * 8, 8):
+                    packed[x >> 3] = padding
+                for x in range(0, width, 8):
+                    value = 0
+                    for color in colors[x : x + 8]:
+                        value = value << 1 | bits[color]
+                    if x + 8 > width:  # keep the white padding bits
+                        value = value << (x + 8 - width) | padding >> (width - x)
+                    packed[x >> 3] = value
+                if self.sram:
+                    self.sram.write(base + y * stride, packed)
+                else:
+                    buf[y * stride : (y + 1) * stride] = packed
+
+        return write_row
+
+    def _bmp_pixel_row(self, y: int, colors: bytearray) -> None:
+        for x, color in enumerate(colors):
+            if color != Adafruit_EPD.WHITE:
+                self.pixel(x, y, color)
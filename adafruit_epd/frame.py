@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.frame` - Adafruit EPD - pre-packed frame files
+====================================================================================
+A small file format holding display buffers exactly as they are sent to the panel,
+so frames rendered once can be shown again without converting them
+* Author(s): Adafruit Industries
+
+File layout, all values little endian:
+
+* 4 bytes ``EPDF`` magic, then version, flags and plane count as single bytes and a
+  reserved byte
+* panel width and height (native, unrotated) as 16 bit values
+* driver family, the driver class name as 16 bytes of NUL padded ASCII
+* raw size of each of the two planes, then the number of bytes stored for each, as
+  32 bit values
+* the stored plane data, one plane after the other. With ``FLAG_RLE`` set each plane
+  is PackBits run length encoded.
+"""
+
+import struct
+
+from micropython import const
+
+try:
+    """Needed for type annotations"""
+    from typing import BinaryIO, Iterator, Tuple
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+MAGIC = b"EPDF"
+VERSION = const(1)
+
+FLAG_RLE = const(0x01)
+FLAG_BLACK_INVERTED = const(0x02)
+FLAG_COLOR_INVERTED = const(0x04)
+
+_HEADER = "<4sBBBBHH16sIIII"
+HEADER_SIZE = struct.calcsize(_HEADER)
+
+
+def pack_header(
+    family: str, width: int, height: int, flags: int, sizes: Tuple, stored: Tuple
+) -> bytes:
+    """Build a frame file header"""
+    planes = 2 if sizes[1] else 1
+    return struct.pack(
+        _HEADER,
+        MAGIC,
+        VERSION,
+        flags,
+        planes,
+        0,
+        width,
+        height,
+        family.encode()[:16],
+        sizes[0],
+        sizes[1],
+        stored[0],
+        stored[1],
+    )
+
+
+def read_header(stream: BinaryIO) -> Tuple:
+    """Read a frame file header, returning (family, width, height, flags, sizes,
+    stored)"""
+    header = stream.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError("Not a frame file")
+    magic, version, flags, _, _, width, height, family, size1, size2, stored1, stored2 = (
+        struct.unpack(_HEADER, header)
+    )
+    if magic != MAGIC:
+        raise ValueError("Not a frame file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported frame file version {version}")
+    family = family.rstrip(b"\0").decode()
+    return family, width, height, flags, (size1, size2), (stored1, stored2)
+
+
+def rle_encode(data: bytearray, start: int = 0, end: int = None) -> bytearray:
+    """PackBits encode ``data[start:end]``: a control byte n below 128 is followed by
+    n + 1 literal bytes, n above 128 means repeat the next byte 257 - n times"""
+    if end is None:
+        end = len(data)
+    out = bytearray()
+    i = start
+    while i < end:
+        value = data[i]
+        run = 1
+        while run < 128 and i + run < end and data[i + run] == value:
+            run += 1
+        if run > 1:
+            out.append(257 - run)
+            out.append(value)
+            i += run
+            continue
+        # literal bytes, up to the start of the next run of three
+        j = i + 1
+        while j < end and j - i < 128:
+            if j + 2 < end and data[j] == data[j + 1] == data[j + 2]:
+                break
+            j += 1
+        out.append(j - i - 1)
+        out.extend(data[i:j])
+        i = j
+    return out
+
+
+def read_plane(stream: BinaryIO, stored: int, rle: bool, chunk: bytearray) -> Iterator[int]:
+    """Read one stored plane, decoding it into ``chunk`` a piece at a time. Yields the
+    number of valid bytes in ``chunk`` each time it fills, and once more at the end"""
+    if not rle:
+        view = memoryview(chunk)
+        while stored:
+            count = stream.readinto(view[: min(stored, len(chunk))])
+            if not count:
+                raise ValueError("Frame file is truncated")
+            stored -= count
+            yield count
+        return
+
+    size = len(chunk)
+    block = bytearray(min(stored, size) or 1)
+    filled = 0
+    count = 0  # bytes left in the current literal or run
+    run = False
+    while stored:
+        got = stream.readinto(memoryview(block)[: min(stored, len(block))])
+        if not got:
+            raise ValueError("Frame file is truncated")
+        stored -= got
+        for value in block[:got]:
+            if not count:
+                if value < 128:
+                    count, run = value + 1, False
+                elif value > 128:
+                    count, run = 257 - value, True
+                continue
+            if run:
+                while count:
+                    length = min(count, size - filled)
+                    chunk[filled : filled + length] = bytes((value,)) * length
+                    filled += length
+                    count -= length
+                    if filled == size:
+                        yield filled
+                        filled = 0
+                continue
+            chunk[filled] = value
+            filled += 1
+            count -= 1
+            if filled == size:
+                yield filled
+                filled = 0
+    if filled:
+        yield filled
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.glyphs` - Adafruit EPD - cached text rendering
+====================================================================================
+Draws text from the binary font files ``adafruit_framebuf`` uses straight into packed
+display buffers, keeping recently used glyphs ready to write
+* Author(s): Adafruit Industries
+"""
+
+import struct
+from collections import OrderedDict
+
+from micropython import const
+
+try:
+    """Needed for type annotations"""
+    from typing import Any, Callable, Iterator, Tuple
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+# Glyphs kept per font, the least recently used is dropped first
+_GLYPH_CACHE_SIZE = const(128)
+
+_fonts = {}
+
+
+def get_font(font_name: str) -> "GlyphFont":
+    """Return the shared GlyphFont for a font file, opening it the first time"""
+    font = _fonts.get(font_name)
+    if font is None:
+        font = _fonts[font_name] = GlyphFont(font_name)
+    return font
+
+
+class GlyphFont:
+    """A font file in the ``adafruit_framebuf`` format: a width and height byte, then
+    one byte per column of each of the 256 characters with bit 0 at the top.
+
+    Glyphs are rasterized once per character, size and buffer orientation, as one
+    bit mask per line of pixels running along a buffer row, and kept in a bounded
+    least recently used cache."""
+
+    def __init__(self, font_name: str) -> None:
+        self.font_name = font_name
+        self._file = open(font_name, "rb")
+        self.font_width, self.font_height = struct.unpack("BB", self._file.read(2))
+        self._glyphs = OrderedDict()
+
+    def deinit(self) -> None:
+        """Close the font file"""
+        self._file.close()
+
+    def _columns(self, char: str) -> bytes:
+        self._file.seek(2 + ord(char) * self.font_width)
+        columns = self._file.read(self.font_width)
+        # characters past the end of the font are drawn blank
+        return columns + bytes(self.font_width - len(columns))
+
+    def pixels(self, char: str, size: int) -> Iterator[Tuple[int, int]]:
+        """Yield the (x, y) position of every set pixel of a glyph drawn at ``size``"""
+        for col, bits in enumerate(self._columns(char)):
+            for row in range(self.font_height):
+                if bits >> row & 1:
+                    for x in range(col * size, (col + 1) * size):
+                        for y in range(row * size, (row + 1) * size):
+                            yield x, y
+
+    def glyph(
+        self, char: str, size: int, transposed: bool, reverse: bool, bpp: int, align: int
+    ) -> tuple:
+        """The lines of a glyph drawn at ``size`` with ``bpp`` bits per pixel, starting
+        ``align`` bits into a byte. Each line is a tuple of (byte offset, mask) pairs
+        for the bytes it touches. Lines are the glyph rows, or its columns when
+        ``transposed``, with the pixels in reverse order when ``reverse``"""
+        key = (char, size, transposed, reverse, bpp, align)
+        glyphs = self._glyphs
+        lines = glyphs.pop(key, None)
+        if lines is None:
+            lines = self._render(char, size, transposed, reverse, bpp, align)
+            if len(glyphs) >= _GLYPH_CACHE_SIZE:
+                glyphs.pop(next(iter(glyphs)))
+        glyphs[key] = lines
+        return lines
+
+    def _render(self, char, size, transposed, reverse, bpp, align):
+        columns = self._columns(char)
+        width = self.font_width * size
+        height = self.font_height * size
+        ones = (1 << bpp) - 1
+        outer, inner = (width, height) if transposed else (height, width)
+        order = range(inner - 1, -1, -1) if reverse else range(inner)
+        length = (align + inner * bpp + 7) // 8
+        lines = []
+        for line in range(outer):
+            mask = 0
+            for pos in order:
+                if transposed:
+                    bit = columns[line // size] >> (pos // size) & 1
+                else:
+                    bit = columns[pos // size] >> (line // size) & 1
+                mask = mask << bpp | ones * bit
+            mask <<= length * 8 - align - inner * bpp
+            data = mask.to_bytes(length, "big")
+            lines.append(tuple((offset, byte) for offset, byte in enumerate(data) if byte))
+        return tuple(lines)
+
+
+def framebuf_index(framebuf: Any) -> Callable[[int, int], int]:
+    """Return an ``index(x, y)`` function giving the pixel position in the buffer of
+    an ``adafruit_framebuf.FrameBuffer`` for rotated coordinates, as its pixel()
+    method maps them"""
+    width = framebuf.width
+    height = framebuf.height
+    stride = framebuf.stride
+    rotation = framebuf.rotation
+
+    def index(x, y):
+        if rotation == 1:
+            x, y = width - y - 1, x
+        elif rotation == 2:
+            x, y = width - x - 1, height - y - 1
+        elif rotation == 3:
+            x, y = y, height - x - 1
+        return x + y * stride
+
+    return index
+
+
+def draw_text(  # noqa: PLR0914
+    buf: Any,
+    length: int,
+    index: Callable[[int, int], int],
+    bounds: Tuple[int, int],
+    string: str,
+    x: int,
+    y: int,
+    value: int,
+    *,
+    font: GlyphFont,
+    size: int,
+    bpp: int,
+    pixel: Callable,
+) -> None:
+    """Draw text into a packed buffer of ``length`` bytes holding ``bpp`` bits per pixel,
+    MSB first, breaking on \\n to the next line like ``adafruit_framebuf``. ``index``
+    gives buffer pixel positions for the rotated coordinates, which are ``bounds``
+    in size, and buffer rows must start on byte boundaries. Glyph bytes are masked
+    into the buffer with ``value``, glyphs only partly on screen are drawn with
+    ``pixel(x, y, value)``"""
+    size = max(size, 1)
+    frame_width, frame_height = bounds
+    width = font.font_width * size
+    height = font.font_height * size
+    total = length * 8 // bpp
+    pattern = (0x00, 0x55, 0xAA, 0xFF)[value] if bpp == 2 else 0xFF * value
+    for chunk in string.split("\n"):
+        for i, char in enumerate(chunk):
+            char_x = x + i * (font.font_width + 1) * size
+            if char_x + width <= 0 or char_x >= frame_width or y + height <= 0 or y >= frame_height:
+                continue
+            base = index(char_x, y)
+            step_x = index(char_x + 1, y) - base
+            step_y = index(char_x, y + 1) - base
+            transposed = step_x not in {1, -1}
+            if transposed:
+                count, lines, step, line_step = height, width, step_y, step_x
+            else:
+                count, lines, step, line_step = width, height, step_x, step_y
+            if step < 0:
+                base -= count - 1
+            low = base + min(0, (lines - 1) * line_step)
+            high = base + max(0, (lines - 1) * line_step) + count
+            if (
+                char_x < 0
+                or y < 0
+                or char_x + width > frame_width
+                or y + height > frame_height
+                or low < 0
+                or high > total
+            ):
+                for gx, gy in font.pixels(char, size):
+                    pixel(char_x + gx, y + gy, value)
+                continue
+            address = base * bpp
+            glyph = font.glyph(char, size, transposed, step < 0, bpp, address & 7)
+            address >>= 3
+            line_bytes = line_step * bpp // 8
+            for line in glyph:
+                for offset, mask in line:
+                    buf[address + offset] = buf[address + offset] & ~mask | mask & pattern
+                address += line_bytes
+        y += height
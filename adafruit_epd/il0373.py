@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -55,10 +56,44 @@ _IL0373_CDI = const(0x50)
 _IL0373_RESOLUTION = const(0x61)
 _IL0373_VCM_DC_SETTING = const(0x82)
 
+# Start of power_up(), from the hardware reset on
+_POWER_ON_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.BUSY_WAIT,
+    commands.command(_IL0373_POWER_SETTING, b"\x03\x00\x2b\x2b\x09"),
+    commands.command(_IL0373_BOOSTER_SOFT_START, b"\x17\x17\x17"),
+    commands.command(_IL0373_POWER_ON),
+    commands.BUSY_WAIT,
+    commands.delay(200),
+    commands.command(_IL0373_PANEL_SETTING, b"\xcf"),
+    commands.command(_IL0373_CDI, b"\x37"),
+    commands.command(_IL0373_PLL, b"\x29"),
+)
+# Adafruit_IL0373_213_Flex_Mono's power up
+_FLEX_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.BUSY_WAIT,
+    commands.command(_IL0373_BOOSTER_SOFT_START, b"\x17\x17\x17"),
+    commands.command(_IL0373_POWER_ON),
+    commands.BUSY_WAIT,
+    commands.delay(200),
+    commands.command(_IL0373_PANEL_SETTING, b"\x1f\x0d"),
+    commands.command(_IL0373_CDI, b"\x97"),
+)
+_POWER_DOWN_CODE = commands.compile_commands(
+    commands.command(_IL0373_CDI, b"\x17"),
+    commands.command(_IL0373_VCM_DC_SETTING, b"\x00"),
+    commands.command(_IL0373_POWER_OFF),
+)
+
 
 class Adafruit_IL0373(Adafruit_EPD):
     """driver class for Adafruit IL0373 ePaper display breakouts"""
 
+    _refresh_settle = 0.1
+    _refresh_delay = 15
+    _max_baudrate = 10000000
+
     def __init__(
         self,
         width: int,
@@ -70,8 +105,11 @@ class Adafruit_IL0373(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         self._buffer1_size = int(width * height / 8)
         self._buffer2_size = int(width * height / 8)
@@ -100,48 +138,25 @@ class Adafruit_IL0373(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while not self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-
-        self.command(_IL0373_POWER_SETTING, bytearray([0x03, 0x00, 0x2B, 0x2B, 0x09]))
-        self.command(_IL0373_BOOSTER_SOFT_START, bytearray([0x17, 0x17, 0x17]))
-        self.command(_IL0373_POWER_ON)
-        self.busy_wait()
-        time.sleep(0.2)
-        self.command(_IL0373_PANEL_SETTING, bytearray([0xCF]))
-        self.command(_IL0373_CDI, bytearray([0x37]))
-        self.command(_IL0373_PLL, bytearray([0x29]))
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
         _b1 = self._width & 0xFF
         _b2 = (self._height >> 8) & 0xFF
         _b3 = self._height & 0xFF
-        self.command(_IL0373_RESOLUTION, bytearray([_b1, _b2, _b3]))
-        self.command(_IL0373_VCM_DC_SETTING, bytearray([0x0A]))
-        time.sleep(0.05)
+        return commands.compile_commands(
+            _POWER_ON_CODE,
+            commands.command(_IL0373_RESOLUTION, bytes([_b1, _b2, _b3])),
+            commands.command(_IL0373_VCM_DC_SETTING, b"\x0a"),
+            commands.delay(50),
+        )
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_IL0373_CDI, bytearray([0x17]))
-        self.command(_IL0373_VCM_DC_SETTING, bytearray([0x00]))
-        self.command(_IL0373_POWER_OFF)
+        self._send_command_list(_POWER_DOWN_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
         self.command(_IL0373_DISPLAY_REFRESH)
-        time.sleep(0.1)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(15)  # wait 15 seconds
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -173,6 +188,7 @@ class Adafruit_IL0373_213_Flex_Mono(Adafruit_IL0373):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
         super().__init__(
             width,
@@ -183,21 +199,12 @@ class Adafruit_IL0373_213_Flex_Mono(Adafruit_IL0373):
             sramcs_pin=sramcs_pin,
             rst_pin=rst_pin,
             busy_pin=busy_pin,
+            baudrate=baudrate,
         )
 
         self.set_black_buffer(1, True)
         self.set_color_buffer(0, True)
 
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-
-        self.command(_IL0373_BOOSTER_SOFT_START, bytearray([0x17, 0x17, 0x17]))
-        self.command(_IL0373_POWER_ON)
-
-        self.busy_wait()
-        time.sleep(0.2)
-
-        self.command(_IL0373_PANEL_SETTING, bytearray([0x1F, 0x0D]))
-        self.command(_IL0373_CDI, bytearray([0x97]))
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The command list power_up() sends"""
+        return _FLEX_POWER_UP_CODE
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -55,6 +56,37 @@ _IL91874_CDI = const(0x50)
 _IL91874_RESOLUTION = const(0x61)
 _IL91874_VCM_DC_SETTING = const(0x82)
 
+# Start of power_up(), from the hardware reset on
+_POWER_ON_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.delay(200),
+    commands.command(_IL91874_POWER_ON),
+    commands.BUSY_WAIT,
+    commands.command(_IL91874_PANEL_SETTING, b"\xaf"),
+    commands.command(_IL91874_PLL, b"\x3a"),
+    commands.command(_IL91874_POWER_SETTING, b"\x03\x00\x2b\x2b\x09"),
+    commands.command(_IL91874_BOOSTER_SOFT_START, b"\x07\x07\x17"),
+    commands.command(0xF8, b"\x60\xa5"),  # mystery command in example code
+    commands.command(0xF8, b"\x89\xa5"),  # mystery command in example code
+    commands.command(0xF8, b"\x90\x00"),  # mystery command in example code
+    commands.command(0xF8, b"\x93\xa2"),  # mystery command in example code
+    commands.command(0xF8, b"\x73\x41"),  # mystery command in example code
+    commands.command(_IL91874_VCM_DC_SETTING, b"\x12"),
+    commands.command(_IL91874_CDI, b"\x87"),
+    # Look Up Tables. command() never sent bytes data, so these have always gone
+    # out without the _LUT_* values and the panel keeps its OTP waveforms
+    commands.command(_IL91874_LUT1),
+    commands.command(_IL91874_LUTWW),
+    commands.command(_IL91874_LUTBW),
+    commands.command(_IL91874_LUTWB),
+    commands.command(_IL91874_LUTBB),
+)
+_POWER_OFF_CODE = commands.compile_commands(
+    commands.command(_IL91874_POWER_OFF, b"\x17"),
+    commands.BUSY_WAIT,
+)
+_DEEP_SLEEP_CODE = commands.command(_IL91874_DEEP_SLEEP, b"\xa5")
+
 _LUT_VCOMDC = b"\x00\x00\x00\x1a\x1a\x00\x00\x01\x00\n\n\x00\x00\x08\x00\x0e\x01\x0e\x01\x10\x00\n\n\x00\x00\x08\x00\x04\x10\x00\x00\x05\x00\x03\x0e\x00\x00\n\x00#\x00\x00\x00\x01"  # noqa: E501
 _LUT_WW = b"\x90\x1a\x1a\x00\x00\x01@\n\n\x00\x00\x08\x84\x0e\x01\x0e\x01\x10\x80\n\n\x00\x00\x08\x00\x04\x10\x00\x00\x05\x00\x03\x0e\x00\x00\n\x00#\x00\x00\x00\x01"  # noqa: E501
 _LUT_BW = b"\xa0\x1a\x1a\x00\x00\x01\x00\n\n\x00\x00\x08\x84\x0e\x01\x0e\x01\x10\x90\n\n\x00\x00\x08\xb0\x04\x10\x00\x00\x05\xb0\x03\x0e\x00\x00\n\xc0#\x00\x00\x00\x01"  # noqa: E501
@@ -65,6 +97,9 @@ _LUT_WB = b"\x90\x1a\x1a\x00\x00\x01 \n\n\x00\x00\x08\x84\x0e\x01\x0e\x01\x10\x1
 class Adafruit_IL91874(Adafruit_EPD):
     """driver class for Adafruit IL91874 ePaper display breakouts"""
 
+    _refresh_delay = 16
+    _max_baudrate = 4000000
+
     def __init__(
         self,
         width: int,
@@ -76,8 +111,11 @@ class Adafruit_IL91874(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         self._buffer1_size = int(width * height / 8)
         self._buffer2_size = int(width * height / 8)
@@ -99,6 +137,8 @@ class Adafruit_IL91874(Adafruit_EPD):
         self.set_black_buffer(0, True)
         self.set_color_buffer(1, False)
         self._single_byte_tx = True
+        # RAM writes stay TX_BYTE: no sibling chipset streams RAM with CS held to go
+        # by. Set ram_transfer_mode to try bursts
 
     def begin(self, reset: bool = True) -> None:
         """Begin communication with the display and set basic settings"""
@@ -107,64 +147,28 @@ class Adafruit_IL91874(Adafruit_EPD):
 
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while not self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        time.sleep(0.2)
-        self.command(_IL91874_POWER_ON)
-        self.busy_wait()
-
-        self.command(_IL91874_PANEL_SETTING, bytearray([0xAF]))
-        self.command(_IL91874_PLL, bytearray([0x3A]))
-        self.command(_IL91874_POWER_SETTING, bytearray([0x03, 0x00, 0x2B, 0x2B, 0x09]))
-        self.command(_IL91874_BOOSTER_SOFT_START, bytearray([0x07, 0x07, 0x17]))
-
-        self.command(0xF8, bytearray([0x60, 0xA5]))  # mystery command in example code
-        self.command(0xF8, bytearray([0x89, 0xA5]))  # mystery command in example code
-        self.command(0xF8, bytearray([0x90, 0x00]))  # mystery command in example code
-        self.command(0xF8, bytearray([0x93, 0xA2]))  # mystery command in example code
-        self.command(0xF8, bytearray([0x73, 0x41]))  # mystery command in example code
-
-        self.command(_IL91874_VCM_DC_SETTING, bytearray([0x12]))
-        self.command(_IL91874_CDI, bytearray([0x87]))
-
-        # Look Up Tables
-        self.command(_IL91874_LUT1, _LUT_VCOMDC)
-        self.command(_IL91874_LUTWW, _LUT_WW)
-        self.command(_IL91874_LUTBW, _LUT_BW)
-        self.command(_IL91874_LUTWB, _LUT_WB)
-        self.command(_IL91874_LUTBB, _LUT_BB)
-
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
         _b0 = (self._width >> 8) & 0xFF
         _b1 = self._width & 0xFF
         _b2 = (self._height >> 8) & 0xFF
         _b3 = self._height & 0xFF
-        self.command(_IL91874_RESOLUTION, bytearray([_b0, _b1, _b2, _b3]))
-        self.command(_IL91874_PDRF, bytearray([0x00]))
+        return commands.compile_commands(
+            _POWER_ON_CODE,
+            commands.command(_IL91874_RESOLUTION, bytes([_b0, _b1, _b2, _b3])),
+            commands.command(_IL91874_PDRF, b"\x00"),
+        )
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_IL91874_POWER_OFF, bytearray([0x17]))
-        self.busy_wait()
+        self._send_command_list(_POWER_OFF_CODE)
 
         if self._rst:  # Only deep sleep if we can get out of it
-            self.command(_IL91874_DEEP_SLEEP, bytearray([0xA5]))
+            self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
         self.command(_IL91874_DISPLAY_REFRESH)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(16)  # wait 16 seconds
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
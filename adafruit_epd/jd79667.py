@@ -11,17 +11,15 @@ CircuitPython driver for Adafruit JD79667 quad-color display breakouts
 
 import time
 
-import adafruit_framebuf
 from micropython import const
 
-from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd import commands, quad_color
 
 try:
     """Needed for type annotations"""
-    import typing
+    from typing import Optional
 
     from busio import SPI
-    from circuitpython_typing.pil import Image
     from digitalio import DigitalInOut
     from typing_extensions import Literal
 
@@ -44,12 +42,6 @@ _JD79667_PLL_CONTROL = const(0x30)
 _JD79667_CDI = const(0x50)
 _JD79667_RESOLUTION = const(0x61)
 
-# Color constants for internal use (2-bit values)
-_JD79667_BLACK = const(0b00)
-_JD79667_WHITE = const(0b01)
-_JD79667_YELLOW = const(0b10)
-_JD79667_RED = const(0b11)
-
 # Other command constants from init sequence
 _JD79667_POFS = const(0x03)
 _JD79667_TCON = const(0x60)
@@ -60,14 +52,45 @@ _JD79667_CMD_B5 = const(0xB5)
 _JD79667_CMD_E9 = const(0xE9)
 _JD79667_CMD_4D = const(0x4D)
 
-
-class Adafruit_JD79667(Adafruit_EPD):
+# Sent by power_up(), from the hardware reset on
+_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.BUSY_WAIT,
+    commands.delay(10),
+    commands.command(_JD79667_CMD_4D, b"\x78"),
+    commands.command(_JD79667_PANEL_SETTING, b"\x0f\x29"),  # Display resolution is 180x384
+    commands.command(_JD79667_POWER_SETTING, b"\x07\x00"),  # PWR
+    commands.command(_JD79667_POFS, b"\x10\x54\x44"),  # POFS
+    commands.command(_JD79667_BOOSTER_SOFTSTART, b"\x05\x00\x3f\x0a\x25\x12\x1a"),
+    commands.command(_JD79667_CDI, b"\x37"),  # CDI
+    commands.command(_JD79667_TCON, b"\x02\x02"),  # TCON
+    commands.command(_JD79667_RESOLUTION, b"\x00\xb4\x01\x80"),  # 180x384
+    commands.command(_JD79667_CMD_E7, b"\x1c"),
+    commands.command(_JD79667_CMD_E3, b"\x22"),
+    commands.command(_JD79667_CMD_B4, b"\xd0"),
+    commands.command(_JD79667_CMD_B5, b"\x03"),
+    commands.command(_JD79667_CMD_E9, b"\x01"),
+    commands.command(_JD79667_PLL_CONTROL, b"\x08"),
+    commands.command(_JD79667_POWER_ON),
+    commands.BUSY_WAIT,
+)
+_REFRESH_CODE = commands.command(_JD79667_DISPLAY_REFRESH, b"\x00")
+
+_POWER_DOWN_CODE = commands.compile_commands(
+    commands.command(_JD79667_POWER_OFF, b"\x00"),
+    commands.BUSY_WAIT,
+    commands.delay(100),
+    commands.command(_JD79667_DEEP_SLEEP, b"\xa5"),
+)
+
+
+class Adafruit_JD79667(quad_color.Adafruit_QuadColorEPD):
     """Driver for the JD79667 quad-color ePaper display breakouts"""
 
-    BLACK = const(0)  # 0b00 in the display buffer
-    WHITE = const(1)  # 0b01 in the display buffer
-    YELLOW = const(2)  # 0b10 in the display buffer
-    RED = const(3)  # 0b11 in the display buffer
+    _refresh_delay = 1
+    _max_baudrate = 4000000
+    # VDD goes high at start, then reset low and out of reset again
+    _reset_sequence = ((True, 0.02), (False, 0.04), (True, 0.05))
 
     def __init__(
         self,
@@ -80,6 +103,7 @@ class Adafruit_JD79667(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: Optional[int] = None,
     ) -> None:
         """Initialize the JD79667 quad-color display driver.
 
@@ -96,7 +120,9 @@ class Adafruit_JD79667(Adafruit_EPD):
             rst_pin: Reset pin
             busy_pin: Busy status pin
         """
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         stride = width
         if stride % 8 != 0:
@@ -112,16 +138,24 @@ class Adafruit_JD79667(Adafruit_EPD):
             self._buffer1 = bytearray(self._buffer1_size)
             self._buffer2 = self._buffer1
 
-        self._framebuf1 = adafruit_framebuf.FrameBuffer(
+        # Pixels are addressed with rows padded to a multiple of 4
+        row = width
+        if row % 4 != 0:
+            row += 4 - (row % 4)
+        self._framebuf1 = quad_color.QuadColorFrameBuffer(
             self._buffer1,
             width,
             height,
-            stride=stride,
-            buf_format=adafruit_framebuf.MHMSB,
+            row,
+            size=self._buffer1_size,
+            offsets=(0, 2 * (row - width)),
+            erase=self.sram.erase if sramcs_pin else None,
         )
         self._framebuf2 = self._framebuf1
 
         self._single_byte_tx = True
+        # RAM writes stay TX_BYTE: unlike the SSD16xx and UC81xx chipsets, no JD796xx
+        # sibling streams RAM with CS held yet. Set ram_transfer_mode to try bursts
 
         self.set_black_buffer(0, False)
         self.set_color_buffer(0, False)
@@ -132,74 +166,20 @@ class Adafruit_JD79667(Adafruit_EPD):
         """Begin communication with the display and set basic settings"""
         if reset:
             self.hardware_reset()
-        time.sleep(0.1)
-
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task."""
-        if self._busy:
-            while not self._busy.value:  # Wait for busy HIGH
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def hardware_reset(self) -> None:
-        """Perform hardware reset sequence specific to JD79667"""
-        if self._rst:
-            # VDD goes high at start
-            self._rst.value = True
-            time.sleep(0.02)  # 20ms
-            # Bring reset low
-            self._rst.value = False
-            time.sleep(0.04)  # 40ms
-            # Bring out of reset
-            self._rst.value = True
-            time.sleep(0.05)  # 50ms
+        self._sleep(0.1)
 
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-
-        # Send initialization sequence
-        time.sleep(0.01)  # Wait 10ms
-
-        self.command(_JD79667_CMD_4D, bytearray([0x78]))
-        self.command(
-            _JD79667_PANEL_SETTING, bytearray([0x0F, 0x29])
-        )  # Display resolution is 180x384
-        self.command(_JD79667_POWER_SETTING, bytearray([0x07, 0x00]))
-        self.command(_JD79667_POFS, bytearray([0x10, 0x54, 0x44]))
-        self.command(
-            _JD79667_BOOSTER_SOFTSTART,
-            bytearray([0x05, 0x00, 0x3F, 0x0A, 0x25, 0x12, 0x1A]),
-        )
-        self.command(_JD79667_CDI, bytearray([0x37]))
-        self.command(_JD79667_TCON, bytearray([0x02, 0x02]))
-        self.command(_JD79667_RESOLUTION, bytearray([0, 180, 1, 128]))  # 180x384
-        self.command(_JD79667_CMD_E7, bytearray([0x1C]))
-        self.command(_JD79667_CMD_E3, bytearray([0x22]))
-        self.command(_JD79667_CMD_B4, bytearray([0xD0]))
-        self.command(_JD79667_CMD_B5, bytearray([0x03]))
-        self.command(_JD79667_CMD_E9, bytearray([0x01]))
-        self.command(_JD79667_PLL_CONTROL, bytearray([0x08]))
-        self.command(_JD79667_POWER_ON)
-
-        self.busy_wait()
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The command list power_up() sends"""
+        return _POWER_UP_CODE
 
     def power_down(self) -> None:
         """Power down the display"""
         if self._rst:
-            self.command(_JD79667_POWER_OFF, bytearray([0x00]))
-            self.busy_wait()
-            time.sleep(0.1)
-            self.command(_JD79667_DEEP_SLEEP, bytearray([0xA5]))
+            self._send_command_list(_POWER_DOWN_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_JD79667_DISPLAY_REFRESH, bytearray([0x00]))
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(1)  # Wait 1 second if no busy pin
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self._send_command_list(_REFRESH_CODE)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process."""
@@ -208,212 +188,3 @@ class Adafruit_JD79667(Adafruit_EPD):
     def set_ram_address(self, x: int, y: int) -> None:
         """Set the RAM address location."""
         pass
-
-    def fill(self, color: int) -> None:
-        """Fill the entire display with the specified color."""
-        # Map colors to fill patterns (4 pixels per byte)
-        color_map = {
-            Adafruit_JD79667.BLACK: 0x00,  # 0b00000000 - all pixels black
-            Adafruit_JD79667.WHITE: 0x55,  # 0b01010101 - all pixels white
-            Adafruit_JD79667.YELLOW: 0xAA,  # 0b10101010 - all pixels yellow
-            Adafruit_JD79667.RED: 0xFF,  # 0b11111111 - all pixels red
-        }
-
-        if color not in color_map:
-            raise ValueError(
-                f"Invalid color: {color}. Use BLACK (0), WHITE (1), YELLOW (2), or RED (3)."
-            )
-
-        fill_byte = color_map[color]
-
-        if self.sram:
-            self.sram.erase(0x00, self._buffer1_size, fill_byte)
-        else:
-            for i in range(self._buffer1_size):
-                self._buffer1[i] = fill_byte
-
-    def clear_buffer(self) -> None:
-        """Clear the display buffer to white"""
-        self.fill(Adafruit_JD79667.WHITE)
-
-    def pixel(self, x: int, y: int, color: int) -> None:
-        """Draw a single pixel in the display buffer."""
-        if (x < 0) or (x >= self.width) or (y < 0) or (y >= self.height):
-            return
-        stride = self._width
-        if stride % 4 != 0:
-            stride += 4 - (stride % 4)
-        if self.rotation == 1:
-            x, y = y, x
-            x = stride - x - 1
-            x -= stride - self._width
-        elif self.rotation == 2:
-            x = stride - x - 1
-            y = self._height - y - 1
-            x += stride - self._width
-        elif self.rotation == 3:
-            x, y = y, x
-            y = self._height - y - 1
-
-        color_map = {
-            Adafruit_JD79667.BLACK: _JD79667_BLACK,
-            Adafruit_JD79667.WHITE: _JD79667_WHITE,
-            Adafruit_JD79667.YELLOW: _JD79667_YELLOW,
-            Adafruit_JD79667.RED: _JD79667_RED,
-        }
-
-        if color not in color_map:
-            pixel_color = _JD79667_WHITE
-        else:
-            pixel_color = color_map[color]
-
-        addr = (x + y * stride) // 4
-        bit_offset = (3 - (x % 4)) * 2
-        byte_mask = 0x3 << bit_offset
-        byte_value = (pixel_color & 0x3) << bit_offset
-
-        if self.sram:
-            current = self.sram.read8(addr)
-            current &= ~byte_mask
-            current |= byte_value
-            self.sram.write8(addr, current)
-        else:
-            self._buffer1[addr] &= ~byte_mask
-            self._buffer1[addr] |= byte_value
-
-    def rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
-        """Draw a rectangle."""
-        for i in range(x, x + width):
-            self.pixel(i, y, color)
-            self.pixel(i, y + height - 1, color)
-        for j in range(y + 1, y + height - 1):
-            self.pixel(x, j, color)
-            self.pixel(x + width - 1, j, color)
-
-    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
-        """Fill a rectangle with the passed color."""
-        for i in range(x, x + width):
-            for j in range(y, y + height):
-                self.pixel(i, j, color)
-
-    def line(self, x_0: int, y_0: int, x_1: int, y_1: int, color: int) -> None:
-        """Draw a line from (x_0, y_0) to (x_1, y_1) in passed color."""
-        dx = abs(x_1 - x_0)
-        dy = abs(y_1 - y_0)
-        sx = 1 if x_0 < x_1 else -1
-        sy = 1 if y_0 < y_1 else -1
-        err = dx - dy
-
-        while True:
-            self.pixel(x_0, y_0, color)
-            if x_0 == x_1 and y_0 == y_1:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x_0 += sx
-            if e2 < dx:
-                err += dx
-                y_0 += sy
-
-    def text(
-        self,
-        string: str,
-        x: int,
-        y: int,
-        color: int,
-        *,
-        font_name: str = "font5x8.bin",
-        size: int = 1,
-    ) -> None:
-        """Write text string at location (x, y) in given color, using font file."""
-        color_map = {
-            Adafruit_JD79667.BLACK: _JD79667_BLACK,
-            Adafruit_JD79667.WHITE: _JD79667_WHITE,
-            Adafruit_JD79667.YELLOW: _JD79667_YELLOW,
-            Adafruit_JD79667.RED: _JD79667_RED,
-        }
-        if color not in color_map:
-            raise ValueError(
-                f"Invalid color: {color}. Use BLACK (0), WHITE (1), YELLOW (2), or RED (3)."
-            )
-
-        text_width = len(string) * 6 * size
-        text_height = 8 * size
-
-        text_width = min(text_width, self.width - x)
-        text_height = min(text_height, self.height - y)
-
-        if text_width <= 0 or text_height <= 0:
-            return
-
-        temp_buf_width = ((text_width + 7) // 8) * 8
-        temp_buf = bytearray((temp_buf_width * text_height) // 8)
-
-        temp_fb = adafruit_framebuf.FrameBuffer(
-            temp_buf, temp_buf_width, text_height, buf_format=adafruit_framebuf.MHMSB
-        )
-
-        temp_fb.fill(0)
-        temp_fb.text(string, 0, 0, 1, font_name=font_name, size=size)
-
-        for j in range(text_height):
-            for i in range(text_width):
-                byte_index = (j * temp_buf_width + i) // 8
-                bit_index = 7 - ((j * temp_buf_width + i) % 8)
-
-                if byte_index < len(temp_buf):
-                    if (temp_buf[byte_index] >> bit_index) & 1:
-                        self.pixel(x + i, y + j, color)
-
-    def image(self, image: Image) -> None:
-        """Set buffer to value of Python Imaging Library image."""
-        imwidth, imheight = image.size
-        if imwidth != self.width or imheight != self.height:
-            raise ValueError(
-                f"Image must be same dimensions as display ({self.width}x{self.height})."
-            )
-        if self.sram:
-            raise RuntimeError("PIL image is not for use with SRAM assist")
-        pix = image.load()
-        self.fill(Adafruit_JD79667.WHITE)
-
-        if image.mode == "RGB":  # RGB Mode
-            for y in range(image.size[1]):
-                for x in range(image.size[0]):
-                    pixel = pix[x, y]
-                    r, g, b = pixel[0], pixel[1], pixel[2]
-                    brightness = (r + g + b) / 3
-
-                    if brightness >= 200:
-                        pass
-                    elif r >= 128 and g >= 128 and b < 80:
-                        self.pixel(x, y, Adafruit_JD79667.YELLOW)
-                    elif r >= 128 and g < 80 and b < 80:
-                        self.pixel(x, y, Adafruit_JD79667.RED)
-                    elif brightness < 80:
-                        self.pixel(x, y, Adafruit_JD79667.BLACK)
-                    elif r > g and r > b and r >= 100:
-                        self.pixel(x, y, Adafruit_JD79667.RED)
-                    elif r >= 100 and g >= 100:
-                        self.pixel(x, y, Adafruit_JD79667.YELLOW)
-                    elif brightness < 128:
-                        self.pixel(x, y, Adafruit_JD79667.BLACK)
-
-        elif image.mode == "L":
-            for y in range(image.size[1]):
-                for x in range(image.size[0]):
-                    pixel = pix[x, y]
-                    if pixel < 64:
-                        self.pixel(x, y, Adafruit_JD79667.BLACK)
-                    elif pixel < 128:
-                        self.pixel(x, y, Adafruit_JD79667.RED)
-                    elif pixel < 192:
-                        self.pixel(x, y, Adafruit_JD79667.YELLOW)
-
-        elif image.mode == "P":  # Palette Mode
-            rgb_image = image.convert("RGB")
-            self.image(rgb_image)
-
-        else:
-            raise ValueError("Image must be in mode RGB, L, or P.")
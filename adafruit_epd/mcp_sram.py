@@ -14,7 +14,7 @@ from micropython import const
 
 try:
     """Needed for type annotations"""
-    from typing import Any, List
+    from typing import Any, Iterator, List, Optional, Tuple, Union
 
     from busio import SPI
     from digitalio import DigitalInOut
@@ -26,49 +26,229 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
 
 SRAM_SEQUENTIAL_MODE = const(1 << 6)
 
+# Bytes of fill pattern streamed per SPI write by erase() and fill_range_pattern()
+_FILL_BLOCK = const(256)
+
 
 class Adafruit_MCP_SRAM_View:
-    """An interface class that turns an SRAM chip into something like a memoryview"""
+    """An interface class that turns an SRAM chip into something like a memoryview.
+    Slices (without a step) read and write runs of bytes"""
 
     def __init__(self, sram: int, offset: int) -> None:
         self._sram = sram
         self._offset = offset
-        self._buf = [0]
 
-    def __getitem__(self, i: int) -> Any:
-        return self._sram.read(self._offset + i, 1)[0]
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            return self._sram.read(self._offset + i.start, i.stop - i.start)
+        return self._sram.read8(self._offset + i)
 
-    def __setitem__(self, i: int, val: Any) -> None:
-        self._buf[0] = val
-        self._sram.write(self._offset + i, self._buf)
+    def __setitem__(self, i: Union[int, slice], val: Any) -> None:
+        if isinstance(i, slice):
+            self._sram.write(self._offset + i.start, val)
+            return
+        self._sram.write8(self._offset + i, val)
 
 
 class Adafruit_MCP_SRAM:
     """supporting class for communicating with
-    Microchip SRAM chips"""
+    Microchip SRAM chips
+
+    Single byte accesses through :meth:`read8`, :meth:`write8` and views go
+    through a cache of SRAM pages mirrored in host RAM, so drawing on a
+    framebuffer only touches the bus when a page is loaded or written out.
+    Bulk writes and erases update the mirrored pages as they go to the chip,
+    and bulk reads of mirrored pages are served from host RAM.
+    """
 
     SRAM_READ = 0x03
     SRAM_WRITE = 0x02
     SRAM_RDSR = 0x05
     SRAM_WRSR = 0x01
 
-    def __init__(self, cs_pin: DigitalInOut, spi: SPI):
+    def __init__(  # noqa: PLR0913
+        self,
+        cs_pin: DigitalInOut,
+        spi: SPI,
+        *,
+        page_size: int = 64,
+        cache_pages: int = 8,
+        budget: Optional[int] = None,
+        write_through: bool = False,
+    ):
         # Handle hardware SPI
         self._spi = spi_device.SPIDevice(spi, cs_pin, baudrate=8000000)
         self.spi_device = spi
         self.cs_pin = cs_pin
         self._buf = bytearray(3)
+        self._fill_block = None
+        self._fill_pattern = None
         self._buf[0] = Adafruit_MCP_SRAM.SRAM_WRSR
         self._buf[1] = 0x43
         with self._spi as spidev:
             spidev.write(self._buf, end=2)
+        self.configure_cache(
+            page_size=page_size,
+            cache_pages=cache_pages,
+            budget=budget,
+            write_through=write_through,
+        )
+
+    @property
+    def baudrate(self) -> int:
+        """The SPI clock in Hz the SRAM is driven at"""
+        return self._spi.baudrate
+
+    def configure_cache(
+        self,
+        *,
+        page_size: int = 64,
+        cache_pages: int = 8,
+        budget: Optional[int] = None,
+        write_through: bool = False,
+    ) -> None:
+        """Set up the page cache, writing back anything dirty first. page_size must
+        be a power of two, set cache_pages to 0 to disable caching. budget is the
+        host RAM to give the cache in bytes and overrides cache_pages.
+
+        The cache is write-back by default: changed pages reach the chip when they
+        are evicted or flushed. With write_through, the bytes changed on a page are
+        written to the chip in one burst as soon as drawing moves to another page,
+        so evicting never costs a write and the chip is at most one page behind."""
+        if page_size < 1 or page_size & (page_size - 1):
+            raise ValueError("Page size must be a power of two")
+        if getattr(self, "_pages", None):
+            self.flush()
+        if budget is not None:
+            cache_pages = budget // page_size
+        self._page_shift = len(bin(page_size)) - 3
+        self._page_size = page_size
+        self._max_pages = cache_pages
+        self._write_through = write_through
+        self._pages = {}
+        self._dirty = set()
+        self._lru = []
+        self._last_index = self._last_page = None
+        # the page and byte range changed since the last write through burst
+        self._span = None
+        self.reset_cache_stats()
+
+    @property
+    def cache_stats(self) -> dict:
+        """Page cache counters since the last reset_cache_stats(): hits and misses
+        of single byte and bulk accesses, the hit rate, the writes made to put
+        cached changes on the chip, and the pages cached out of the budget"""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "writes": self._writes,
+            "pages": len(self._pages),
+            "max_pages": self._max_pages,
+            "budget": self._max_pages * self._page_size,
+        }
+
+    def reset_cache_stats(self) -> None:
+        """Zero the cache_stats counters"""
+        self._hits = self._misses = self._writes = 0
 
     def get_view(self, offset: int) -> Adafruit_MCP_SRAM_View:
         """Create an object that can be used as a memoryview, with a given offset"""
         return Adafruit_MCP_SRAM_View(self, offset)
 
-    def write(self, addr: int, buf: List, reg=SRAM_WRITE):
-        """write the passed buffer to the passed address"""
+    def _page(self, index: int) -> bytearray:
+        """Return the cached copy of a page, loading it and evicting the least
+        recently used page if needed"""
+        if index == self._last_index:
+            self._hits += 1
+            return self._last_page
+        if self._span is not None:
+            self._write_span()
+        page = self._pages.get(index)
+        if page is None:
+            self._misses += 1
+            if len(self._pages) >= self._max_pages:
+                self._evict(self._lru[0])
+            page = self._read(index << self._page_shift, self._page_size)
+            self._pages[index] = page
+        else:
+            self._hits += 1
+            self._lru.remove(index)
+        self._lru.append(index)
+        self._last_index = index
+        self._last_page = page
+        return page
+
+    def _evict(self, index: int) -> None:
+        """Drop a page from the cache, writing it back first if it is dirty"""
+        if self._span is not None and self._span[0] == index:
+            self._write_span()
+        if index in self._dirty:
+            self._write(index << self._page_shift, self._pages[index])
+            self._dirty.remove(index)
+            self._writes += 1
+        del self._pages[index]
+        self._lru.remove(index)
+        if index == self._last_index:
+            self._last_index = self._last_page = None
+
+    def _write_back(self, indices: List) -> None:
+        """Write back dirty pages, runs of consecutive pages share one
+        sequential mode transaction"""
+        i = 0
+        while i < len(indices):
+            j = i + 1
+            while j < len(indices) and indices[j] == indices[j - 1] + 1:
+                j += 1
+            addr = indices[i] << self._page_shift
+            self._buf[0] = Adafruit_MCP_SRAM.SRAM_WRITE
+            self._buf[1] = (addr >> 8) & 0xFF
+            self._buf[2] = addr & 0xFF
+            with self._spi as spi:
+                spi.write(self._buf, end=3)
+                for index in indices[i:j]:
+                    spi.write(self._pages[index])
+                    self._dirty.discard(index)
+            self._writes += 1
+            i = j
+
+    def _write_span(self) -> None:
+        """Write the bytes changed on the write through page to the chip"""
+        index, start, end = self._span
+        self._span = None
+        addr = (index << self._page_shift) + start
+        self._buf[0] = Adafruit_MCP_SRAM.SRAM_WRITE
+        self._buf[1] = (addr >> 8) & 0xFF
+        self._buf[2] = addr & 0xFF
+        with self._spi as spi:
+            spi.write(self._buf, end=3)
+            spi.write(self._pages[index], start=start, end=end)
+        self._writes += 1
+
+    def flush(self) -> None:
+        """Write all dirty cached pages back to the chip"""
+        if self._span is not None:
+            self._write_span()
+        if self._dirty:
+            self._write_back(sorted(self._dirty))
+
+    def _sync(self, addr: int, length: int, drop: bool) -> None:
+        """Write back dirty cached pages overlapping a byte range, and optionally
+        drop them from the cache before the range is overwritten"""
+        if not self._pages or length <= 0:
+            return
+        first = addr >> self._page_shift
+        last = (addr + length - 1) >> self._page_shift
+        if self._span is not None and first <= self._span[0] <= last:
+            self._write_span()
+        indices = sorted(i for i in self._pages if first <= i <= last)
+        self._write_back([i for i in indices if i in self._dirty])
+        if drop:
+            for index in indices:
+                self._evict(index)
+
+    def _write(self, addr: int, buf: List, reg: int = SRAM_WRITE) -> None:
         self._buf[0] = reg
         self._buf[1] = (addr >> 8) & 0xFF
         self._buf[2] = addr & 0xFF
@@ -77,8 +257,7 @@ class Adafruit_MCP_SRAM:
             spi.write(self._buf, end=3)
             spi.write(bytearray(buf))
 
-    def read(self, addr: int, length: int, reg: int = SRAM_READ):
-        """read passed number of bytes at the passed address"""
+    def _read(self, addr: int, length: int, reg: int = SRAM_READ) -> bytearray:
         self._buf[0] = reg
         self._buf[1] = (addr >> 8) & 0xFF
         self._buf[2] = addr & 0xFF
@@ -89,8 +268,48 @@ class Adafruit_MCP_SRAM:
             spi.readinto(buf)
         return buf
 
+    def _cached_pages(self, addr: int, length: int) -> Iterator[Tuple[bytearray, int, int, int]]:
+        """Yield (page, start, end, pos) for each cached page overlapping a byte range,
+        ``page[start:end]`` holding the range's bytes from ``pos`` on"""
+        size = self._page_size
+        for index in range(addr >> self._page_shift, ((addr + length - 1) >> self._page_shift) + 1):
+            page = self._pages.get(index)
+            if page is not None:
+                base = index << self._page_shift
+                start = max(addr - base, 0)
+                end = min(addr + length - base, size)
+                yield page, start, end, base + start - addr
+
+    def write(self, addr: int, buf: List, reg=SRAM_WRITE):
+        """write the passed buffer to the passed address"""
+        if reg != Adafruit_MCP_SRAM.SRAM_WRITE:
+            self._sync(addr, len(buf), True)
+        elif self._pages and len(buf):
+            # keep the mirrored pages, they take the same bytes as the chip
+            for page, start, end, pos in self._cached_pages(addr, len(buf)):
+                page[start:end] = bytes(buf[pos : pos + end - start])
+        self._write(addr, buf, reg)
+
+    def read(self, addr: int, length: int, reg: int = SRAM_READ):
+        """read passed number of bytes at the passed address"""
+        if self._pages and length > 0 and reg == Adafruit_MCP_SRAM.SRAM_READ:
+            first = addr >> self._page_shift
+            last = (addr + length - 1) >> self._page_shift
+            if last - first < len(self._pages) and all(
+                i in self._pages for i in range(first, last + 1)
+            ):
+                buf = bytearray(length)
+                for page, start, end, pos in self._cached_pages(addr, length):
+                    buf[pos : pos + end - start] = page[start:end]
+                self._hits += last - first + 1
+                return buf
+        self._sync(addr, length, False)
+        return self._read(addr, length, reg)
+
     def read8(self, addr: int, reg: int = SRAM_READ):
         """read a single byte at the passed address"""
+        if self._max_pages and reg == Adafruit_MCP_SRAM.SRAM_READ:
+            return self._page(addr >> self._page_shift)[addr & (self._page_size - 1)]
         return self.read(addr, 1, reg)[0]
 
     def read16(self, addr: int, reg: int = SRAM_READ):
@@ -100,6 +319,19 @@ class Adafruit_MCP_SRAM:
 
     def write8(self, addr: int, value: int, reg: int = SRAM_WRITE):
         """write a single byte at the passed address"""
+        if self._max_pages and reg == Adafruit_MCP_SRAM.SRAM_WRITE:
+            index = addr >> self._page_shift
+            offset = addr & (self._page_size - 1)
+            self._page(index)[offset] = value
+            if not self._write_through:
+                self._dirty.add(index)
+            elif self._span is None:
+                self._span = [index, offset, offset + 1]
+            elif offset < self._span[1]:
+                self._span[1] = offset
+            elif offset >= self._span[2]:
+                self._span[2] = offset + 1
+            return
         self.write(addr, [value], reg)
 
     def write16(self, addr: int, value: int, reg: int = SRAM_WRITE):
@@ -108,11 +340,49 @@ class Adafruit_MCP_SRAM:
 
     def erase(self, addr: int, length: int, value: Any):
         """erase the passed number of bytes starting at the passed address"""
+        self.fill_range_pattern(addr, length, bytes((value,)))
+
+    def fill_range_pattern(self, addr: int, length: int, pattern: bytes) -> None:
+        """Fill the passed number of bytes starting at the passed address with a
+        repeating pattern, its first byte going to ``addr``. The pattern is streamed
+        from a reusable block in one sequential mode transaction"""
+        if length <= 0:
+            return
+        if not pattern or len(pattern) > _FILL_BLOCK:
+            raise ValueError(f"Fill patterns must be 1 to {_FILL_BLOCK} bytes")
+        if self._max_pages:
+            self._fill_pages(addr, length, pattern)
+        if pattern != self._fill_pattern:
+            self._fill_pattern = bytes(pattern)
+            self._fill_block = bytearray(pattern) * (_FILL_BLOCK // len(pattern))
+        block = self._fill_block
         self._buf[0] = Adafruit_MCP_SRAM.SRAM_WRITE
         self._buf[1] = (addr >> 8) & 0xFF
         self._buf[2] = addr & 0xFF
-        fill = bytearray([value])
         with self._spi as spi:
             spi.write(self._buf, end=3)
-            for _ in range(length):
-                spi.write(fill)
+            for _ in range(length // len(block)):
+                spi.write(block)
+            if length % len(block):
+                spi.write(block, end=length % len(block))
+
+    def _fill_pages(self, addr: int, length: int, pattern: bytes) -> None:
+        """Fill the mirrored pages overlapping a byte range with a pattern"""
+
+        def repeat(pos, count):
+            pos %= len(pattern)
+            return (pattern * ((pos + count) // len(pattern) + 1))[pos : pos + count]
+
+        for page, start, end, pos in self._cached_pages(addr, length):
+            page[start:end] = repeat(pos, end - start)
+        # pages filled whole are known without reading them, mirror them while
+        # there is room left in the budget
+        size = self._page_size
+        index = (addr + size - 1) >> self._page_shift
+        while (index + 1) << self._page_shift <= addr + length and len(
+            self._pages
+        ) < self._max_pages:
+            if index not in self._pages:
+                self._pages[index] = bytearray(repeat((index << self._page_shift) - addr, size))
+                self._lru.insert(0, index)
+            index += 1
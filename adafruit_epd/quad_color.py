@@ -0,0 +1,722 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.quad_color` - Adafruit EPD - quad-color framebuffer and buffer helpers
+====================================================================================
+The packed 2 bit per pixel framebuffer, shared helpers and the Adafruit_QuadColorEPD
+base class of the quad-color (black, white, yellow, red) drivers
+* Author(s): Adafruit Industries
+"""
+
+from micropython import const
+
+from adafruit_epd import glyphs, sprite
+from adafruit_epd.dither import dither_image
+from adafruit_epd.epd import Adafruit_EPD
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    """Needed for type annotations"""
+    from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+    from circuitpython_typing.pil import Image
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+# 2-bit values stored in the display buffer
+BLACK = const(0b00)
+WHITE = const(0b01)
+YELLOW = const(0b10)
+RED = const(0b11)
+
+# A byte of four pixels of each color, indexed by the 2-bit value
+_PATTERNS = (b"\x00", b"\x55", b"\xaa", b"\xff")
+
+# Most RGB classifications we remember before starting the cache over
+_RGB_CACHE_SIZE = const(4096)
+
+# Grayscale pixels map onto the palette through a 256 entry table
+_GRAY_CODES = bytes(
+    BLACK if v < 64 else RED if v < 128 else YELLOW if v < 192 else WHITE for v in range(256)
+)
+
+_rgb_codes = {}
+
+
+def rgb_to_code(r: int, g: int, b: int) -> int:
+    """Pick the 2-bit palette value for an RGB color. Brightness thresholds are
+    compared against the channel sum so no division is needed"""
+    total = r + g + b
+    if total >= 600:
+        code = WHITE
+    elif r >= 128 and g >= 128 and b < 80:
+        code = YELLOW
+    elif r >= 128 and g < 80 and b < 80:
+        code = RED
+    elif total < 240:
+        code = BLACK
+    elif r > g and r > b and r >= 100:
+        code = RED
+    elif r >= 100 and g >= 100:
+        code = YELLOW
+    elif total < 384:
+        code = BLACK
+    else:
+        code = WHITE
+    return code
+
+
+def pack_image(
+    image: Image,
+    buffer: bytearray,
+    index: Callable[[int, int], int],
+) -> None:
+    """Quantize an RGB or L image to the four panel colors and write the packed
+    pixels into ``buffer``. ``index(x, y)`` gives the pixel position in the buffer
+    (4 pixels per byte, MSB first) for image coordinates, and must be linear in
+    x and y, which holds for every rotation"""
+    base = index(0, 0)
+    step_x = index(1, 0) - base
+    step_y = index(0, 1) - base
+    if numpy is not None:
+        _pack_numpy(image, buffer, base, step_x, step_y)
+    else:
+        _pack_rows(image, buffer, base, step_x, step_y)
+
+
+def _pack_numpy(image, buffer, base, step_x, step_y):
+    width, height = image.size
+    total = len(buffer) * 4
+    if image.mode == "L":
+        codes = numpy.frombuffer(_GRAY_CODES, dtype=numpy.uint8)[numpy.asarray(image)]
+    else:
+        pixels = numpy.asarray(image, dtype=numpy.int16)
+        r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+        level = r + g + b
+        codes = numpy.select(
+            (
+                level >= 600,
+                (r >= 128) & (g >= 128) & (b < 80),
+                (r >= 128) & (g < 80) & (b < 80),
+                level < 240,
+                (r > g) & (r > b) & (r >= 100),
+                (r >= 100) & (g >= 100),
+                level < 384,
+            ),
+            (WHITE, YELLOW, RED, BLACK, RED, YELLOW, BLACK),
+            WHITE,
+        ).astype(numpy.uint8)
+
+    positions = (
+        base + numpy.arange(width) * step_x + (numpy.arange(height) * step_y)[:, None]
+    ) % total
+    slots = numpy.full(total, WHITE, dtype=numpy.uint8)
+    slots[positions.ravel()] = codes.ravel()
+    slots = slots.reshape(-1, 4)
+    buffer[:] = (slots[:, 0] << 6 | slots[:, 1] << 4 | slots[:, 2] << 2 | slots[:, 3]).tobytes()
+
+
+def _pack_rows(image, buffer, base, step_x, step_y):
+    width, height = image.size
+    packed = bytearray(b"\x55" * len(buffer))
+    raw = image.tobytes()
+    if image.mode == "L":
+        row_bytes = width
+    else:
+        row_bytes = width * 3
+        cache = _rgb_codes
+
+    for y in range(height):
+        start = y * row_bytes
+        if image.mode == "L":
+            codes = raw[start : start + row_bytes].translate(_GRAY_CODES)
+        else:
+            codes = bytearray(width)
+            row = raw[start : start + row_bytes]
+            for x, rgb in enumerate(zip(row[0::3], row[1::3], row[2::3])):
+                code = cache.get(rgb)
+                if code is None:
+                    if len(cache) >= _RGB_CACHE_SIZE:
+                        cache.clear()
+                    code = cache[rgb] = rgb_to_code(*rgb)
+                codes[x] = code
+
+        _pack_row(packed, codes, base + y * step_y, step_x)
+
+    buffer[:] = packed
+
+
+def row_writer(buffer: bytearray, index: Callable[[int, int], int]) -> Callable:
+    """Return a function that writes one row of 2-bit values (as ``write(y, codes)``)
+    into a buffer already filled with white. ``index`` is as for pack_image()"""
+    base = index(0, 0)
+    step_x = index(1, 0) - base
+    step_y = index(0, 1) - base
+
+    def write(y, codes):
+        _pack_row(buffer, codes, base + y * step_y, step_x)
+
+    return write
+
+
+def _pack_row(packed, codes, position, step):
+    total = len(packed) * 4
+    for code in codes:
+        if code != WHITE:
+            slot = position % total
+            shift = (3 - (slot & 3)) * 2
+            packed[slot >> 2] = packed[slot >> 2] & ~(3 << shift) | code << shift
+        position += step
+
+
+def fill_rect(
+    buffer: Any,
+    size: int,
+    index: Callable[[int, int], int],
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    code: int,
+    erase: Optional[Callable] = None,
+) -> None:
+    """Set a rectangle of pixels, already clipped to the display, to a 2-bit value.
+    ``size`` is the buffer length in bytes and ``index`` is as for pack_image().
+    Rotation is resolved once, then each line of the rectangle that runs along a
+    buffer row is written as one span, see fill_span()"""
+    base = index(x, y)
+    step_x = index(x + 1, y) - base
+    step_y = index(x, y + 1) - base
+    if step_x in {1, -1}:
+        count, lines, step, line_step = width, height, step_x, step_y
+    else:
+        count, lines, step, line_step = height, width, step_y, step_x
+    if step < 0:
+        base -= count - 1
+    for _ in range(lines):
+        fill_span(buffer, size, base, count, code, erase)
+        base += line_step
+
+
+def fill_span(
+    buffer: Any,
+    size: int,
+    position: int,
+    count: int,
+    code: int,
+    erase: Optional[Callable] = None,
+) -> None:
+    """Set ``count`` consecutive pixels from pixel ``position`` to a 2-bit value.
+    Partly covered bytes at either end are masked, the whole bytes between them
+    are written in one go, by slice assignment or with ``erase(address, length,
+    value)`` for SRAM. Positions wrap around the buffer like pixel() does"""
+    total = size * 4
+    position %= total
+    if position + count > total:
+        fill_span(buffer, size, 0, position + count - total, code, erase)
+        count = total - position
+    pattern = _PATTERNS[code]
+    end = position + count
+    first = position >> 2
+    last = (end - 1) >> 2
+    if first == last:
+        _fill_byte(buffer, first, position & 3, end - (first << 2), pattern[0])
+        return
+    if position & 3:
+        _fill_byte(buffer, first, position & 3, 4, pattern[0])
+        first += 1
+    if end & 3:
+        _fill_byte(buffer, last, 0, end & 3, pattern[0])
+        last -= 1
+    if last >= first:
+        if erase is not None:
+            erase(first, last - first + 1, pattern[0])
+        else:
+            buffer[first : last + 1] = pattern * (last - first + 1)
+
+
+def _fill_byte(buffer, address, start, stop, value):
+    # pixels start to stop - 1 of the byte, MSB first
+    mask = (0xFF >> (start * 2)) & (0xFF << ((4 - stop) * 2)) & 0xFF
+    buffer[address] = buffer[address] & ~mask | value & mask
+
+
+class QuadColorFrameBuffer:
+    """A framebuffer of 2-bit pixels packed four to a byte, MSB first, as the
+    quad-color panels store them. It has the drawing methods of
+    ``adafruit_framebuf.FrameBuffer``, taking the 2-bit values as colors, and
+    handles rotation itself so rows of pixels are written as whole bytes.
+
+    :param buf: The buffer, or an SRAM view
+    :param int width: The width of the buffer in pixels, before rotation
+    :param int height: The height of the buffer in pixels, before rotation
+    :param int stride: The number of pixels from one row of the buffer to the next,
+        defaults to ``width``
+    :param int size: The length of the buffer in bytes, defaults to enough for
+        ``stride`` by ``height`` pixels
+    :param offsets: Columns added to the unrotated x coordinate in rotations 1 and 2,
+        for panels that need the rotated image shifted
+    :param erase: For SRAM views, the ``erase(address, length, value)`` method of the
+        SRAM, used to fill whole bytes
+    """
+
+    def __init__(
+        self,
+        buf: Any,
+        width: int,
+        height: int,
+        stride: Optional[int] = None,
+        *,
+        size: Optional[int] = None,
+        offsets: Tuple[int, int] = (0, 0),
+        erase: Optional[Callable] = None,
+    ) -> None:
+        self.buf = buf
+        self.width = width
+        self.height = height
+        self.stride = width if stride is None else stride
+        self._size = self.stride * height // 4 if size is None else size
+        self._offsets = offsets
+        self._erase = erase
+        self._rotation = 0
+
+    @property
+    def rotation(self) -> int:
+        """The rotation setting of the buffer, can be one of (0, 1, 2, 3)"""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, val: int) -> None:
+        if val not in {0, 1, 2, 3}:
+            raise RuntimeError("Bad rotation setting")
+        self._rotation = val
+
+    def _rotated_size(self) -> tuple:
+        if self._rotation in {1, 3}:
+            return self.height, self.width
+        return self.width, self.height
+
+    def pixel_index(self, x: int, y: int) -> int:
+        """Position of a pixel in the buffer (4 pixels per byte), after rotation.
+        Coordinates are not bounds checked"""
+        if self._rotation == 1:
+            x, y = y, x
+            x = self.width - x - 1 + self._offsets[0]
+        elif self._rotation == 2:
+            x = self.width - x - 1 + self._offsets[1]
+            y = self.height - y - 1
+        elif self._rotation == 3:
+            x, y = y, x
+            y = self.height - y - 1
+        return x + y * self.stride
+
+    def fill(self, color: int) -> None:
+        """Fill the entire buffer with a 2-bit color"""
+        pattern = _PATTERNS[color & 3]
+        if self._erase is not None:
+            self._erase(0, self._size, pattern[0])
+        else:
+            self.buf[:] = pattern * self._size
+
+    def pixel(self, x: int, y: int, color: Optional[int] = None) -> Optional[int]:
+        """If ``color`` is not given, get the color value of the specified pixel. If
+        ``color`` is given, set the specified pixel to the given color."""
+        width, height = self._rotated_size()
+        if x < 0 or x >= width or y < 0 or y >= height:
+            return None
+        index = self.pixel_index(x, y)
+        address = index // 4
+        shift = (3 - index % 4) * 2
+        if color is None:
+            return self.buf[address] >> shift & 3
+        self.buf[address] = self.buf[address] & ~(3 << shift) | (color & 3) << shift
+        return None
+
+    def pixels(self, points: Iterable[Tuple[int, int]], color: int) -> None:
+        """Set the pixel at each (x, y) of ``points`` to a color, skipping any off the
+        buffer"""
+        width, height = self._rotated_size()
+        color &= 3
+        buf = self.buf
+        index = self.pixel_index
+        for x, y in points:
+            if 0 <= x < width and 0 <= y < height:
+                position = index(x, y)
+                shift = (3 - (position & 3)) * 2
+                buf[position >> 2] = buf[position >> 2] & ~(3 << shift) | color << shift
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+        """Draw a filled rectangle, writing each buffer row of it as packed bytes"""
+        frame_width, frame_height = self._rotated_size()
+        x_1 = min(x + width, frame_width)
+        y_1 = min(y + height, frame_height)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x >= x_1 or y >= y_1:
+            return
+        fill_rect(
+            self.buf,
+            self._size,
+            self.pixel_index,
+            x,
+            y,
+            x_1 - x,
+            y_1 - y,
+            color & 3,
+            self._erase,
+        )
+
+    def rect(
+        self, x: int, y: int, width: int, height: int, color: int, *, fill: bool = False
+    ) -> None:
+        """Draw a rectangle outline, or a filled rectangle with ``fill=True``"""
+        if width < 1 or height < 1:
+            return
+        if fill:
+            self.fill_rect(x, y, width, height, color)
+            return
+        self.fill_rect(x, y, width, 1, color)
+        self.fill_rect(x, y + height - 1, width, 1, color)
+        self.fill_rect(x, y + 1, 1, height - 2, color)
+        self.fill_rect(x + width - 1, y + 1, 1, height - 2, color)
+
+    def hline(self, x: int, y: int, width: int, color: int) -> None:
+        """Draw a horizontal line up to a given length."""
+        self.fill_rect(x, y, width, 1, color)
+
+    def vline(self, x: int, y: int, height: int, color: int) -> None:
+        """Draw a vertical line up to a given length."""
+        self.fill_rect(x, y, 1, height, color)
+
+    def line(self, x_0: int, y_0: int, x_1: int, y_1: int, color: int) -> None:
+        """Draw a line from (x_0, y_0) to (x_1, y_1). Horizontal and vertical lines
+        are filled as packed bytes"""
+        dx = abs(x_1 - x_0)
+        dy = abs(y_1 - y_0)
+        if not dx or not dy:
+            self.fill_rect(min(x_0, x_1), min(y_0, y_1), dx + 1, dy + 1, color)
+            return
+
+        sx = 1 if x_0 < x_1 else -1
+        sy = 1 if y_0 < y_1 else -1
+        err = dx - dy
+        while True:
+            self.pixel(x_0, y_0, color)
+            if x_0 == x_1 and y_0 == y_1:
+                break
+            e2 = 2 * err
+            if e2 > -dy:
+                err -= dy
+                x_0 += sx
+            if e2 < dx:
+                err += dx
+                y_0 += sy
+
+    def text(
+        self,
+        string: str,
+        x: int,
+        y: int,
+        color: int,
+        *,
+        font_name: str = "font5x8.bin",
+        size: int = 1,
+    ) -> None:
+        """Place text on the buffer using a font file, breaking on \\n to the next
+        line. Glyphs are cached per font and written as packed bytes"""
+        glyphs.draw_text(
+            self.buf,
+            self._size,
+            self.pixel_index,
+            self._rotated_size(),
+            string,
+            x,
+            y,
+            color & 3,
+            font=glyphs.get_font(font_name),
+            size=size,
+            bpp=2,
+            pixel=self.pixel,
+        )
+
+    def blit(self, source: "QuadColorFrameBuffer", x: int, y: int, key: int = -1) -> None:
+        """Draw another QuadColorFrameBuffer with its top left corner at (x, y), both
+        in rotated coordinates. Pixels of color ``key`` are left transparent. Rows
+        that line up on byte boundaries in both buffers are copied as bytes"""
+        src_width, src_height = source._rotated_size()
+        frame_width, frame_height = self._rotated_size()
+        x_0 = max(x, 0)
+        y_0 = max(y, 0)
+        x_1 = min(x + src_width, frame_width)
+        y_1 = min(y + src_height, frame_height)
+        if x_0 >= x_1 or y_0 >= y_1:
+            return
+
+        if (
+            key == -1
+            and self._erase is None
+            and source._erase is None
+            and self.pixel_index(x_0 + 1, y_0) - self.pixel_index(x_0, y_0) == 1
+            and source.pixel_index(x_0 - x + 1, y_0 - y) - source.pixel_index(x_0 - x, y_0 - y) == 1
+        ):
+            count = x_1 - x_0
+            for row in range(y_0, y_1):
+                start = source.pixel_index(x_0 - x, row - y)
+                position = self.pixel_index(x_0, row)
+                if (start - position) % 4 == 0 and 0 <= position and 0 <= start:
+                    _copy_span(source.buf, start, self.buf, position, count)
+                else:
+                    for col in range(x_0, x_1):
+                        self.pixel(col, row, source.pixel(col - x, row - y))
+            return
+
+        for row in range(y_0, y_1):
+            for col in range(x_0, x_1):
+                color = source.pixel(col - x, row - y)
+                if color != key:
+                    self.pixel(col, row, color)
+
+    def blit_bits(  # noqa: PLR0913, PLR0917
+        self,
+        rows: List[int],
+        width: int,
+        x: int,
+        y: int,
+        color: int,
+        background: Optional[int] = None,
+        masks: Optional[List[int]] = None,
+    ) -> None:
+        """Draw a 1 bit sprite given as rows of ints, leftmost pixel in the most
+        significant bit, with its top left corner at (x, y) in rotated coordinates.
+        Set bits are drawn in ``color`` and clear bits in ``background``, or left
+        alone when it is None. With ``masks``, only pixels with a mask bit set are
+        drawn. Each run of pixels is filled as packed bytes"""
+        full = (1 << width) - 1
+        for row, bits in enumerate(rows):
+            mask = full if masks is None else masks[row] & full
+            for start, count in _runs(bits & mask, width):
+                self.fill_rect(x + start, y + row, count, 1, color)
+            if background is not None:
+                for start, count in _runs(~bits & mask, width):
+                    self.fill_rect(x + start, y + row, count, 1, background)
+
+
+def _runs(bits, width):
+    # (start, length) of each run of set bits, counting from the most significant
+    col = 0
+    while col < width:
+        if bits >> (width - 1 - col) & 1:
+            start = col
+            while col < width and bits >> (width - 1 - col) & 1:
+                col += 1
+            yield start, col - start
+        else:
+            col += 1
+
+
+def _copy_span(source, start, dest, position, count):
+    # copy count pixels where start and position share the same offset in a byte
+    end = position + count
+    first = position >> 2
+    last = (end - 1) >> 2
+    offset = (start >> 2) - first
+    if first == last:
+        _fill_byte(dest, first, position & 3, end - (first << 2), source[first + offset])
+        return
+    if position & 3:
+        _fill_byte(dest, first, position & 3, 4, source[first + offset])
+        first += 1
+    if end & 3:
+        _fill_byte(dest, last, 0, end & 3, source[last + offset])
+        last -= 1
+    if last >= first:
+        dest[first : last + 1] = source[first + offset : last + offset + 1]
+
+
+class Adafruit_QuadColorEPD(Adafruit_EPD):
+    """Base class for the quad-color drivers, drawing into a single
+    QuadColorFrameBuffer at ``_framebuf1`` instead of separate black and color
+    buffers. Drivers set up the buffer and the chipset commands"""
+
+    BLACK = const(0)  # 0b00 in the display buffer
+    WHITE = const(1)  # 0b01 in the display buffer
+    YELLOW = const(2)  # 0b10 in the display buffer
+    RED = const(3)  # 0b11 in the display buffer
+
+    # 2-bit display buffer value for each color
+    _CODES = {BLACK: BLACK, WHITE: WHITE, YELLOW: YELLOW, RED: RED}
+
+    def fill(self, color: int) -> None:
+        """Fill the entire display with the specified color.
+
+        Args:
+            color: Color value (BLACK, WHITE, YELLOW, or RED)
+
+        Raises:
+            ValueError: If an invalid color is specified
+        """
+        if color not in self._CODES:
+            raise ValueError(
+                f"Invalid color: {color}. Use BLACK (0), WHITE (1), YELLOW (2), or RED (3)."
+            )
+
+        self._framebuf1.fill(self._CODES[color])
+
+    def clear_buffer(self) -> None:
+        """Clear the display buffer to white"""
+        self.fill(Adafruit_QuadColorEPD.WHITE)
+
+    def pixel(self, x: int, y: int, color: int) -> None:
+        """Draw a single pixel in the display buffer.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            color: Color value (BLACK, WHITE, YELLOW, or RED)
+        """
+        # Invalid colors draw white
+        self._framebuf1.pixel(x, y, self._CODES.get(color, WHITE))
+
+    def pixels(self, points: Iterable[Tuple[int, int]], color: int) -> None:
+        """Draw a pixel at each (x, y) of ``points`` in one color.
+
+        Overridden to look the color up once and write the 2-bit buffer directly.
+        """
+        self._framebuf1.pixels(points, self._CODES.get(color, WHITE))
+
+    def rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+        """Draw a rectangle.
+
+        Overridden to fill each side with packed bytes.
+        """
+        self._framebuf1.rect(x, y, width, height, self._CODES.get(color, WHITE))
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+        """Fill a rectangle with the passed color.
+
+        Overridden to write each buffer row of the rectangle as packed bytes, rather
+        than setting pixels one at a time.
+        """
+        self._framebuf1.fill_rect(x, y, width, height, self._CODES.get(color, WHITE))
+
+    def line(self, x_0: int, y_0: int, x_1: int, y_1: int, color: int) -> None:
+        """Draw a line from (x_0, y_0) to (x_1, y_1) in passed color.
+
+        Overridden to use the quad-color pixel method, or packed bytes for
+        horizontal and vertical lines.
+        """
+        self._framebuf1.line(x_0, y_0, x_1, y_1, self._CODES.get(color, WHITE))
+
+    def text(
+        self,
+        string: str,
+        x: int,
+        y: int,
+        color: int,
+        *,
+        font_name: str = "font5x8.bin",
+        size: int = 1,
+    ) -> None:
+        """Write text string at location (x, y) in given color, using font file."""
+        if color not in self._CODES:
+            raise ValueError(
+                f"Invalid color: {color}. Use BLACK (0), WHITE (1), YELLOW (2), or RED (3)."
+            )
+        self._framebuf1.text(string, x, y, self._CODES[color], font_name=font_name, size=size)
+
+    def blit(  # noqa: PLR0913
+        self,
+        src: Any,
+        x: int,
+        y: int,
+        *,
+        color: int = BLACK,
+        mask: Optional[Any] = None,
+        op: str = sprite.COPY,
+    ) -> None:
+        """Draw a sprite with its top left corner at (x, y).
+
+        Overridden for the 2-bit buffer. A QuadColorFrameBuffer is copied as it
+        reads at its own rotation, a 1 bit ``adafruit_framebuf.FrameBuffer`` is drawn
+        in ``color``. Colors can't be combined bitwise, so only the ``copy`` op, and
+        ``or`` for 1 bit sprites (set bits only), are supported. With ``mask``, only
+        pixels with a set mask bit are drawn.
+        """
+        width, height = src.width, src.height
+        if isinstance(src, QuadColorFrameBuffer):
+            # read through pixel(), so it is drawn at its own rotation
+            width, height = src._rotated_size()
+        masks = None
+        if mask is not None:
+            if (mask.width, mask.height) != (width, height):
+                raise ValueError("Mask must be the same size as the sprite")
+            masks = sprite.sprite_rows(mask)
+        if isinstance(src, QuadColorFrameBuffer):
+            if op != sprite.COPY:
+                raise ValueError(f"Unsupported blit op for a quad-color sprite: {op}")
+            if masks is None:
+                self._framebuf1.blit(src, x, y)
+                return
+            for row, bits in enumerate(masks):
+                for col in range(width):
+                    if bits >> (width - 1 - col) & 1:
+                        self._framebuf1.pixel(x + col, y + row, src.pixel(col, row))
+            return
+        if op not in {sprite.COPY, sprite.OR}:
+            raise ValueError(f"Unsupported blit op for a quad-color display: {op}")
+        self._framebuf1.blit_bits(
+            sprite.sprite_rows(src),
+            src.width,
+            x,
+            y,
+            self._CODES.get(color, WHITE),
+            WHITE if op == sprite.COPY else None,
+            masks,
+        )
+
+    def image(self, image: Image, dither: Optional[str] = None) -> None:
+        """Set buffer to value of Python Imaging Library image.  The image should
+        be in RGB mode and a size equal to the display size. Set ``dither`` to a
+        method from ``adafruit_epd.dither`` to dither it to the four colors first.
+        """
+        imwidth, imheight = image.size
+        if imwidth != self.width or imheight != self.height:
+            raise ValueError(
+                f"Image must be same dimensions as display ({self.width}x{self.height})."
+            )
+        if self.sram:
+            raise RuntimeError("PIL image is not for use with SRAM assist")
+
+        if dither:
+            image = dither_image(image, self._dither_palette(), dither)
+        if image.mode == "P":  # Palette Mode, convert to RGB first
+            image = image.convert("RGB")
+        elif image.mode not in {"RGB", "L"}:
+            raise ValueError("Image must be in mode RGB, L, or P.")
+
+        # Quantize the whole image and write packed bytes, rather than per pixel
+        pack_image(image, self._buffer1, self._framebuf1.pixel_index)
+
+    def _bmp_color(self, r: int, g: int, b: int) -> int:  # noqa: PLR6301
+        """The display color image() would draw for an RGB value"""
+        return rgb_to_code(r, g, b)
+
+    def _bmp_row_writer(self) -> Callable:
+        """Return a function that stores one row of display colors"""
+        if self.sram:
+            return self._bmp_pixel_row
+        return row_writer(self._buffer1, self._framebuf1.pixel_index)
+
+    def _dither_palette(self) -> List[tuple]:  # noqa: PLR6301
+        """The RGB colors image() maps onto each display color, for dithering"""
+        return [(0x00, 0x00, 0x00), (0xFF, 0xFF, 0xFF), (0xFF, 0xFF, 0x00), (0xFF, 0x00, 0x00)]
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.sprite` - Adafruit EPD - 1 bit sprite helpers
+====================================================================================
+Reads 1 bit sprites, rotates them to the panel's orientation and combines them into
+the display planes a row at a time, for ``blit()``
+* Author(s): Adafruit Industries
+"""
+
+import adafruit_framebuf
+
+try:
+    """Needed for type annotations"""
+    from typing import Any, List, Optional, Tuple
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+COPY = "copy"
+OR = "or"
+AND = "and"
+XOR = "xor"
+
+OPS = (COPY, OR, AND, XOR)
+
+
+def sprite_rows(framebuf: Any) -> List[int]:
+    """The rows of a 1 bit MHMSB ``adafruit_framebuf.FrameBuffer`` as ints, with the
+    leftmost pixel in the most significant bit. The framebuffer's own rotation is
+    not applied"""
+    if not isinstance(framebuf.format, adafruit_framebuf.MHMSBFormat):
+        raise ValueError("Sprites must be MHMSB FrameBuffers")
+    width = framebuf.width
+    height = framebuf.height
+    if framebuf.stride % 8:
+        # rows that don't start on a byte boundary, read them as the format does
+        get_pixel = framebuf.format.get_pixel
+        rows = []
+        for y in range(height):
+            row = 0
+            for x in range(width):
+                row = row << 1 | get_pixel(framebuf, x, y)
+            rows.append(row)
+        return rows
+    pitch = framebuf.stride // 8
+    count = (width + 7) // 8
+    shift = count * 8 - width
+    buf = framebuf.buf
+    return [
+        int.from_bytes(bytes(buf[y * pitch : y * pitch + count]), "big") >> shift
+        for y in range(height)
+    ]
+
+
+def _reverse(value, bits):
+    result = 0
+    for _ in range(bits):
+        result = result << 1 | value & 1
+        value >>= 1
+    return result
+
+
+def rotate_rows(rows: List[int], width: int, height: int, rotation: int) -> Tuple:
+    """Turn sprite rows drawn at a display rotation into rows of the unrotated buffer.
+    Returns the rows and their width and height"""
+    if rotation == 0:
+        return rows, width, height
+    if rotation == 2:
+        return [_reverse(row, width) for row in reversed(rows)], width, height
+    columns = []
+    for shift in range(width - 1, -1, -1):
+        column = 0
+        for row in rows:
+            column = column << 1 | row >> shift & 1
+        columns.append(column)
+    if rotation == 1:
+        return [_reverse(column, height) for column in columns], height, width
+    return columns[::-1], height, width
+
+
+def blit_rows(  # noqa: PLR0913, PLR0917
+    framebuf: Any,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    rows: Optional[List[int]],
+    masks: Optional[List[int]],
+    op: str,
+    inverted: bool,
+) -> None:
+    """Combine ``height`` sprite rows into a 1 bit MHMSB plane at (x, y) in unrotated
+    buffer coordinates, clipping to the plane. ``rows`` of None draws clear bits.
+    The bits are combined with ``op`` before inversion, and only where ``masks`` has
+    bits set when it is given"""
+    start_x = max(x, 0)
+    end_x = min(x + width, framebuf.width)
+    if start_x >= end_x:
+        return
+    # drop the bits that fall off either side
+    right = x + width - end_x
+    keep = (1 << (end_x - start_x)) - 1
+    blit = _blit_pixels if framebuf.stride % 8 else _blit_bytes
+    for row in range(max(0, -y), min(height, framebuf.height - y)):
+        source = rows[row] >> right & keep if rows is not None else 0
+        mask = masks[row] >> right & keep if masks is not None else None
+        blit(framebuf, start_x, y + row, end_x - start_x, source, mask, op, inverted)
+
+
+def _combine(data, source, op):
+    if op == COPY:
+        return source
+    if op == OR:
+        return data | source
+    if op == AND:
+        return data & source
+    return data ^ source
+
+
+def _blit_bytes(framebuf, x, y, width, source, mask, op, inverted):  # noqa: PLR0913, PLR0917
+    first = x >> 3
+    count = ((x + width - 1) >> 3) - first + 1
+    shift = count * 8 - (x & 7) - width
+    start = y * (framebuf.stride // 8) + first
+    buf = framebuf.buf
+    ones = (1 << (count * 8)) - 1
+    if op == COPY and mask is None and not shift and not x & 7:
+        # whole bytes, written without reading the plane
+        buf[start : start + count] = (source ^ ones if inverted else source).to_bytes(count, "big")
+        return
+    field = ((1 << width) - 1) << shift
+    mask = field if mask is None else mask << shift
+    data = int.from_bytes(bytes(buf[start : start + count]), "big")
+    if inverted:
+        data ^= ones
+    data = data & ~mask | _combine(data, source << shift, op) & mask
+    if inverted:
+        data ^= ones
+    buf[start : start + count] = (data & ones).to_bytes(count, "big")
+
+
+def _blit_pixels(framebuf, x, y, width, source, mask, op, inverted):  # noqa: PLR0913, PLR0917
+    get_pixel = framebuf.format.get_pixel
+    set_pixel = framebuf.format.set_pixel
+    for col in range(width):
+        shift = width - 1 - col
+        if mask is not None and not mask >> shift & 1:
+            continue
+        data = get_pixel(framebuf, x + col, y) ^ inverted
+        value = _combine(data, source >> shift & 1, op) & 1
+        set_pixel(framebuf, x + col, y, value ^ inverted)
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -67,9 +68,24 @@ _LUT_DATA = (
 )
 
 
+_UPDATE_CODE = commands.compile_commands(
+    commands.command(_SSD1608_DISP_CTRL2, b"\xc7"),
+    commands.command(_SSD1608_MASTER_ACTIVATE),
+)
+
+_DEEP_SLEEP_CODE = commands.compile_commands(
+    commands.command(_SSD1608_DEEP_SLEEP, b"\x01"),
+    commands.delay(100),
+)
+
+
 class Adafruit_SSD1608(Adafruit_EPD):
     """driver class for Adafruit SSD1608 ePaper display breakouts"""
 
+    _busy_level = True
+    _max_baudrate = 20000000
+    _read_ram_command = _SSD1608_READ_RAM
+
     def __init__(
         self,
         width: int,
@@ -81,8 +97,11 @@ class Adafruit_SSD1608(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         if height % 8 != 0:
             height += 8 - height % 8
@@ -107,57 +126,46 @@ class Adafruit_SSD1608(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-        self.command(_SSD1608_SW_RESET)
-        self.busy_wait()
-        # driver output control
-        self.command(
-            _SSD1608_DRIVER_CONTROL,
-            bytearray([self._width - 1, (self._width - 1) >> 8, 0x00]),
-        )
-        # Set dummy line period
-        self.command(_SSD1608_WRITE_DUMMY, bytearray([0x1B]))
-        # Set gate line width
-        self.command(_SSD1608_WRITE_GATELINE, bytearray([0x0B]))
-        # Data entry sequence
-        self.command(_SSD1608_DATA_MODE, bytearray([0x03]))
-        # Set ram X start/end postion
-        self.command(_SSD1608_SET_RAMXPOS, bytearray([0x00, self._height // 8 - 1]))
-        # Set ram Y start/end postion
-        self.command(
-            _SSD1608_SET_RAMYPOS,
-            bytearray([0, 0, self._height - 1, (self._height - 1) >> 8]),
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
+        return commands.compile_commands(
+            commands.HARDWARE_RESET,
+            commands.BUSY_WAIT,
+            commands.command(_SSD1608_SW_RESET),
+            commands.BUSY_WAIT,
+            # driver output control
+            commands.command(
+                _SSD1608_DRIVER_CONTROL,
+                bytes([self._width - 1, (self._width - 1) >> 8, 0x00]),
+            ),
+            # Set dummy line period
+            commands.command(_SSD1608_WRITE_DUMMY, b"\x1b"),
+            # Set gate line width
+            commands.command(_SSD1608_WRITE_GATELINE, b"\x0b"),
+            # Data entry sequence
+            commands.command(_SSD1608_DATA_MODE, b"\x03"),
+            # Set ram X start/end postion
+            commands.command(_SSD1608_SET_RAMXPOS, bytes([0x00, self._height // 8 - 1])),
+            # Set ram Y start/end postion
+            commands.command(
+                _SSD1608_SET_RAMYPOS,
+                bytes([0, 0, self._height - 1, (self._height - 1) >> 8]),
+            ),
+            # Vcom Voltage
+            commands.command(_SSD1608_WRITE_VCOM, b"\x70"),
+            # LUT, command() never sent bytes data so _LUT_DATA has always been left
+            # out and the panel keeps its OTP waveforms
+            commands.command(_SSD1608_WRITE_LUT),
+            commands.BUSY_WAIT,
         )
-        # Vcom Voltage
-        self.command(_SSD1608_WRITE_VCOM, bytearray([0x70]))
-        # LUT
-        self.command(_SSD1608_WRITE_LUT, _LUT_DATA)
-        self.busy_wait()
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_SSD1608_DEEP_SLEEP, bytearray([0x01]))
-        time.sleep(0.1)
+        self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_SSD1608_DISP_CTRL2, bytearray([0xC7]))
-        self.command(_SSD1608_MASTER_ACTIVATE)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(3)  # wait 3 seconds
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self._send_command_list(_UPDATE_CODE)
 
     def write_ram(self, index: Literal[0]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -171,6 +179,6 @@ class Adafruit_SSD1608(Adafruit_EPD):
         """Set the RAM address location, not used on this chipset but required by
         the superclass"""
         # Set RAM X address counter
-        self.command(_SSD1608_SET_RAMXCOUNT, bytearray([x]))
+        self._command_bytes(_SSD1608_SET_RAMXCOUNT, 1, x)
         # Set RAM Y address counter
-        self.command(_SSD1608_SET_RAMYCOUNT, bytearray([y >> 8, y]))
+        self._command_bytes(_SSD1608_SET_RAMYCOUNT, 2, y >> 8, y)
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -44,6 +45,7 @@ _SSD1675_DISP_CTRL1 = const(0x21)
 _SSD1675_DISP_CTRL2 = const(0x22)
 _SSD1675_WRITE_RAM1 = const(0x24)
 _SSD1675_WRITE_RAM2 = const(0x26)
+_SSD1675_READ_RAM = const(0x27)
 _SSD1675_WRITE_VCOM = const(0x2C)
 _SSD1675_READ_OTP = const(0x2D)
 _SSD1675_WRITE_LUT = const(0x32)
@@ -59,9 +61,60 @@ _SSD1675_SET_DIGITALBLOCK = const(0x7E)
 _LUT_DATA = b"\x80`@\x00\x00\x00\x00\x10` \x00\x00\x00\x00\x80`@\x00\x00\x00\x00\x10` \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x03\x00\x00\x02\t\t\x00\x00\x02\x03\x03\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x15A\xa820\n"  # noqa: E501
 
 
+# Sent by power_up(), from the hardware reset on
+_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.delay(100),
+    commands.BUSY_WAIT,
+    commands.command(_SSD1675_SW_RESET),
+    commands.BUSY_WAIT,
+    # set analog block control
+    commands.command(_SSD1675_SET_ANALOGBLOCK, b"\x54"),
+    # set digital block control
+    commands.command(_SSD1675_SET_DIGITALBLOCK, b"\x3b"),
+    # driver output control
+    commands.command(_SSD1675_DRIVER_CONTROL, b"\xfa\x01\x00"),
+    # Data entry sequence
+    commands.command(_SSD1675_DATA_MODE, b"\x03"),
+    # Set ram X start/end postion
+    commands.command(_SSD1675_SET_RAMXPOS, b"\x00\x0f"),
+    # Set ram Y start/end postion
+    commands.command(_SSD1675_SET_RAMYPOS, b"\x00\x00\xf9\x00"),
+    # Border color
+    commands.command(_SSD1675_WRITE_BORDER, b"\x03"),
+    # Vcom Voltage
+    commands.command(_SSD1675_WRITE_VCOM, b"\x70"),
+    # Gate and source voltages, dummy line period, gate line width and LUT.
+    # command() never sent bytes data, so these have always gone out without
+    # their _LUT_DATA values and the panel keeps its OTP settings
+    commands.command(_SSD1675_GATE_VOLTAGE),
+    commands.command(_SSD1675_SOURCE_VOLTAGE),
+    commands.command(_SSD1675_WRITE_DUMMY),
+    commands.command(_SSD1675_WRITE_GATELINE),
+    commands.command(_SSD1675_WRITE_LUT),
+    commands.command(_SSD1675_SET_RAMXCOUNT, b"\x00"),
+    # Set RAM Y address counter
+    commands.command(_SSD1675_SET_RAMYCOUNT, b"\xf9\x00"),
+    commands.BUSY_WAIT,
+)
+_UPDATE_CODE = commands.compile_commands(
+    commands.command(_SSD1675_DISP_CTRL2, b"\xf4"),
+    commands.command(_SSD1675_MASTER_ACTIVATE),
+)
+
+_DEEP_SLEEP_CODE = commands.compile_commands(
+    commands.command(_SSD1675_DEEP_SLEEP, b"\x01"),
+    commands.delay(100),
+)
+
+
 class Adafruit_SSD1675(Adafruit_EPD):
     """driver class for Adafruit SSD1675 ePaper display breakouts"""
 
+    _busy_level = True
+    _max_baudrate = 20000000
+    _read_ram_command = _SSD1675_READ_RAM
+
     def __init__(
         self,
         width: int,
@@ -73,8 +126,11 @@ class Adafruit_SSD1675(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ):
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
         stride = width
         if stride % 8 != 0:
             stride += 8 - stride % 8
@@ -114,70 +170,17 @@ class Adafruit_SSD1675(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        time.sleep(0.1)
-        self.busy_wait()
-
-        self.command(_SSD1675_SW_RESET)
-        self.busy_wait()
-
-        # set analog block control
-        self.command(_SSD1675_SET_ANALOGBLOCK, bytearray([0x54]))
-        # set digital block control
-        self.command(_SSD1675_SET_DIGITALBLOCK, bytearray([0x3B]))
-
-        # driver output control
-        self.command(_SSD1675_DRIVER_CONTROL, bytearray([0xFA, 0x01, 0x00]))
-        # Data entry sequence
-        self.command(_SSD1675_DATA_MODE, bytearray([0x03]))
-        # Set ram X start/end postion
-        self.command(_SSD1675_SET_RAMXPOS, bytearray([0x00, 0x0F]))
-        # Set ram Y start/end postion
-        self.command(_SSD1675_SET_RAMYPOS, bytearray([0, 0, 0xF9, 0]))
-        # Border color
-        self.command(_SSD1675_WRITE_BORDER, bytearray([0x03]))
-        # Vcom Voltage
-        self.command(_SSD1675_WRITE_VCOM, bytearray([0x70]))
-        # Set gate voltage
-        self.command(_SSD1675_GATE_VOLTAGE, _LUT_DATA[70:71])
-        # Set gate voltage
-        self.command(_SSD1675_SOURCE_VOLTAGE, _LUT_DATA[71:74])
-        # Set dummy line period
-        self.command(_SSD1675_WRITE_DUMMY, _LUT_DATA[74:75])
-        # Set gate line width
-        self.command(_SSD1675_WRITE_GATELINE, _LUT_DATA[75:76])
-        # LUT
-        self.command(_SSD1675_WRITE_LUT, _LUT_DATA[0:70])
-
-        self.command(_SSD1675_SET_RAMXCOUNT, bytearray([0]))
-        # Set RAM Y address counter
-        self.command(_SSD1675_SET_RAMYCOUNT, bytearray([0xF9, 0]))
-
-        self.busy_wait()
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The command list power_up() sends"""
+        return _POWER_UP_CODE
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_SSD1675_DEEP_SLEEP, bytearray([0x01]))
-        time.sleep(0.1)
+        self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_SSD1675_DISP_CTRL2, bytearray([0xF4]))
-        self.command(_SSD1675_MASTER_ACTIVATE)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(3)  # wait 3 seconds
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self._send_command_list(_UPDATE_CODE)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -192,5 +195,5 @@ class Adafruit_SSD1675(Adafruit_EPD):
     def set_ram_address(self, x: int, y: int) -> None:  # noqa: PLR6301, F841
         """Set the RAM address location, not used on this chipset but required by
         the superclass"""
-        self.command(_SSD1675_SET_RAMXCOUNT, bytearray([x]))
-        self.command(_SSD1675_SET_RAMYCOUNT, bytearray([y, y >> 8]))
+        self._command_bytes(_SSD1675_SET_RAMXCOUNT, 1, x)
+        self._command_bytes(_SSD1675_SET_RAMYCOUNT, 2, y, y >> 8)
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -85,9 +86,24 @@ _SSD1675B_NOP = const(0xFF)
 _LUT_DATA = b"\xa0\x90P\x00\x00\x00\x00\x00\x00\x00P\x90\xa0\x00\x00\x00\x00\x00\x00\x00\xa0\x90P\x00\x00\x00\x00\x00\x00\x00P\x90\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x0f\x00\x00\x00\x0f\x0f\x00\x00\x03\x0f\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x15A\xa82P,\x0b"  # noqa: E501
 
 
+_UPDATE_CODE = commands.compile_commands(
+    commands.command(_SSD1675B_DISP_CTRL2, b"\xc7"),
+    commands.command(_SSD1675B_MASTER_ACTIVATE),
+)
+
+_DEEP_SLEEP_CODE = commands.compile_commands(
+    commands.command(_SSD1675B_DEEP_SLEEP, b"\x01"),
+    commands.delay(100),
+)
+
+
 class Adafruit_SSD1675B(Adafruit_EPD):
     """driver class for Adafruit SSD1675B ePaper display breakouts"""
 
+    _busy_level = True
+    _max_baudrate = 20000000
+    _read_ram_command = _SSD1675B_READ_RAM
+
     def __init__(
         self,
         width: int,
@@ -99,8 +115,11 @@ class Adafruit_SSD1675B(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
         stride = width
         if stride % 8 != 0:
             stride += 8 - stride % 8
@@ -140,86 +159,62 @@ class Adafruit_SSD1675B(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        time.sleep(0.1)
-        self.busy_wait()
-
-        self.command(_SSD1675B_SW_RESET)
-        self.busy_wait()
-
-        # set analog block control
-        self.command(_SSD1675B_SET_ANALOGBLOCK, bytearray([0x54]))
-        # set digital block control
-        self.command(_SSD1675B_SET_DIGITALBLOCK, bytearray([0x3B]))
-
-        self.command(
-            _SSD1675B_DRIVER_CONTROL,
-            bytearray([self._height - 1, (self._height - 1) >> 8, 0x00]),
-        )
-
-        # Data entry sequence
-        self.command(_SSD1675B_DATA_MODE, bytearray([0x03]))
-
-        # Set ram X start/end postion
-        self.command(_SSD1675B_SET_RAMXPOS, bytearray([0x00, self._width // 8]))
-        # Set ram Y start/end postion
-        self.command(
-            _SSD1675B_SET_RAMYPOS,
-            bytearray([0x0, 0x0, self._height - 1, (self._height - 1) >> 8]),
-        )
-
-        # Border color
-        self.command(_SSD1675B_WRITE_BORDER, bytearray([0x03]))
-
-        # Vcom Voltage
-        self.command(_SSD1675B_WRITE_VCOM_REG, bytearray([0x50]))
-        # Set gate voltage
-        self.command(_SSD1675B_GATE_VOLTAGE, _LUT_DATA[100:101])
-        # Set source voltage
-        self.command(_SSD1675B_SOURCE_VOLTAGE, _LUT_DATA[101:104])
-        # Set dummy line period
-        self.command(_SSD1675B_WRITE_DUMMY, _LUT_DATA[105:106])
-        # Set gate line width
-        self.command(_SSD1675B_WRITE_GATELINE, _LUT_DATA[106:107])
-        # LUT
-        self.command(_SSD1675B_WRITE_LUT, _LUT_DATA[0:100])
-
-        # Set temperature control
-        # self.command(_SSD1675B_TEMP_CONTROL, bytearray([0x80]))
-
-        # Set RAM X address counter
-        self.command(_SSD1675B_SET_RAMXCOUNT, bytearray([0]))
-        # Set RAM Y address counter
-        self.command(
-            _SSD1675B_SET_RAMYCOUNT,
-            bytearray([self._height - 1, (self._height - 1) >> 8]),
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
+        return commands.compile_commands(
+            commands.HARDWARE_RESET,
+            commands.delay(100),
+            commands.BUSY_WAIT,
+            commands.command(_SSD1675B_SW_RESET),
+            commands.BUSY_WAIT,
+            # set analog block control
+            commands.command(_SSD1675B_SET_ANALOGBLOCK, b"\x54"),
+            # set digital block control
+            commands.command(_SSD1675B_SET_DIGITALBLOCK, b"\x3b"),
+            commands.command(
+                _SSD1675B_DRIVER_CONTROL,
+                bytes([self._height - 1, (self._height - 1) >> 8, 0x00]),
+            ),
+            # Data entry sequence
+            commands.command(_SSD1675B_DATA_MODE, b"\x03"),
+            # Set ram X start/end postion
+            commands.command(_SSD1675B_SET_RAMXPOS, bytes([0x00, self._width // 8])),
+            # Set ram Y start/end postion
+            commands.command(
+                _SSD1675B_SET_RAMYPOS,
+                bytes([0x0, 0x0, self._height - 1, (self._height - 1) >> 8]),
+            ),
+            # Border color
+            commands.command(_SSD1675B_WRITE_BORDER, b"\x03"),
+            # Vcom Voltage
+            commands.command(_SSD1675B_WRITE_VCOM_REG, b"\x50"),
+            # Gate and source voltages, dummy line period, gate line width and LUT.
+            # command() never sent bytes data, so these have always gone out without
+            # their _LUT_DATA values and the panel keeps its OTP settings
+            commands.command(_SSD1675B_GATE_VOLTAGE),
+            commands.command(_SSD1675B_SOURCE_VOLTAGE),
+            commands.command(_SSD1675B_WRITE_DUMMY),
+            commands.command(_SSD1675B_WRITE_GATELINE),
+            commands.command(_SSD1675B_WRITE_LUT),
+            # Set temperature control
+            # commands.command(_SSD1675B_TEMP_CONTROL, b"\x80"),
+            # Set RAM X address counter
+            commands.command(_SSD1675B_SET_RAMXCOUNT, b"\x00"),
+            # Set RAM Y address counter
+            commands.command(
+                _SSD1675B_SET_RAMYCOUNT,
+                bytes([self._height - 1, (self._height - 1) >> 8]),
+            ),
+            commands.BUSY_WAIT,
         )
 
-        self.busy_wait()
-
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_SSD1675B_DEEP_SLEEP, bytearray([0x01]))
-        time.sleep(0.1)
+        self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_SSD1675B_DISP_CTRL2, bytearray([0xC7]))
-        self.command(_SSD1675B_MASTER_ACTIVATE)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(3)  # wait 3 seconds
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self._send_command_list(_UPDATE_CODE)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -234,5 +229,5 @@ class Adafruit_SSD1675B(Adafruit_EPD):
     def set_ram_address(self, x: int, y: int) -> None:  # noqa: PLR6301, F841
         """Set the RAM address location, not used on this chipset but required by
         the superclass"""
-        self.command(_SSD1675B_SET_RAMXCOUNT, bytearray([x]))
-        self.command(_SSD1675B_SET_RAMYCOUNT, bytearray([y, y >> 8]))
+        self._command_bytes(_SSD1675B_SET_RAMXCOUNT, 1, x)
+        self._command_bytes(_SSD1675B_SET_RAMYCOUNT, 2, y, y >> 8)
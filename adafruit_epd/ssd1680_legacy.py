@@ -12,6 +12,7 @@ ex: pre-2024 2.13" Monochrome E-Ink Bonnet
 
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.ssd1680 import Adafruit_SSD1680
 
 _SSD1680_DRIVER_CONTROL = const(0x01)
@@ -30,44 +31,43 @@ _SSD1680_SW_RESET = const(0x12)
 class Adafruit_SSD1680_Legacy(Adafruit_SSD1680):
     """Driver for older SSD1680 ePaper displays (pre-2024 2.13" Monochrome E-Ink Bonnet)"""
 
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-        self.command(_SSD1680_SW_RESET)
-        self.busy_wait()
-        # driver output control
-        self.command(
-            _SSD1680_DRIVER_CONTROL,
-            bytearray([self._height - 1, (self._height - 1) >> 8, 0x00]),
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
+        return commands.compile_commands(
+            commands.HARDWARE_RESET,
+            commands.BUSY_WAIT,
+            commands.command(_SSD1680_SW_RESET),
+            commands.BUSY_WAIT,
+            # driver output control
+            commands.command(
+                _SSD1680_DRIVER_CONTROL,
+                bytes([self._height - 1, (self._height - 1) >> 8, 0x00]),
+            ),
+            # data entry mode
+            commands.command(_SSD1680_DATA_MODE, b"\x03"),
+            # Set voltages
+            commands.command(_SSD1680_WRITE_VCOM_REG, b"\x36"),
+            commands.command(_SSD1680_GATE_VOLTAGE, b"\x17"),
+            commands.command(_SSD1680_SOURCE_VOLTAGE, b"\x41\x00\x32"),
+            # Set ram X start/end postion
+            commands.command(_SSD1680_SET_RAMXPOS, b"\x01\x10"),
+            # Set ram Y start/end postion
+            commands.command(
+                _SSD1680_SET_RAMYPOS,
+                bytes([0, 0, self._height - 1, (self._height - 1) >> 8]),
+            ),
+            # Set border waveform
+            commands.command(_SSD1680_WRITE_BORDER, b"\x05"),
+            # Set ram X count
+            commands.command(_SSD1680_SET_RAMXCOUNT, b"\x01"),
+            # Set ram Y count
+            commands.command(_SSD1680_SET_RAMYCOUNT, bytes([self._height - 1, 0])),
+            commands.BUSY_WAIT,
         )
-        # data entry mode
-        self.command(_SSD1680_DATA_MODE, bytearray([0x03]))
-
-        # Set voltages
-        self.command(_SSD1680_WRITE_VCOM_REG, bytearray([0x36]))
-        self.command(_SSD1680_GATE_VOLTAGE, bytearray([0x17]))
-        self.command(_SSD1680_SOURCE_VOLTAGE, bytearray([0x41, 0x00, 0x32]))
-
-        # Set ram X start/end postion
-        self.command(_SSD1680_SET_RAMXPOS, bytearray([0x01, 0x10]))
-        # Set ram Y start/end postion
-        self.command(
-            _SSD1680_SET_RAMYPOS,
-            bytearray([0, 0, self._height - 1, (self._height - 1) >> 8]),
-        )
-        # Set border waveform
-        self.command(_SSD1680_WRITE_BORDER, bytearray([0x05]))
-
-        # Set ram X count
-        self.command(_SSD1680_SET_RAMXCOUNT, bytearray([0x01]))
-        # Set ram Y count
-        self.command(_SSD1680_SET_RAMYCOUNT, bytearray([self._height - 1, 0]))
-        self.busy_wait()
 
     def set_ram_address(self, x: int, y: int) -> None:
         """Set the RAM address location"""
         # Set RAM X address counter
-        self.command(_SSD1680_SET_RAMXCOUNT, bytearray([x + 1]))
+        self._command_bytes(_SSD1680_SET_RAMXCOUNT, 1, x + 1)
         # Set RAM Y address counter
-        self.command(_SSD1680_SET_RAMYCOUNT, bytearray([y, y >> 8]))
+        self._command_bytes(_SSD1680_SET_RAMYCOUNT, 2, y, y >> 8)
@@ -15,6 +15,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -82,6 +83,22 @@ _SSD1680B_SET_RAMYCOUNT = const(0x4F)
 _SSD1680B_NOP = const(0x7F)
 
 
+_UPDATE_CODE = commands.compile_commands(
+    commands.command(_SSD1680B_DISP_CTRL2, b"\xf7"),
+    commands.command(_SSD1680B_MASTER_ACTIVATE),
+)
+# Display mode 2, after a partial RAM write
+_PARTIAL_UPDATE_CODE = commands.compile_commands(
+    commands.command(_SSD1680B_DISP_CTRL2, b"\xff"),
+    commands.command(_SSD1680B_MASTER_ACTIVATE),
+)
+
+_DEEP_SLEEP_CODE = commands.compile_commands(
+    commands.command(_SSD1680B_DEEP_SLEEP, b"\x01"),
+    commands.delay(100),
+)
+
+
 class Adafruit_SSD1680B(Adafruit_EPD):
     """
     Driver class for Adafruit SSD1680 "B" ePaper displays. This class is meant
@@ -89,6 +106,10 @@ class Adafruit_SSD1680B(Adafruit_EPD):
     with a GDEY0213B74 display module.
     """
 
+    _busy_level = True
+    _max_baudrate = 20000000
+    _read_ram_command = _SSD1680B_READ_RAM
+
     def __init__(
         self,
         width: int,
@@ -100,8 +121,11 @@ class Adafruit_SSD1680B(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         stride = width
         if stride % 8 != 0:
@@ -133,6 +157,7 @@ class Adafruit_SSD1680B(Adafruit_EPD):
         )
         self.set_black_buffer(0, True)
         self.set_color_buffer(1, False)
+        self._supports_ram_window = True
 
     def begin(self, reset: bool = True) -> None:
         """Begin communication with the display and set basic settings"""
@@ -140,64 +165,48 @@ class Adafruit_SSD1680B(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """
-        Wait for display to be done with current task, either by polling the
-        busy pin, or pausing
-        """
-        if self._busy:
-            while self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-        self.command(_SSD1680B_SW_RESET)
-        self.busy_wait()
-        # driver output control
-        self.command(
-            _SSD1680B_DRIVER_CONTROL,
-            bytearray([self._height, self._height >> 8, 0x00]),
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
+        return commands.compile_commands(
+            commands.HARDWARE_RESET,
+            commands.BUSY_WAIT,
+            commands.command(_SSD1680B_SW_RESET),
+            commands.BUSY_WAIT,
+            # driver output control
+            commands.command(
+                _SSD1680B_DRIVER_CONTROL,
+                bytes([self._height, self._height >> 8, 0x00]),
+            ),
+            # data entry mode
+            commands.command(_SSD1680B_DATA_MODE, b"\x03"),
+            # Set voltages
+            commands.command(_SSD1680B_WRITE_VCOM_REG, b"\x36"),
+            commands.command(_SSD1680B_GATE_VOLTAGE, b"\x17"),
+            commands.command(_SSD1680B_SOURCE_VOLTAGE, b"\x41\x00\x32"),
+            # Set ram X start/end postion
+            commands.command(_SSD1680B_SET_RAMXPOS, bytes([0x00, self._width // 8])),
+            # Set ram Y start/end postion
+            commands.command(
+                _SSD1680B_SET_RAMYPOS,
+                bytes([0, 0, self._height, self._height >> 8]),
+            ),
+            # Set border waveform
+            commands.command(_SSD1680B_WRITE_BORDER, b"\x05"),
+            # Set ram X count
+            commands.command(_SSD1680B_SET_RAMXCOUNT, b"\x01"),
+            # Set ram Y count
+            commands.command(_SSD1680B_SET_RAMYCOUNT, bytes([self._height, 0])),
+            commands.BUSY_WAIT,
         )
-        # data entry mode
-        self.command(_SSD1680B_DATA_MODE, bytearray([0x03]))
-
-        # Set voltages
-        self.command(_SSD1680B_WRITE_VCOM_REG, bytearray([0x36]))
-        self.command(_SSD1680B_GATE_VOLTAGE, bytearray([0x17]))
-        self.command(_SSD1680B_SOURCE_VOLTAGE, bytearray([0x41, 0x00, 0x32]))
-
-        # Set ram X start/end postion
-        self.command(_SSD1680B_SET_RAMXPOS, bytearray([0x00, self._width // 8]))
-        # Set ram Y start/end postion
-        self.command(
-            _SSD1680B_SET_RAMYPOS,
-            bytearray([0, 0, self._height, self._height >> 8]),
-        )
-        # Set border waveform
-        self.command(_SSD1680B_WRITE_BORDER, bytearray([0x05]))
-
-        # Set ram X count
-        self.command(_SSD1680B_SET_RAMXCOUNT, bytearray([0x01]))
-        # Set ram Y count
-        self.command(_SSD1680B_SET_RAMYCOUNT, bytearray([self._height, 0]))
-        self.busy_wait()
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_SSD1680B_DEEP_SLEEP, bytearray([0x01]))
-        time.sleep(0.1)
+        self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_SSD1680B_DISP_CTRL2, bytearray([0xF7]))
-        self.command(_SSD1680B_MASTER_ACTIVATE)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(3)  # wait 3 seconds
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory, using display mode 2
+        after a partial RAM write"""
+        self._send_command_list(_PARTIAL_UPDATE_CODE if partial else _UPDATE_CODE)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """
@@ -214,6 +223,13 @@ class Adafruit_SSD1680B(Adafruit_EPD):
     def set_ram_address(self, x: int, y: int) -> None:  # noqa: PLR6301, F841
         """Set the RAM address location"""
         # Set RAM X address counter
-        self.command(_SSD1680B_SET_RAMXCOUNT, bytearray([x]))
+        self._command_bytes(_SSD1680B_SET_RAMXCOUNT, 1, x)
         # Set RAM Y address counter
-        self.command(_SSD1680B_SET_RAMYCOUNT, bytearray([y, y >> 8]))
+        self._command_bytes(_SSD1680B_SET_RAMYCOUNT, 2, y, y >> 8)
+
+    def set_ram_window(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Set the RAM window for partial updates"""
+        # Set ram X start/end postion
+        self._command_bytes(_SSD1680B_SET_RAMXPOS, 2, x1, x2)
+        # Set ram Y start/end postion
+        self._command_bytes(_SSD1680B_SET_RAMYPOS, 4, y1 & 0xFF, y1 >> 8, y2 & 0xFF, y2 >> 8)
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -79,9 +80,24 @@ _SSD1681_SET_RAMYCOUNT = const(0x4F)
 _SSD1681_NOP = const(0xFF)
 
 
+_UPDATE_CODE = commands.compile_commands(
+    commands.command(_SSD1681_DISP_CTRL2, b"\xf7"),
+    commands.command(_SSD1681_MASTER_ACTIVATE),
+)
+
+_DEEP_SLEEP_CODE = commands.compile_commands(
+    commands.command(_SSD1681_DEEP_SLEEP, b"\x01"),
+    commands.delay(100),
+)
+
+
 class Adafruit_SSD1681(Adafruit_EPD):
     """driver class for Adafruit SSD1681 ePaper display breakouts"""
 
+    _busy_level = True
+    _max_baudrate = 20000000
+    _read_ram_command = _SSD1681_READ_RAM
+
     def __init__(
         self,
         width: int,
@@ -93,8 +109,11 @@ class Adafruit_SSD1681(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         if height % 8 != 0:
             height += 8 - height % 8
@@ -125,54 +144,41 @@ class Adafruit_SSD1681(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-        self.command(_SSD1681_SW_RESET)
-        self.busy_wait()
-        # driver output control
-        self.command(
-            _SSD1681_DRIVER_CONTROL,
-            bytearray([(self._width - 1) & 0xFF, (self._width - 1) >> 8, 0x00]),
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
+        return commands.compile_commands(
+            commands.HARDWARE_RESET,
+            commands.BUSY_WAIT,
+            commands.command(_SSD1681_SW_RESET),
+            commands.BUSY_WAIT,
+            # driver output control
+            commands.command(
+                _SSD1681_DRIVER_CONTROL,
+                bytes([(self._width - 1) & 0xFF, (self._width - 1) >> 8, 0x00]),
+            ),
+            # data entry mode
+            commands.command(_SSD1681_DATA_MODE, b"\x03"),
+            # Set ram X start/end postion
+            commands.command(_SSD1681_SET_RAMXPOS, bytes([0x00, self._height // 8 - 1])),
+            # Set ram Y start/end postion
+            commands.command(
+                _SSD1681_SET_RAMYPOS,
+                bytes([0, 0, (self._height - 1) & 0xFF, (self._height - 1) >> 8]),
+            ),
+            # Set border waveform
+            commands.command(_SSD1681_WRITE_BORDER, b"\x05"),
+            # Set temperature control
+            commands.command(_SSD1681_TEMP_CONTROL, b"\x80"),
+            commands.BUSY_WAIT,
         )
-        # data entry mode
-        self.command(_SSD1681_DATA_MODE, bytearray([0x03]))
-        # Set ram X start/end postion
-        self.command(_SSD1681_SET_RAMXPOS, bytearray([0x00, self._height // 8 - 1]))
-        # Set ram Y start/end postion
-        self.command(
-            _SSD1681_SET_RAMYPOS,
-            bytearray([0, 0, (self._height - 1) & 0xFF, (self._height - 1) >> 8]),
-        )
-        # Set border waveform
-        self.command(_SSD1681_WRITE_BORDER, bytearray([0x05]))
-        # Set temperature control
-        self.command(_SSD1681_TEMP_CONTROL, bytearray([0x80]))
-
-        self.busy_wait()
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_SSD1681_DEEP_SLEEP, bytearray([0x01]))
-        time.sleep(0.1)
+        self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_SSD1681_DISP_CTRL2, bytearray([0xF7]))
-        self.command(_SSD1681_MASTER_ACTIVATE)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(3)  # wait 3 seconds
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self._send_command_list(_UPDATE_CODE)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -188,6 +194,6 @@ class Adafruit_SSD1681(Adafruit_EPD):
         """Set the RAM address location, not used on this chipset but required by
         the superclass"""
         # Set RAM X address counter
-        self.command(_SSD1681_SET_RAMXCOUNT, bytearray([x]))
+        self._command_bytes(_SSD1681_SET_RAMXCOUNT, 1, x)
         # Set RAM Y address counter
-        self.command(_SSD1681_SET_RAMYCOUNT, bytearray([y & 0xFF, y >> 8]))
+        self._command_bytes(_SSD1681_SET_RAMYCOUNT, 2, y & 0xFF, y >> 8)
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -76,9 +77,33 @@ _EPD_RAM_RED = const(0x13)
 _BUSY_WAIT = const(500)
 
 
+# Default initialization sequence (tri-color mode)
+_DEFAULT_INIT_CODE = commands.compile_commands(
+    commands.command(_SSD1683_SW_RESET),  # Software reset
+    commands.delay(50),  # Wait for busy (50ms delay)
+    commands.command(_SSD1683_WRITE_BORDER, b"\x05"),  # Border color/waveform
+    commands.command(_SSD1683_TEMP_CONTROL, b"\x80"),  # Read temp
+    commands.command(_SSD1683_DATA_MODE, b"\x03"),  # Y decrement, X increment
+)
+_DEEP_SLEEP_CODE = commands.compile_commands(
+    commands.command(_SSD1683_DEEP_SLEEP, b"\x01"),
+    commands.delay(100),
+)
+_SW_RESET_CODE = commands.compile_commands(
+    commands.command(_SSD1683_SW_RESET),
+    commands.BUSY_WAIT,
+)
+
+
 class Adafruit_SSD1683(Adafruit_EPD):
     """driver class for Adafruit SSD1683 ePaper display breakouts"""
 
+    _busy_level = True
+    _busy_delay = _BUSY_WAIT / 1000.0
+    _refresh_delay = 1
+    _max_baudrate = 20000000
+    _read_ram_command = _SSD1683_READ_RAM1
+
     def __init__(
         self,
         width: int,
@@ -90,8 +115,11 @@ class Adafruit_SSD1683(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         stride = width
         if stride % 8 != 0:
@@ -118,29 +146,17 @@ class Adafruit_SSD1683(Adafruit_EPD):
 
         # Set single byte transactions flag
         self._single_byte_tx = True
+        # Commands need CS toggled per byte, RAM data is taken in bursts with CS held
+        # low like the rest of the SSD16xx family
+        self._ram_tx_mode = Adafruit_EPD.TX_ROW
 
-        # Set the display update value
+        # Set the display update values for full and partial refreshes
         self._display_update_val = 0xF7
+        self._partial_update_val = 0xFF
+        self._supports_ram_window = True
 
-        # Default initialization sequence (tri-color mode)
-        self._default_init_code = bytes(
-            [
-                _SSD1683_SW_RESET,
-                0,  # Software reset
-                0xFF,
-                50,  # Wait for busy (50ms delay)
-                _SSD1683_WRITE_BORDER,
-                1,  # Border waveform control
-                0x05,  # Border color/waveform
-                _SSD1683_TEMP_CONTROL,
-                1,  # Temperature control
-                0x80,  # Read temp
-                _SSD1683_DATA_MODE,
-                1,  # Data entry mode
-                0x03,  # Y decrement, X increment
-                0xFE,  # End of initialization
-            ]
-        )
+        # Initialization sequence, a command list (see adafruit_epd.commands)
+        self._default_init_code = _DEFAULT_INIT_CODE
 
     def begin(self, reset: bool = True) -> None:
         """Begin communication with the display and set basic settings"""
@@ -148,65 +164,57 @@ class Adafruit_SSD1683(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while self._busy.value:  # wait for busy low
-                time.sleep(0.01)
-        else:
-            time.sleep(_BUSY_WAIT / 1000.0)  # Convert ms to seconds
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        time.sleep(0.1)
-        self.busy_wait()
+    def _power_up_list(self) -> bytes:
+        """The _power_up_commands() list, built on each power up as the init and LUT
+        code can be changed in between"""
+        return self._power_up_commands()
 
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
         # Use custom init code if provided, otherwise use default
         init_code = self._default_init_code
-        if hasattr(self, "_epd_init_code") and self._epd_init_code is not None:
+        if getattr(self, "_epd_init_code", None) is not None:
             init_code = self._epd_init_code
-
-        # Send initialization sequence
-        self._send_command_list(init_code)
-
-        # Set RAM window
-        self.set_ram_window(0, 0, (self._width // 8) - 1, self._height - 1)
-
-        # Set RAM address to start position
-        self.set_ram_address(0, 0)
-
-        # Set LUT if we have one
-        if hasattr(self, "_epd_lut_code") and self._epd_lut_code:
-            self._send_command_list(self._epd_lut_code)
-
-        # Set display size and driver output control
-        _b0 = (self._height - 1) & 0xFF
-        _b1 = ((self._height - 1) >> 8) & 0xFF
-        _b2 = 0x00
-        self.command(_SSD1683_DRIVER_CONTROL, bytearray([_b0, _b1, _b2]))
+        x_end = ((self._width // 8) - 1) & 0xFF
+        y_end = self._height - 1
+        return commands.compile_commands(
+            commands.HARDWARE_RESET,
+            commands.delay(100),
+            commands.BUSY_WAIT,
+            # Send initialization sequence
+            init_code,
+            # Set RAM window
+            commands.command(_SSD1683_SET_RAMXPOS, bytes([0, x_end])),
+            commands.command(
+                _SSD1683_SET_RAMYPOS, bytes([0, 0, y_end & 0xFF, (y_end >> 8) & 0xFF])
+            ),
+            # Set RAM address to start position
+            commands.command(_SSD1683_SET_RAMXCOUNT, b"\x00"),
+            commands.command(_SSD1683_SET_RAMYCOUNT, b"\x00\x00"),
+            # Set LUT if we have one
+            getattr(self, "_epd_lut_code", None) or b"",
+            # Set display size and driver output control
+            commands.command(
+                _SSD1683_DRIVER_CONTROL, bytes([y_end & 0xFF, (y_end >> 8) & 0xFF, 0x00])
+            ),
+        )
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
         # Only deep sleep if we can get out of it
         if self._rst:
             # deep sleep
-            self.command(_SSD1683_DEEP_SLEEP, bytearray([0x01]))
-            time.sleep(0.1)
+            self._send_command_list(_DEEP_SLEEP_CODE)
         else:
-            self.command(_SSD1683_SW_RESET)
-            self.busy_wait()
+            self._send_command_list(_SW_RESET_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory, using display mode 2
+        after a partial RAM write"""
         # display update sequence
-        self.command(_SSD1683_DISP_CTRL2, bytearray([self._display_update_val]))
+        value = self._partial_update_val if partial else self._display_update_val
+        self._command_bytes(_SSD1683_DISP_CTRL2, 1, value)
         self.command(_SSD1683_MASTER_ACTIVATE)
-        self.busy_wait()
-
-        if not self._busy:
-            time.sleep(1)  # wait 1 second
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -221,42 +229,17 @@ class Adafruit_SSD1683(Adafruit_EPD):
     def set_ram_address(self, x: int, y: int) -> None:
         """Set the RAM address location"""
         # set RAM x address count
-        self.command(_SSD1683_SET_RAMXCOUNT, bytearray([x & 0xFF]))
+        self._command_bytes(_SSD1683_SET_RAMXCOUNT, 1, x & 0xFF)
 
         # set RAM y address count
-        self.command(_SSD1683_SET_RAMYCOUNT, bytearray([y & 0xFF, (y >> 8) & 0xFF]))
+        self._command_bytes(_SSD1683_SET_RAMYCOUNT, 2, y & 0xFF, (y >> 8) & 0xFF)
 
     def set_ram_window(self, x1: int, y1: int, x2: int, y2: int) -> None:
         """Set the RAM window for partial updates"""
         # Set ram X start/end position
-        self.command(_SSD1683_SET_RAMXPOS, bytearray([x1 & 0xFF, x2 & 0xFF]))
+        self._command_bytes(_SSD1683_SET_RAMXPOS, 2, x1 & 0xFF, x2 & 0xFF)
 
         # Set ram Y start/end position
-        self.command(
-            _SSD1683_SET_RAMYPOS,
-            bytearray([y1 & 0xFF, (y1 >> 8) & 0xFF, y2 & 0xFF, (y2 >> 8) & 0xFF]),
+        self._command_bytes(
+            _SSD1683_SET_RAMYPOS, 4, y1 & 0xFF, (y1 >> 8) & 0xFF, y2 & 0xFF, (y2 >> 8) & 0xFF
         )
-
-    def _send_command_list(self, init_sequence: bytes) -> None:
-        """Send a sequence of commands from an initialization list"""
-        i = 0
-        while i < len(init_sequence):
-            cmd = init_sequence[i]
-            i += 1
-
-            if cmd == 0xFE:  # End marker
-                break
-            elif cmd == 0xFF:  # Delay marker
-                if i < len(init_sequence):
-                    delay_ms = init_sequence[i]
-                    i += 1
-                    time.sleep(delay_ms / 1000.0)
-            elif i < len(init_sequence):
-                num_args = init_sequence[i]
-                i += 1
-                if num_args > 0 and (i + num_args) <= len(init_sequence):
-                    args = init_sequence[i : i + num_args]
-                    self.command(cmd, bytearray(args))
-                    i += num_args
-                else:
-                    self.command(cmd)
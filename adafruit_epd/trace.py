@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_epd.trace` - Adafruit EPD - transfer statistics and tracing
+====================================================================================
+Counters and timers for what a display spends its time on, see
+Adafruit_EPD.enable_stats(). While enabled, the display's bus and pins are wrapped
+in counting stand-ins and its sleeps and busy waits are timed. Disabling puts the
+originals back, so nothing is counted or slowed down otherwise
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+try:
+    """Needed for type annotations"""
+    from typing import Any, Callable, Optional
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+# Events passed to the callback, with their value
+COMMAND = "command"  # the command byte
+DATA = "data"  # bytes sent to the panel
+SRAM = "sram"  # bytes moved to or from the SRAM
+LOCK_SPIN = "lock_spin"  # None, try_lock() found the bus taken
+BUSY = "busy"  # seconds busy_wait() took
+SLEEP = "sleep"  # seconds slept
+
+_COUNTERS = (
+    "commands",
+    "data_bytes",
+    "sram_bytes",
+    "transfers",
+    "spi_time",
+    "cs_toggles",
+    "dc_toggles",
+    "locks",
+    "lock_spins",
+    "busy_waits",
+    "busy_polls",
+    "busy_time",
+    "sleeps",
+    "sleep_time",
+)
+
+
+class EPDStats:
+    """What a display has done since the stats were enabled or reset:
+
+    * ``commands``, ``data_bytes``: command bytes and data bytes sent to the panel
+    * ``sram_bytes``: bytes moved to or from the SRAM, headers included
+    * ``transfers``, ``spi_time``: SPI calls and the seconds spent in them
+    * ``cs_toggles``, ``dc_toggles``: changes of the panel and SRAM CS pins, and of DC
+    * ``locks``, ``lock_spins``: bus locks taken, and try_lock() calls that failed
+    * ``busy_waits``, ``busy_polls``, ``busy_time``: busy_wait() calls, busy pin
+      reads and the seconds spent waiting, sleeps included
+    * ``sleeps``, ``sleep_time``: sleeps and the seconds slept
+
+    ``callback(event, value)`` is called for each event as it happens, see the
+    event names in this module."""
+
+    def __init__(self, callback: Optional[Callable[[str, Any], None]] = None) -> None:
+        self.callback = callback
+        self._display = None
+        self._originals = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero the counters"""
+        for name in _COUNTERS:
+            setattr(self, name, 0)
+        self.started = time.monotonic()
+
+    def snapshot(self) -> dict:
+        """The counters as a dict, with the seconds elapsed since the last reset"""
+        counters = {name: getattr(self, name) for name in _COUNTERS}
+        counters["elapsed"] = time.monotonic() - self.started
+        return counters
+
+    def _event(self, event: str, value: Any) -> None:
+        if self.callback is not None:
+            self.callback(event, value)
+
+    def attach(self, display: Any) -> None:
+        """Wrap a display's bus, pins, sleeps and busy waits to count them"""
+        if self._display is not None:
+            raise RuntimeError("Stats are already attached to a display")
+        self._display = display
+        originals = {
+            "spi_device": display.spi_device,
+            "_cs": display._cs,
+            "_dc": display._dc,
+            "_busy": display._busy,
+        }
+        panel_cs = display._cs
+        display._cs = _Pin(panel_cs, self, "cs_toggles")
+        display._dc = _Pin(display._dc, self, "dc_toggles")
+        display.spi_device = _SPI(
+            display.spi_device,
+            self,
+            panel_cs,
+            display._dc,
+            display.sram.cs_pin if display.sram else None,
+        )
+        if display._busy:
+            display._busy = _BusyPin(display._busy, self, None)
+        if display.sram:
+            sram = display.sram
+            originals["sram"] = (sram._spi.spi, sram.cs_pin)
+            sram_cs = _Pin(sram.cs_pin, self, "cs_toggles")
+            sram._spi.spi = _SPI(sram._spi.spi, self, None, None, None)
+            sram._spi.chip_select = sram.cs_pin = sram_cs
+        self._originals = originals
+        display._sleep = self._sleep
+        display._sleep_async = self._sleep_async
+        display.busy_wait = self._busy_wait
+        display.busy_wait_async = self._busy_wait_async
+
+    def detach(self) -> None:
+        """Put back what attach() wrapped"""
+        display = self._display
+        if display is None:
+            return
+        originals = self._originals
+        for name in ("spi_device", "_cs", "_dc", "_busy"):
+            setattr(display, name, originals[name])
+        if "sram" in originals:
+            sram = display.sram
+            sram._spi.spi, sram.cs_pin = originals["sram"]
+            sram._spi.chip_select = sram.cs_pin
+        for name in ("_sleep", "_sleep_async", "busy_wait", "busy_wait_async"):
+            delattr(display, name)
+        self._display = self._originals = None
+
+    def _sleep(self, seconds: float) -> None:
+        start = time.monotonic()
+        time.sleep(seconds)
+        self._slept(time.monotonic() - start)
+
+    async def _sleep_async(self, seconds: float) -> None:
+        start = time.monotonic()
+        await type(self._display)._sleep_async(self._display, seconds)
+        self._slept(time.monotonic() - start)
+
+    def _slept(self, seconds: float) -> None:
+        self.sleeps += 1
+        self.sleep_time += seconds
+        self._event(SLEEP, seconds)
+
+    def _busy_wait(self) -> None:
+        start = time.monotonic()
+        type(self._display).busy_wait(self._display)
+        self._waited(time.monotonic() - start)
+
+    async def _busy_wait_async(self) -> None:
+        start = time.monotonic()
+        await type(self._display).busy_wait_async(self._display)
+        self._waited(time.monotonic() - start)
+
+    def _waited(self, seconds: float) -> None:
+        self.busy_waits += 1
+        self.busy_time += seconds
+        self._event(BUSY, seconds)
+
+
+class _Pin:
+    """A pin that counts its changes in one of the stats counters"""
+
+    def __init__(self, pin: Any, stats: EPDStats, counter: Optional[str]) -> None:
+        self._pin = pin
+        self._stats = stats
+        self._counter = counter
+
+    @property
+    def value(self) -> bool:
+        """The pin level"""
+        return self._pin.value
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        if value != self._pin.value:
+            setattr(self._stats, self._counter, getattr(self._stats, self._counter) + 1)
+        self._pin.value = value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pin, name)
+
+
+class _BusyPin(_Pin):
+    """A busy pin that counts its reads"""
+
+    @property
+    def value(self) -> bool:
+        """The pin level"""
+        self._stats.busy_polls += 1
+        return self._pin.value
+
+
+class _SPI:
+    """An SPI bus that counts and times its transfers. Bytes sent with the panel
+    selected are commands while DC is low and data while it is high, the rest are
+    SRAM traffic. Data streamed from the SRAM straight to the panel counts as both"""
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self, spi: Any, stats: EPDStats, panel_cs: Any, dc: Any, sram_cs: Any
+    ) -> None:
+        self._spi = spi
+        self._stats = stats
+        self._panel_cs = panel_cs
+        self._dc = dc
+        self._sram_cs = sram_cs
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._spi, name)
+
+    def try_lock(self) -> bool:
+        """Lock the bus, counting failed attempts"""
+        stats = self._stats
+        if self._spi.try_lock():
+            stats.locks += 1
+            return True
+        stats.lock_spins += 1
+        stats._event(LOCK_SPIN, None)
+        return False
+
+    def _count(self, buffer: Any, start: int, end: Optional[int], seconds: float) -> None:
+        stats = self._stats
+        stats.transfers += 1
+        stats.spi_time += seconds
+        count = (len(buffer) if end is None else end) - start
+        if self._panel_cs is None or self._panel_cs.value:
+            stats.sram_bytes += count
+            stats._event(SRAM, count)
+        elif self._dc.value:
+            stats.data_bytes += count
+            stats._event(DATA, count)
+            if self._sram_cs is not None and not self._sram_cs.value:
+                stats.sram_bytes += count
+                stats._event(SRAM, count)
+        else:
+            stats.commands += count
+            for i in range(start, start + count):
+                stats._event(COMMAND, buffer[i])
+
+    def write(self, buffer: Any, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write and count ``buffer[start:end]``"""
+        begin = time.monotonic()
+        if end is None:
+            self._spi.write(buffer, start=start)
+        else:
+            self._spi.write(buffer, start=start, end=end)
+        self._count(buffer, start, end, time.monotonic() - begin)
+
+    def readinto(self, buffer: Any, *, start: int = 0, end: Optional[int] = None, **kwargs) -> None:
+        """Read and count into ``buffer[start:end]``"""
+        begin = time.monotonic()
+        if end is None:
+            self._spi.readinto(buffer, start=start, **kwargs)
+        else:
+            self._spi.readinto(buffer, start=start, end=end, **kwargs)
+        self._count(buffer, start, end, time.monotonic() - begin)
+
+    def write_readinto(self, out_buffer: Any, in_buffer: Any, **kwargs) -> None:
+        """Transfer and count ``out_buffer`` while reading ``in_buffer``"""
+        transfer = getattr(self._spi, "write_readinto", None)
+        if transfer is None:
+            raise NotImplementedError("The bus has no write_readinto()")
+        sent = out_buffer
+        start = kwargs.get("out_start", 0)
+        end = kwargs.get("out_end")
+        if self._panel_cs is not None and not self._panel_cs.value and not self._dc.value:
+            # commands are read back into the same buffer, keep what was sent
+            sent, start, end = bytes(out_buffer[start:end]), 0, None
+        begin = time.monotonic()
+        transfer(out_buffer, in_buffer, **kwargs)
+        self._count(sent, start, end, time.monotonic() - begin)
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -71,9 +72,32 @@ _UC8151D_LVSEL = const(0xE4)
 _UC8151D_TSSET = const(0xE5)
 
 
+# Sent by power_up(), from the hardware reset on
+_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.BUSY_WAIT,
+    commands.command(_UC8151D_POWER_ON),
+    commands.BUSY_WAIT,
+    commands.delay(10),
+    commands.command(_UC8151D_PANEL_SETTING, b"\x1f"),
+    commands.command(_UC8151D_CDI, b"\x97"),
+    commands.delay(50),
+)
+_POWER_DOWN_CODE = commands.compile_commands(
+    commands.command(_UC8151D_CDI, b"\xf7"),
+    commands.command(_UC8151D_POWER_OFF),
+    commands.BUSY_WAIT,
+    commands.command(_UC8151D_DEEP_SLEEP, b"\xa5"),
+)
+
+
 class Adafruit_UC8151D(Adafruit_EPD):
     """driver class for Adafruit UC8151D ePaper display breakouts"""
 
+    _refresh_settle = 0.1
+    _refresh_delay = 15
+    _max_baudrate = 10000000
+
     def __init__(
         self,
         width: int,
@@ -85,8 +109,11 @@ class Adafruit_UC8151D(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         self._buffer1_size = int(width * height / 8)
         self._buffer2_size = int(width * height / 8)
@@ -115,43 +142,17 @@ class Adafruit_UC8151D(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while not self._busy.value:
-                time.sleep(0.01)
-        else:
-            time.sleep(0.5)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        self.busy_wait()
-
-        self.command(_UC8151D_POWER_ON)
-
-        self.busy_wait()
-        time.sleep(0.01)
-
-        self.command(_UC8151D_PANEL_SETTING, bytearray([0x1F]))
-        self.command(_UC8151D_CDI, bytearray([0x97]))
-        time.sleep(0.05)
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The command list power_up() sends"""
+        return _POWER_UP_CODE
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_UC8151D_CDI, bytearray([0xF7]))
-        self.command(_UC8151D_POWER_OFF)
-        self.busy_wait()
-        self.command(_UC8151D_DEEP_SLEEP, bytearray([0xA5]))
+        self._send_command_list(_POWER_DOWN_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
         self.command(_UC8151D_DISPLAY_REFRESH)
-        time.sleep(0.1)
-        self.busy_wait()
-        if not self._busy:
-            time.sleep(15)  # wait 15 seconds
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
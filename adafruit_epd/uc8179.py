@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -49,9 +50,40 @@ _UC8179_GET_STATUS = const(0x71)
 BUSY_WAIT = const(500)  # milliseconds
 
 
+# Start of power_up(), from the hardware reset on
+_POWER_ON_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.command(
+        _UC8179_POWERSETTING,
+        bytes(
+            [
+                0x07,  # VGH=20V
+                0x07,  # VGL=-20V
+                0x3F,  # VDH=15V
+                0x3F,  # VDL=-15V
+            ]
+        ),
+    ),
+    commands.command(_UC8179_POWERON),
+    commands.delay(100),
+    commands.BUSY_WAIT,
+)
+_POWER_OFF_CODE = commands.compile_commands(
+    commands.command(_UC8179_POWEROFF),
+    commands.BUSY_WAIT,
+)
+_DEEP_SLEEP_CODE = commands.command(_UC8179_DEEPSLEEP, b"\x05")
+
+
 class Adafruit_UC8179(Adafruit_EPD):
     """driver class for Adafruit UC8179 ePaper display breakouts"""
 
+    _busy_poll = 0.1
+    _busy_delay = BUSY_WAIT / 1000.0
+    _busy_settle = 0.2
+    _refresh_settle = 0.1
+    _max_baudrate = 10000000
+
     def __init__(
         self,
         width: int,
@@ -64,12 +96,15 @@ class Adafruit_UC8179(Adafruit_EPD):
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
         tri_color: bool = False,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
         # Adjust height to be divisible by 8 (direct from Arduino)
         if (height % 8) != 0:
             height += 8 - (height % 8)
 
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         # Store whether this is a tricolor display
         self._tri_color = tri_color
@@ -123,91 +158,57 @@ class Adafruit_UC8179(Adafruit_EPD):
             self.hardware_reset()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            # Wait for busy pin to go HIGH
-            while not self._busy.value:
-                self.command(_UC8179_GET_STATUS)
-                time.sleep(0.1)
-        else:
-            # No busy pin, just wait
-            time.sleep(BUSY_WAIT / 1000.0)
-        # Additional delay after busy signal
-        time.sleep(0.2)
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-
-        # Power setting
-        self.command(
-            _UC8179_POWERSETTING,
-            bytearray(
-                [
-                    0x07,  # VGH=20V
-                    0x07,  # VGL=-20V
-                    0x3F,  # VDH=15V
-                    0x3F,  # VDL=-15V
-                ]
-            ),
-        )
-
-        # Power on
-        self.command(_UC8179_POWERON)
-        time.sleep(0.1)  # 100ms delay
-        self.busy_wait()
-
-        # Panel setting - different for tricolor vs monochrome
+    def _power_up_commands(self) -> bytes:
+        """The command list power_up() sends"""
         if self._tri_color:
             # Tricolor display: 0b000111 (0x07) - Tricolor OTP LUT
-            self.command(_UC8179_PANELSETTING, bytearray([0b001111]))
+            panel_setting = b"\x0f"
+            # Tricolor VCOM setting
+            vcom = b"\x90\x07"
         else:
             # Monochrome display: 0b010111 (0x17) - BW OTP LUT
-            self.command(_UC8179_PANELSETTING, bytearray([0b011111]))
-
-        # Resolution setting
-        self.command(
-            _UC8179_TRES,
-            bytearray(
-                [self._width >> 8, self._width & 0xFF, self._height >> 8, self._height & 0xFF]
+            panel_setting = b"\x1f"
+            # Monochrome VCOM setting
+            vcom = b"\x10\x07"
+        return commands.compile_commands(
+            # Power setting and power on
+            _POWER_ON_CODE,
+            # Panel setting - different for tricolor vs monochrome
+            commands.command(_UC8179_PANELSETTING, panel_setting),
+            # Resolution setting
+            commands.command(
+                _UC8179_TRES,
+                bytes(
+                    [self._width >> 8, self._width & 0xFF, self._height >> 8, self._height & 0xFF]
+                ),
             ),
+            # Dual SPI setting
+            commands.command(_UC8179_DUALSPI, b"\x00"),
+            # VCOM setting - different for tricolor
+            commands.command(_UC8179_WRITE_VCOM, vcom),
+            # TCON setting
+            commands.command(_UC8179_TCON, b"\x22"),
         )
 
-        # Dual SPI setting
-        self.command(_UC8179_DUALSPI, bytearray([0x00]))
-
-        # VCOM setting - different for tricolor
-        if self._tri_color:
-            # Tricolor VCOM setting
-            self.command(_UC8179_WRITE_VCOM, bytearray([0x90, 0x07]))
-        else:
-            # Monochrome VCOM setting
-            self.command(_UC8179_WRITE_VCOM, bytearray([0x10, 0x07]))
-
-        # TCON setting
-        self.command(_UC8179_TCON, bytearray([0x22]))
-
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_UC8179_POWEROFF)
-        self.busy_wait()
+        self._send_command_list(_POWER_OFF_CODE)
 
         # Only deep sleep if we have a reset pin to wake it up
         if self._rst:
-            self.command(_UC8179_DEEPSLEEP, bytearray([0x05]))
-        time.sleep(0.1)
+            self._send_command_list(_DEEP_SLEEP_CODE)
+        self._sleep(0.1)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_UC8179_DISPLAYREFRESH)
-        time.sleep(0.1)  # 100ms delay
-        self.busy_wait()
+    def _poll_busy(self) -> None:
+        self.command(_UC8179_GET_STATUS)
 
-        if not self._busy:
-            # If no busy pin, use default refresh delay
-            time.sleep(self.default_refresh_delay)
+    @property
+    def _refresh_delay(self) -> float:
+        return self.default_refresh_delay
+
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self.command(_UC8179_DISPLAYREFRESH)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -14,6 +14,7 @@ import time
 import adafruit_framebuf
 from micropython import const
 
+from adafruit_epd import commands
 from adafruit_epd.epd import Adafruit_EPD
 
 try:
@@ -43,9 +44,51 @@ _UC8253_GET_STATUS = const(0x71)
 _BUSY_WAIT = const(500)
 
 
+# Sent by power_up(), from the hardware reset on
+_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    # Default initialization sequence
+    commands.command(_UC8253_POWERON),
+    commands.BUSY_WAIT,
+    # Panel settings with default values
+    commands.command(_UC8253_PANELSETTING, b"\xcf\x8d"),
+    commands.BUSY_WAIT,
+)
+# The monochrome and tricolor panels' replacements for _POWER_UP_CODE
+_MONO_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.command(_UC8253_POWERON),
+    commands.delay(50),
+    # VCOM CDI setting for monochrome
+    commands.command(_UC8253_VCOM_CDI, b"\x97"),
+    # Panel settings for monochrome: 0b11011111 = 0xDF
+    commands.command(_UC8253_PANELSETTING, b"\xdf\x8d"),
+    commands.BUSY_WAIT,
+)
+_TRICOLOR_POWER_UP_CODE = commands.compile_commands(
+    commands.HARDWARE_RESET,
+    commands.command(_UC8253_POWERON),
+    commands.delay(50),
+    # Panel settings for tricolor: 0b11001111 = 0xCF
+    commands.command(_UC8253_PANELSETTING, b"\xcf\x8d"),
+    commands.BUSY_WAIT,
+)
+_POWER_OFF_CODE = commands.compile_commands(
+    commands.command(_UC8253_POWEROFF),
+    commands.BUSY_WAIT,
+)
+_DEEP_SLEEP_CODE = commands.command(_UC8253_DEEPSLEEP, b"\xa5")
+
+
 class Adafruit_UC8253(Adafruit_EPD):
     """Base driver class for Adafruit UC8253 ePaper display breakouts"""
 
+    _busy_poll = 0.05
+    _busy_delay = _BUSY_WAIT / 1000.0
+    _refresh_settle = 0.1
+    _refresh_delay = 1.0
+    _max_baudrate = 10000000
+
     def __init__(
         self,
         width: int,
@@ -57,10 +100,16 @@ class Adafruit_UC8253(Adafruit_EPD):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
-        super().__init__(width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin)
+        super().__init__(
+            width, height, spi, cs_pin, dc_pin, sramcs_pin, rst_pin, busy_pin, baudrate=baudrate
+        )
 
         self._single_byte_tx = True
+        # Commands need CS toggled per byte, RAM data is taken in bursts with CS held
+        # low like the UC8151D and UC8179
+        self._ram_tx_mode = Adafruit_EPD.TX_ROW
 
         stride = height
         if stride % 8 != 0:
@@ -99,44 +148,24 @@ class Adafruit_UC8253(Adafruit_EPD):
         self.power_up()
         self.power_down()
 
-    def busy_wait(self) -> None:
-        """Wait for display to be done with current task, either by polling the
-        busy pin, or pausing"""
-        if self._busy:
-            while not self._busy.value:  # UC8253 waits for busy HIGH
-                self.command(_UC8253_GET_STATUS)
-                time.sleep(0.05)
-        else:
-            time.sleep(_BUSY_WAIT / 1000.0)  # Convert ms to seconds
-
-    def power_up(self) -> None:
-        """Power up the display in preparation for writing RAM and updating"""
-        self.hardware_reset()
-        # Default initialization sequence
-        self.command(_UC8253_POWERON)
-        self.busy_wait()
-        # Panel settings with default values
-        self.command(_UC8253_PANELSETTING, bytearray([0xCF, 0x8D]))
-        self.busy_wait()
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The command list power_up() sends"""
+        return _POWER_UP_CODE
 
     def power_down(self) -> None:
         """Power down the display - required when not actively displaying!"""
-        self.command(_UC8253_POWEROFF)
-        self.busy_wait()
-        time.sleep(1.0)
+        self._send_command_list(_POWER_OFF_CODE)
+        self._sleep(1.0)
 
         if self._rst:
-            self.command(_UC8253_DEEPSLEEP, bytearray([0xA5]))
+            self._send_command_list(_DEEP_SLEEP_CODE)
 
-    def update(self) -> None:
-        """Update the display from internal memory"""
-        self.command(_UC8253_DISPLAYREFRESH)
-        time.sleep(0.1)
-        self.busy_wait()
+    def _poll_busy(self) -> None:
+        self.command(_UC8253_GET_STATUS)
 
-        if not self._busy:
-            refresh_delay = getattr(self, "_refresh_delay", 1.0)
-            time.sleep(refresh_delay)
+    def _start_update(self, partial: bool) -> None:
+        """Start a refresh of the display from internal memory"""
+        self.command(_UC8253_DISPLAYREFRESH)
 
     def write_ram(self, index: Literal[0, 1]) -> int:
         """Send the one byte command for starting the RAM write process. Returns
@@ -169,6 +198,7 @@ class Adafruit_UC8253_Mono(Adafruit_UC8253):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
         super().__init__(
             width,
@@ -179,6 +209,7 @@ class Adafruit_UC8253_Mono(Adafruit_UC8253):
             sramcs_pin=sramcs_pin,
             rst_pin=rst_pin,
             busy_pin=busy_pin,
+            baudrate=baudrate,
         )
         # Set refresh delay for monochrome
         self._refresh_delay = 1.0  # 1000ms
@@ -191,21 +222,9 @@ class Adafruit_UC8253_Mono(Adafruit_UC8253):
         self.set_color_buffer(1, True)
         self.set_black_buffer(1, True)
 
-    def power_up(self) -> None:
-        """Power up the monochrome display with specific initialization"""
-        self.hardware_reset()
-
-        # Soft reset sequence
-        self.command(_UC8253_POWERON)
-        time.sleep(0.05)  # 50ms busy wait
-
-        # VCOM CDI setting for monochrome
-        self.command(_UC8253_VCOM_CDI, bytearray([0x97]))
-
-        # Panel settings for monochrome: 0b11011111 = 0xDF
-        self.command(_UC8253_PANELSETTING, bytearray([0xDF, 0x8D]))
-
-        self.busy_wait()
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The monochrome power up"""
+        return _MONO_POWER_UP_CODE
 
 
 class Adafruit_UC8253_Tricolor(Adafruit_UC8253):
@@ -222,6 +241,7 @@ class Adafruit_UC8253_Tricolor(Adafruit_UC8253):
         sramcs_pin: DigitalInOut,
         rst_pin: DigitalInOut,
         busy_pin: DigitalInOut,
+        baudrate: typing.Optional[int] = None,
     ) -> None:
         super().__init__(
             width,
@@ -232,6 +252,7 @@ class Adafruit_UC8253_Tricolor(Adafruit_UC8253):
             sramcs_pin=sramcs_pin,
             rst_pin=rst_pin,
             busy_pin=busy_pin,
+            baudrate=baudrate,
         )
         # Set refresh delay for tricolor
         self._refresh_delay = 13.0  # 13000ms
@@ -244,15 +265,6 @@ class Adafruit_UC8253_Tricolor(Adafruit_UC8253):
         self.set_color_buffer(0, True)  # Red/color buffer in RAM1, inverted
         self.set_black_buffer(1, False)  # Black buffer in RAM2, not inverted
 
-    def power_up(self) -> None:
-        """Power up the tricolor display with specific initialization"""
-        self.hardware_reset()
-
-        # Soft reset sequence
-        self.command(_UC8253_POWERON)
-        time.sleep(0.05)  # 50ms busy wait
-
-        # Panel settings for tricolor: 0b11001111 = 0xCF
-        self.command(_UC8253_PANELSETTING, bytearray([0xCF, 0x8D]))
-
-        self.busy_wait()
+    def _power_up_commands(self) -> bytes:  # noqa: PLR6301
+        """The tricolor power up"""
+        return _TRICOLOR_POWER_UP_CODE
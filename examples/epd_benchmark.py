@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark every driver on the simulated bus from tests/simulator.py, under
+CPython with no hardware attached. Times fill, pixel, fill_rect, line, text, image
+(RGB and L, when Pillow is installed) and display() at each driver's panel size,
+with and without SRAM, and reports ops/sec, SPI bytes, transfers, bus locks and
+peak memory. Results are saved as JSON, and can be compared with an earlier run:
+
+    python epd_benchmark.py --output new.json --compare old.json
+
+Sleeps in the drivers are skipped, so the times are the host's work only.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from adafruit_epd.ek79686 import Adafruit_EK79686
+from adafruit_epd.il0373 import Adafruit_IL0373
+from adafruit_epd.il0398 import Adafruit_IL0398
+from adafruit_epd.il91874 import Adafruit_IL91874
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.jd79667 import Adafruit_JD79667
+from adafruit_epd.ssd1608 import Adafruit_SSD1608
+from adafruit_epd.ssd1675 import Adafruit_SSD1675
+from adafruit_epd.ssd1675b import Adafruit_SSD1675B
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1680_legacy import Adafruit_SSD1680_Legacy
+from adafruit_epd.ssd1680b import Adafruit_SSD1680B
+from adafruit_epd.ssd1681 import Adafruit_SSD1681
+from adafruit_epd.ssd1683 import Adafruit_SSD1683
+from adafruit_epd.uc8151d import Adafruit_UC8151D
+from adafruit_epd.uc8179 import Adafruit_UC8179
+from adafruit_epd.uc8253 import Adafruit_UC8253
+
+# the simulator is a host only test double, kept with the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests"))
+import simulator  # noqa: E402
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Each driver at the size of the panel it is used with
+DRIVERS = (
+    (Adafruit_EK79686, 176, 264),
+    (Adafruit_IL0373, 152, 152),
+    (Adafruit_IL0398, 400, 300),
+    (Adafruit_IL91874, 176, 264),
+    (Adafruit_JD79661, 122, 150),
+    (Adafruit_JD79667, 122, 150),
+    (Adafruit_SSD1608, 200, 200),
+    (Adafruit_SSD1675, 122, 250),
+    (Adafruit_SSD1675B, 122, 250),
+    (Adafruit_SSD1680, 122, 250),
+    (Adafruit_SSD1680_Legacy, 122, 250),
+    (Adafruit_SSD1680B, 122, 250),
+    (Adafruit_SSD1681, 200, 200),
+    (Adafruit_SSD1683, 400, 300),
+    (Adafruit_UC8151D, 128, 296),
+    (Adafruit_UC8179, 648, 480),
+    (Adafruit_UC8253, 240, 416),
+)
+
+FONT = "font5x8.bin"
+
+
+def make_ops(display, count):
+    """The benchmarked operations as (name, calls, function) tuples"""
+    rnd = random.Random(0)
+    width, height = display.width, display.height
+    black = display.BLACK
+    points = [(rnd.randrange(width), rnd.randrange(height)) for _ in range(count)]
+    rects = [
+        (rnd.randrange(width), rnd.randrange(height), rnd.randrange(1, 60), rnd.randrange(1, 60))
+        for _ in range(count)
+    ]
+
+    def pixel():
+        for x, y in points:
+            display.pixel(x, y, black)
+
+    def fill_rect():
+        for x, y, w, h in rects:
+            display.fill_rect(x, y, w, h, black)
+
+    def line():
+        for x, y, w, h in rects:
+            display.line(x, y, x + w, y + h, black)
+
+    def text():
+        for x, y, _, _ in rects:
+            display.text("EPD", x, y, black, font_name=FONT)
+
+    ops = [
+        ("fill", 1, lambda: display.fill(display.WHITE)),
+        ("pixel", count, pixel),
+        ("fill_rect", count, fill_rect),
+        ("line", count, line),
+        ("text", count, text),
+    ]
+    if Image is not None and not display.sram:
+        for mode, color in (("RGB", (255, 0, 0)), ("L", 128)):
+            image = Image.new(mode, (width, height), color)
+            ops.append((f"image_{mode}", 1, lambda image=image: display.image(image)))
+    ops.append(("display", 1, display.display))
+    return ops
+
+
+def measure(spi, calls, function, repeat):
+    """Time a function, then run it once more under tracemalloc for its peak memory"""
+    spi.reset_stats()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    elapsed = time.perf_counter() - start
+    result = {
+        "ops_per_sec": calls * repeat / elapsed if elapsed else None,
+        "seconds": elapsed / repeat,
+        "spi_bytes": spi.bytes // repeat,
+        "spi_transfers": spi.transfers // repeat,
+        "spi_locks": spi.locks // repeat,
+        "bus_seconds": spi.bus_time / repeat,
+    }
+    tracemalloc.start()
+    function()
+    result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def run(names, count, repeat):
+    """Benchmark the drivers, returning the results keyed by driver, SRAM use and op"""
+    results = {}
+    for driver, width, height in DRIVERS:
+        if names and driver.__name__ not in names:
+            continue
+        for sram in (False, True):
+            key = f"{driver.__name__}/{width}x{height}/{'sram' if sram else 'ram'}"
+            display, _, spi = simulator.simulate(driver, width, height, sram=sram, busy=False)
+            results[key] = entry = {}
+            for name, calls, function in make_ops(display, count):
+                try:
+                    entry[name] = measure(spi, calls, function, repeat)
+                except (OSError, RuntimeError, ValueError) as error:
+                    entry[name] = {"error": str(error)}
+            print(key)
+            for name, stats in entry.items():
+                if "error" in stats:
+                    print(f"  {name:10} {stats['error']}")
+                else:
+                    print(
+                        f"  {name:10} {stats['ops_per_sec']:12.1f} ops/s"
+                        f" {stats['spi_bytes']:8} B {stats['spi_transfers']:7} xfers"
+                        f" {stats['spi_locks']:5} locks {stats['peak_bytes']:8} B peak"
+                    )
+    return results
+
+
+def compare(results, baseline):
+    """Print the change in ops/sec against an earlier run"""
+    print("ops/sec against the baseline")
+    for key, entry in results.items():
+        for name, stats in entry.items():
+            old = baseline.get(key, {}).get(name, {})
+            if stats.get("ops_per_sec") and old.get("ops_per_sec"):
+                ratio = stats["ops_per_sec"] / old["ops_per_sec"]
+                print(f"  {key:42} {name:10} {ratio:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("drivers", nargs="*", help="driver class names, default all")
+    parser.add_argument("--count", type=int, default=200, help="calls per drawing op")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each op")
+    parser.add_argument("--output", default="epd_benchmark.json", help="JSON results file")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    # only the host's work is timed, the drivers' waits are skipped
+    time.sleep = lambda seconds: None
+    results = run(set(args.drivers), args.count, args.repeat)
+    with open(args.output, "w") as stream:
+        json.dump(
+            {
+                "python": sys.version,
+                "platform": platform.platform(),
+                "count": args.count,
+                "repeat": args.repeat,
+                "results": results,
+            },
+            stream,
+            indent=1,
+        )
+    if args.compare:
+        with open(args.compare) as stream:
+            compare(results, json.load(stream)["results"])
+
+
+main()
@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Fixtures shared by the tests"""
+
+import pytest
+
+from adafruit_epd import glyphs
+
+
+@pytest.fixture
+def font_name(tmp_path):
+    """A 5x8 font in the adafruit_framebuf format with a different pattern per character"""
+    path = tmp_path / "font5x8.bin"
+    columns = bytes((code * 7 + col * 29 + 1) & 0xFF for code in range(256) for col in range(5))
+    path.write_bytes(bytes((5, 8)) + columns)
+    yield str(path)
+    glyphs._fonts.pop(str(path)).deinit()
@@ -0,0 +1,636 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`simulator` - Adafruit EPD - simulated SPI bus and pins
+====================================================================================
+Stand-ins for ``busio.SPI`` and ``digitalio.DigitalInOut`` that the display drivers
+and Adafruit_MCP_SRAM take unchanged, so they can run without hardware. The bus
+records what it sends and passes it to a simulated MCP23K SRAM and a model of the
+panel controller's RAM, which can be decoded back into pixels afterwards. Host only,
+it lives with the tests so it isn't bundled with the library
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from micropython import const
+
+try:
+    """Needed for type annotations"""
+    from typing import Any, Callable, List, Optional, Tuple
+
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_EPD.git"
+
+# Panel controller command sets
+SSD16XX = "ssd16xx"
+UC81XX = "uc81xx"
+JD796XX = "jd796xx"
+
+_SRAM_READ = const(0x03)
+_SRAM_WRITE = const(0x02)
+_SRAM_RDSR = const(0x05)
+_SRAM_WRSR = const(0x01)
+_SRAM_MODE_MASK = const(0xC0)
+_SRAM_PAGE_MODE = const(0x80)
+_SRAM_SEQUENTIAL_MODE = const(0x40)
+_SRAM_PAGE_SIZE = const(32)
+
+_SSD_DATA_MODE = const(0x11)
+_SSD_SW_RESET = const(0x12)
+_SSD_MASTER_ACTIVATE = const(0x20)
+_SSD_SET_RAMXPOS = const(0x44)
+_SSD_SET_RAMYPOS = const(0x45)
+_SSD_SET_RAMXCOUNT = const(0x4E)
+_SSD_SET_RAMYCOUNT = const(0x4F)
+_SSD_READ_RAM_OPT = const(0x41)
+# RAM read commands, 0x25 on the SSD1608
+_SSD_READ_RAM = (0x25, 0x27)
+
+_UC_POWER_ON = const(0x04)
+_UC_DISPLAY_REFRESH = const(0x12)
+
+# RAM write commands of each command set, in RAM index order
+_RAM_COMMANDS = {
+    SSD16XX: (0x24, 0x26),
+    UC81XX: (0x10, 0x13),
+    JD796XX: (0x10,),
+}
+
+
+class SimulatedPin:
+    """A stand-in for ``digitalio.DigitalInOut``. Simulated devices watch the pins
+    they are wired to"""
+
+    def __init__(self, name: str = "", value: bool = False) -> None:
+        self.name = name
+        self.direction = None
+        self.pull = None
+        self.drive_mode = None
+        self._value = bool(value)
+        self._watchers = []
+
+    @property
+    def value(self) -> bool:
+        """The pin level"""
+        return self._value
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        value = bool(value)
+        if value != self._value:
+            self._value = value
+            for watcher in self._watchers:
+                watcher(value)
+
+    def watch(self, callback: Callable[[bool], None]) -> None:
+        """Call ``callback(value)`` whenever the pin level changes"""
+        self._watchers.append(callback)
+
+    def switch_to_output(self, value: bool = False, drive_mode: Any = None) -> None:
+        """Make the pin an output at ``value``"""
+        self.direction = "output"
+        self.drive_mode = drive_mode
+        self.value = value
+
+    def switch_to_input(self, pull: Any = None) -> None:
+        """Make the pin an input"""
+        self.direction = "input"
+        self.pull = pull
+
+    def deinit(self) -> None:
+        """Release the pin, nothing to do here"""
+
+
+class _BusyPin(SimulatedPin):
+    """The busy output of a SimulatedPanel"""
+
+    def __init__(self, panel: "SimulatedPanel", level: bool) -> None:
+        super().__init__("busy", not level)
+        self._panel = panel
+        self._level = level
+
+    @property
+    def value(self) -> bool:
+        """The pin level, ``level`` while the panel is busy"""
+        return self._level if self._panel.busy else not self._level
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        pass
+
+    def wait_for(self, value: bool, timeout: Optional[float]) -> bool:
+        """Sleep until the pin reads ``value``, as a pin with edge events would.
+        Only the end of a busy period is an edge to wait for"""
+        if self._panel.busy and value != self._level:
+            left = self._panel._busy_until - time.monotonic()
+            time.sleep(left if timeout is None else max(min(left, timeout), 0))
+        return self.value == value
+
+
+class SimulatedSPI:
+    """A stand-in for ``busio.SPI``. Each transfer goes to every attached device whose
+    CS pin is low, and is counted. With ``record``, the names of the selected devices
+    and the bytes sent are kept in ``log`` for each transfer.
+
+    ``bus_time`` adds up the seconds the transfers would take on the wire at the
+    configured baudrate"""
+
+    def __init__(self, *, record: bool = False) -> None:
+        self.devices = []
+        self.log = [] if record else None
+        self.baudrate = 100000
+        self.polarity = self.phase = 0
+        self.locks = 0
+        self.transfers = 0
+        self.bytes = 0
+        self.bus_time = 0.0
+        self._locked = False
+
+    @property
+    def frequency(self) -> int:
+        """The configured baudrate"""
+        return self.baudrate
+
+    def attach(self, device: Any) -> None:
+        """Wire a simulated device to the bus"""
+        self.devices.append(device)
+
+    def reset_stats(self) -> None:
+        """Zero the counters and clear the log"""
+        self.locks = self.transfers = self.bytes = 0
+        self.bus_time = 0.0
+        if self.log is not None:
+            self.log = []
+
+    def try_lock(self) -> bool:
+        """Lock the bus, False if it is already locked"""
+        if self._locked:
+            return False
+        self._locked = True
+        self.locks += 1
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus"""
+        self._locked = False
+
+    def configure(
+        self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ) -> None:
+        """Set the bus speed and mode"""
+        self.baudrate = baudrate
+        self.polarity = polarity
+        self.phase = phase
+
+    def _transfer(self, data: bytes) -> Optional[bytes]:
+        self.transfers += 1
+        self.bytes += len(data)
+        self.bus_time += len(data) * 8 / self.baudrate
+        selected = [device for device in self.devices if device.selected()]
+        if self.log is not None:
+            self.log.append((tuple(device.name for device in selected), data))
+        received = None
+        for device in selected:
+            reply = device.transfer(data)
+            if reply is not None:
+                received = reply
+        return received
+
+    def write(self, buffer: Any, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Send ``buffer[start:end]``"""
+        self._transfer(bytes(buffer[start:end]))
+
+    def readinto(
+        self, buffer: Any, *, start: int = 0, end: Optional[int] = None, write_value: int = 0
+    ) -> None:
+        """Read into ``buffer[start:end]`` while sending ``write_value``"""
+        end = len(buffer) if end is None else end
+        received = self._transfer(bytes((write_value,)) * (end - start))
+        buffer[start:end] = received if received is not None else bytes(end - start)
+
+    def write_readinto(  # noqa: PLR0913
+        self,
+        out_buffer: Any,
+        in_buffer: Any,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Send ``out_buffer[out_start:out_end]`` while reading as many bytes into
+        ``in_buffer[in_start:in_end]``"""
+        out_end = len(out_buffer) if out_end is None else out_end
+        in_end = len(in_buffer) if in_end is None else in_end
+        if out_end - out_start != in_end - in_start:
+            raise ValueError("buffer slices must be of equal length")
+        received = self._transfer(bytes(out_buffer[out_start:out_end]))
+        in_buffer[in_start:in_end] = received if received is not None else bytes(in_end - in_start)
+
+
+class SimulatedSRAM:
+    """A Microchip 23K256 style SPI SRAM on a SimulatedSPI, with its byte, page and
+    sequential modes. ``memory`` holds its contents"""
+
+    name = "sram"
+
+    def __init__(self, spi: SimulatedSPI, cs: SimulatedPin, size: int = 32768) -> None:
+        self.memory = bytearray(size)
+        self.status = 0
+        self._cs = cs
+        self._header = bytearray()
+        self._op = None
+        self._addr = 0
+        cs.watch(self._select)
+        spi.attach(self)
+
+    def selected(self) -> bool:
+        """Whether the chip is selected"""
+        return not self._cs.value
+
+    def _select(self, value: bool) -> None:
+        # every selection starts a new instruction
+        self._header = bytearray()
+        self._op = None
+
+    def transfer(self, data: bytes) -> bytes:
+        """Take bytes from the bus, returning the bytes clocked out at the same time"""
+        reply = bytearray(len(data))
+        i = 0
+        while i < len(data):
+            if self._op is None:
+                self._header.append(data[i])
+                i += 1
+                self._decode()
+            elif self._op == _SRAM_RDSR:
+                reply[i:] = bytes((self.status,)) * (len(data) - i)
+                break
+            elif self._op in {_SRAM_READ, _SRAM_WRITE}:
+                i = self._move(data, reply, i)
+            else:
+                break
+        return bytes(reply)
+
+    def _decode(self) -> None:
+        header = self._header
+        instruction = header[0]
+        if instruction in {_SRAM_READ, _SRAM_WRITE}:
+            if len(header) == 3:
+                self._op = instruction
+                self._addr = (header[1] << 8 | header[2]) % len(self.memory)
+        elif instruction == _SRAM_RDSR:
+            self._op = instruction
+        elif instruction == _SRAM_WRSR:
+            if len(header) == 2:
+                self.status = header[1]
+                self._op = "done"
+        else:
+            self._op = "done"
+
+    def _move(self, data: bytes, reply: bytearray, i: int) -> int:
+        mode = self.status & _SRAM_MODE_MASK
+        addr = self._addr
+        count = len(data) - i
+        if mode == _SRAM_SEQUENTIAL_MODE:
+            count = min(count, len(self.memory) - addr)
+        elif mode == _SRAM_PAGE_MODE:
+            count = min(count, _SRAM_PAGE_SIZE - addr % _SRAM_PAGE_SIZE)
+        else:
+            count = 1
+        if self._op == _SRAM_WRITE:
+            self.memory[addr : addr + count] = data[i : i + count]
+        else:
+            reply[i : i + count] = self.memory[addr : addr + count]
+        addr += count
+        if mode == _SRAM_PAGE_MODE and not addr % _SRAM_PAGE_SIZE:
+            addr -= _SRAM_PAGE_SIZE
+        elif mode not in {_SRAM_PAGE_MODE, _SRAM_SEQUENTIAL_MODE}:
+            self._op = "done"
+        self._addr = addr % len(self.memory)
+        return i + count
+
+
+class SimulatedPanel:
+    """The RAM of an EPD controller on a SimulatedSPI, for the ``SSD16XX``,
+    ``UC81XX`` or ``JD796XX`` command set. Data after a RAM write command is stored
+    as the controller would, the SSD16xx address counters, windows and data entry
+    mode included. ``ram`` holds one plane per RAM write command, rows of ``stride``
+    bytes. SSD16xx RAM reads return the plane picked by the read RAM option, after
+    a dummy byte. RAM data sent while the bus is clocked above ``max_baudrate``
+    arrives garbled.
+
+    Refresh and power on commands hold ``busy_pin`` at ``busy_level`` for
+    ``refresh_time`` and ``power_time`` seconds. ``commands`` counts the commands
+    received, ``refreshes`` the refreshes started"""
+
+    name = "panel"
+
+    def __init__(  # noqa: PLR0913
+        self,
+        spi: SimulatedSPI,
+        cs: SimulatedPin,
+        dc: SimulatedPin,
+        width: int,
+        height: int,
+        *,
+        family: str = SSD16XX,
+        busy_level: Optional[bool] = None,
+        refresh_time: float = 0.0,
+        power_time: float = 0.0,
+        max_baudrate: Optional[int] = None,
+    ) -> None:
+        if family not in _RAM_COMMANDS:
+            raise ValueError(f"Unknown command set {family}")
+        self.family = family
+        self.width = width
+        self.height = height
+        self.bpp = 2 if family == JD796XX else 1
+        self.stride = (width + 7) // 8 * self.bpp
+        self.ram = [bytearray(self.stride * height) for _ in _RAM_COMMANDS[family]]
+        self.refresh_time = refresh_time
+        self.power_time = power_time
+        self.max_baudrate = max_baudrate
+        self.commands = {}
+        self.refreshes = 0
+        if busy_level is None:
+            busy_level = family == SSD16XX
+        self.busy_pin = _BusyPin(self, busy_level)
+        self._cs = cs
+        self._dc = dc
+        self._busy_until = 0.0
+        self._command = None
+        self._params = bytearray()
+        self._plane = None
+        self._pos = 0
+        self._read_plane = None
+        self._read_option = 0
+        self._dummy = False
+        self._spi = spi
+        self._reset_counters()
+        spi.attach(self)
+
+    @property
+    def busy(self) -> bool:
+        """Whether the controller is still refreshing or powering on"""
+        return time.monotonic() < self._busy_until
+
+    def selected(self) -> bool:
+        """Whether the controller is selected"""
+        return not self._cs.value
+
+    def transfer(self, data: bytes) -> Optional[bytes]:
+        """Take bytes from the bus, as commands while DC is low and data when high.
+        Returns the bytes read during a RAM read"""
+        if not self._dc.value:
+            for cmd in data:
+                self._begin(cmd)
+        elif self._plane is not None:
+            if self.max_baudrate is not None and self._spi.baudrate > self.max_baudrate:
+                # the clock outran the controller, every bit landed one place over
+                data = bytes((value << 1 | value >> 7) & 0xFF for value in data)
+            self._write_ram(data)
+        elif self._read_plane is not None:
+            return self._read_ram(len(data))
+        elif self._command is not None:
+            self._params.extend(data)
+            if self.family == SSD16XX:
+                self._ssd_params()
+        return None
+
+    def pixel(self, x: int, y: int, ram: int = 0) -> int:
+        """The bits stored for pixel (x, y) in a RAM plane, MSB first"""
+        bit = x * self.bpp
+        byte = self.ram[ram][y * self.stride + bit // 8]
+        return byte >> (8 - self.bpp - bit % 8) & ((1 << self.bpp) - 1)
+
+    def pixels(self, ram: int = 0) -> List[List[int]]:
+        """Decode a RAM plane into rows of pixel values"""
+        return [[self.pixel(x, y, ram) for x in range(self.width)] for y in range(self.height)]
+
+    def _reset_counters(self) -> None:
+        self._entry = 0x03
+        self._x_window = (0, self.stride - 1)
+        self._y_window = (0, self.height - 1)
+        self._x = self._y = 0
+
+    def _begin(self, cmd: int) -> None:
+        self.commands[cmd] = self.commands.get(cmd, 0) + 1
+        self._command = cmd
+        self._params = bytearray()
+        self._plane = self._read_plane = None
+        ram_commands = _RAM_COMMANDS[self.family]
+        if cmd in ram_commands:
+            self._plane = self.ram[ram_commands.index(cmd)]
+            self._pos = 0
+        elif self.family == SSD16XX:
+            if cmd in _SSD_READ_RAM:
+                self._read_plane = self.ram[min(self._read_option, len(self.ram) - 1)]
+                self._dummy = True
+            elif cmd == _SSD_SW_RESET:
+                self._reset_counters()
+            elif cmd == _SSD_MASTER_ACTIVATE:
+                self._busy_for(self.refresh_time)
+                self.refreshes += 1
+        elif cmd == _UC_DISPLAY_REFRESH:
+            self._busy_for(self.refresh_time)
+            self.refreshes += 1
+        elif cmd == _UC_POWER_ON:
+            self._busy_for(self.power_time)
+
+    def _busy_for(self, seconds: float) -> None:
+        self._busy_until = time.monotonic() + seconds
+
+    def _ssd_params(self) -> None:
+        params = self._params
+        cmd = self._command
+        if cmd == _SSD_DATA_MODE:
+            self._entry = params[0]
+        elif cmd == _SSD_SET_RAMXPOS and len(params) >= 2:
+            self._x_window = (min(params[0], params[1]), max(params[0], params[1]))
+        elif cmd == _SSD_SET_RAMYPOS and len(params) >= 4:
+            start = params[0] | params[1] << 8
+            end = params[2] | params[3] << 8
+            self._y_window = (min(start, end), max(start, end))
+        elif cmd == _SSD_READ_RAM_OPT:
+            self._read_option = params[0] & 0x01
+        elif cmd == _SSD_SET_RAMXCOUNT:
+            self._x = params[0]
+        elif cmd == _SSD_SET_RAMYCOUNT:
+            self._y = params[0] | (params[1] << 8 if len(params) > 1 else 0)
+
+    def _write_ram(self, data: bytes) -> None:
+        plane = self._plane
+        if self.family != SSD16XX:
+            # written in order from the start of the plane
+            count = min(len(data), len(plane) - self._pos)
+            plane[self._pos : self._pos + count] = data[:count]
+            self._pos += count
+            return
+        if self._entry & 0x07 == 0x03:
+            # x then y, both incrementing: a run to the end of the window row at a time
+            pos = 0
+            x_start, x_end = self._x_window
+            while pos < len(data):
+                count = min(len(data) - pos, x_end - self._x + 1)
+                if count <= 0:
+                    count = 1
+                else:
+                    self._store(plane, self._x, self._y, data[pos : pos + count])
+                pos += count
+                self._x += count
+                if self._x > x_end:
+                    self._x = x_start
+                    self._step_y(1)
+            return
+        for value in data:
+            self._store(plane, self._x, self._y, bytes((value,)))
+            self._advance()
+
+    def _read_ram(self, count: int) -> bytes:
+        data = bytearray(count)
+        start = 0
+        if self._dummy:
+            self._dummy = False
+            start = 1
+        for i in range(start, count):
+            if 0 <= self._y < self.height and 0 <= self._x < self.stride:
+                data[i] = self._read_plane[self._y * self.stride + self._x]
+            self._advance()
+        return bytes(data)
+
+    def _store(self, plane: bytearray, x: int, y: int, data: bytes) -> None:
+        # bytes outside the panel's RAM are dropped
+        if 0 <= y < self.height and 0 <= x < self.stride:
+            start = y * self.stride + x
+            count = min(len(data), self.stride - x)
+            plane[start : start + count] = data[:count]
+
+    def _step_y(self, step: int) -> None:
+        y_start, y_end = self._y_window
+        self._y += step
+        if self._y > y_end:
+            self._y = y_start
+        elif self._y < y_start:
+            self._y = y_end
+
+    def _advance(self) -> None:
+        x_step = 1 if self._entry & 0x01 else -1
+        y_step = 1 if self._entry & 0x02 else -1
+        x_start, x_end = self._x_window
+        if self._entry & 0x04:
+            # y first
+            y_start, y_end = self._y_window
+            self._y += y_step
+            if y_start <= self._y <= y_end:
+                return
+            self._y = y_start if y_step > 0 else y_end
+            self._x += x_step
+            if self._x > x_end:
+                self._x = x_start
+            elif self._x < x_start:
+                self._x = x_end
+            return
+        self._x += x_step
+        if x_start <= self._x <= x_end:
+            return
+        self._x = x_start if x_step > 0 else x_end
+        self._step_y(y_step)
+
+
+class CommandLog:
+    """Records what a SimulatedPanel is sent, in order. ``packets`` holds a
+    [command, data] pair per command, ``writes`` a (command, length) pair per
+    transfer of data"""
+
+    name = "log"
+
+    def __init__(self, panel: SimulatedPanel) -> None:
+        self.packets = []
+        self.writes = []
+        self._panel = panel
+        panel._spi.attach(self)
+
+    def selected(self) -> bool:
+        """Whether the panel is selected"""
+        return self._panel.selected()
+
+    def transfer(self, data: bytes) -> None:
+        """Take bytes from the bus as the panel does"""
+        if not self._panel._dc.value:
+            self.packets.extend([cmd, bytearray()] for cmd in data)
+        elif self.packets:
+            self.packets[-1][1].extend(data)
+            self.writes.append((self.packets[-1][0], len(data)))
+
+    def sent(self) -> List[int]:
+        """The commands sent"""
+        return [cmd for cmd, _ in self.packets]
+
+    def data(self, cmd: int) -> List[bytes]:
+        """The data sent with each ``cmd``"""
+        return [bytes(data) for command, data in self.packets if command == cmd]
+
+    def transfers(self, cmd: int) -> List[int]:
+        """The length of each transfer of data for ``cmd``"""
+        return [length for command, length in self.writes if command == cmd]
+
+
+def simulate(  # noqa: PLR0913
+    driver: type,
+    width: int,
+    height: int,
+    *,
+    sram: bool = False,
+    busy: bool = True,
+    refresh_time: float = 0.0,
+    power_time: float = 0.0,
+    record: bool = False,
+    max_baudrate: Optional[int] = None,
+) -> Tuple[Any, SimulatedPanel, SimulatedSPI]:
+    """Build a display driver class on a simulated bus, with a simulated SRAM when
+    ``sram`` is set and the panel's busy pin unless ``busy`` is False. The command
+    set is picked from the driver name. ``max_baudrate`` is the fastest clock the
+    simulated wiring takes. Returns the display, panel and bus"""
+    name = driver.__name__
+    if "SSD" in name:
+        family = SSD16XX
+    elif "JD79" in name:
+        family = JD796XX
+    else:
+        family = UC81XX
+    spi = SimulatedSPI(record=record)
+    cs_pin = SimulatedPin("cs", True)
+    dc_pin = SimulatedPin("dc")
+    panel = SimulatedPanel(
+        spi,
+        cs_pin,
+        dc_pin,
+        width,
+        height,
+        family=family,
+        busy_level=driver._busy_level,
+        refresh_time=refresh_time,
+        power_time=power_time,
+        max_baudrate=max_baudrate,
+    )
+    sramcs_pin = None
+    if sram:
+        sramcs_pin = SimulatedPin("sramcs", True)
+        SimulatedSRAM(spi, sramcs_pin)
+    display = driver(
+        width,
+        height,
+        spi,
+        cs_pin=cs_pin,
+        dc_pin=dc_pin,
+        sramcs_pin=sramcs_pin,
+        rst_pin=SimulatedPin("rst", True),
+        busy_pin=panel.busy_pin if busy else None,
+    )
+    return display, panel, spi
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""The SPI clock the panel and the SRAM are driven at"""
+
+import pytest
+from simulator import simulate
+
+from adafruit_epd.ek79686 import Adafruit_EK79686
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.uc8151d import Adafruit_UC8151D
+
+
+class _Clock:
+    """Records the bus clock of each data transfer to the panel"""
+
+    name = "clock"
+
+    def __init__(self, display, panel, spi):
+        self.rates = set()
+        self._display = display
+        self._panel = panel
+        self._spi = spi
+        spi.attach(self)
+
+    def selected(self):
+        return self._panel.selected()
+
+    def transfer(self, data):
+        if self._display._dc.value:
+            self.rates.add(self._spi.baudrate)
+
+
+@pytest.mark.parametrize(
+    ("driver", "width", "height"),
+    [(Adafruit_SSD1680, 122, 250), (Adafruit_UC8151D, 128, 296), (Adafruit_EK79686, 176, 264)],
+)
+def test_defaults_to_the_chipset_maximum(driver, width, height):
+    display, panel, spi = simulate(driver, width, height)
+    assert display.baudrate == driver._max_baudrate
+    clock = _Clock(display, panel, spi)
+    display.display()
+    assert clock.rates == {driver._max_baudrate}
+
+
+def test_baudrate_can_be_set():
+    display, panel, spi = simulate(Adafruit_SSD1680, 122, 250)
+    display.baudrate = 2000000
+    clock = _Clock(display, panel, spi)
+    display.display()
+    assert clock.rates == {2000000}
+    with pytest.raises(ValueError):
+        display.baudrate = 0
+
+
+def test_sram_streams_at_its_own_rate():
+    display, panel, spi = simulate(Adafruit_SSD1680, 122, 250, sram=True)
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(10, 10, 30, 30, Adafruit_EPD.BLACK)
+    clock = _Clock(display, panel, spi)
+    display.display()
+    # command data at the panel's clock, the buffers as the SRAM clocks them out
+    assert clock.rates == {display.baudrate, display.sram.baudrate}
+
+
+def test_calibrate_baudrate_stops_at_the_wiring_limit():
+    display, panel, _ = simulate(Adafruit_SSD1680, 122, 250, max_baudrate=4000000)
+    assert display.calibrate_baudrate([1000000, 2000000, 4000000, 8000000]) == 4000000
+    assert display.baudrate == 4000000
+    assert panel.commands[0x10] == 1  # powered down afterwards
+
+
+def test_calibrate_baudrate_keeps_the_rate_when_nothing_reads_back():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250, max_baudrate=500000)
+    with pytest.raises(RuntimeError):
+        display.calibrate_baudrate([1000000, 2000000])
+    assert display.baudrate == Adafruit_SSD1680._max_baudrate
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Streaming BMP loading, and the errors for files it can't load"""
+
+import io
+import random
+import struct
+
+import pytest
+from simulator import simulate
+
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+PALETTE = [(255, 255, 255), (0, 0, 0), (255, 0, 0), (255, 255, 0), (90, 200, 60), (20, 30, 90)]
+
+
+def _bmp(colors, width, height, depth, *, top_down=False):
+    """Encode rows of RGB colors as an uncompressed BMP. Colors of palette depths must
+    come from PALETTE"""
+    stride = (width * depth + 31) // 32 * 4
+    palette = b""
+    if depth <= 8:
+        palette = b"".join(bytes((b, g, r, 0)) for r, g, b in PALETTE[: 1 << depth])
+    rows = []
+    for row in colors:
+        data = bytearray(stride)
+        for x, rgb in enumerate(row):
+            if depth == 24:
+                data[3 * x : 3 * x + 3] = bytes(reversed(rgb))
+            else:
+                bit = x * depth
+                data[bit >> 3] |= PALETTE.index(rgb) << (8 - depth - (bit & 7))
+        rows.append(bytes(data))
+    if not top_down:
+        rows.reverse()
+    offset = 54 + len(palette)
+    header = b"BM" + struct.pack("<IHHI", offset + stride * height, 0, 0, offset)
+    header += struct.pack(
+        "<IiiHHIIiiII",
+        40,
+        width,
+        -height if top_down else height,
+        1,
+        depth,
+        0,
+        stride * height,
+        2835,
+        2835,
+        len(palette) // 4,
+        0,
+    )
+    return header + palette + b"".join(rows)
+
+
+def _colors(width, height, depth):
+    rng = random.Random(depth)
+    choices = PALETTE[: 1 << depth]
+    if depth == 24:
+        choices = PALETTE + [(128, 127, 127), (127, 127, 200), (200, 100, 20)]
+    return [[rng.choice(choices) for _ in range(width)] for _ in range(height)]
+
+
+def _reference(display, colors):
+    display.fill(display.WHITE)
+    for y, row in enumerate(colors):
+        for x, rgb in enumerate(row):
+            color = display._bmp_color(*rgb)
+            if color != display.WHITE:
+                display.pixel(x, y, color)
+
+
+def _buffers(display):
+    if display.sram:
+        display.sram.flush()
+        size = display._buffer1_size + display._buffer2_size
+        return bytes(display.sram.read(0, size))
+    return bytes(display._buffer1) + bytes(display._buffer2 or b"")
+
+
+@pytest.mark.parametrize("depth", [1, 4, 8, 24])
+@pytest.mark.parametrize(
+    ("driver", "rotation", "sram"),
+    [
+        (Adafruit_SSD1680, 0, False),
+        (Adafruit_SSD1680, 1, False),
+        (Adafruit_SSD1680, 0, True),
+        (Adafruit_JD79661, 0, False),
+        (Adafruit_JD79661, 3, False),
+    ],
+)
+def test_load_matches_pixels(driver, rotation, sram, depth):
+    display, panel, _ = simulate(driver, 122, 150, sram=sram)
+    expected, _, _ = simulate(driver, 122, 150)
+    for target in (display, expected):
+        target.rotation = rotation
+    width, height = display.width, display.height
+    colors = _colors(width, height, depth)
+
+    display.load_bmp(io.BytesIO(_bmp(colors, width, height, depth)))
+    _reference(expected, colors)
+    assert _buffers(display) == _buffers(expected)
+
+
+def test_top_down_rows(tmp_path):
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 150)
+    expected, _, _ = simulate(Adafruit_SSD1680, 122, 150)
+    colors = _colors(122, 150, 24)
+    path = tmp_path / "top_down.bmp"
+    path.write_bytes(_bmp(colors, 122, 150, 24, top_down=True))
+
+    display.load_bmp(str(path))
+    _reference(expected, colors)
+    assert _buffers(display) == _buffers(expected)
+
+
+@pytest.fixture(scope="module")
+def display():
+    """A display to load the broken files into"""
+    return simulate(Adafruit_SSD1680, 122, 150)[0]
+
+
+def _broken(name):
+    data = bytearray(_bmp(_colors(122, 150, 8), 122, 150, 8))
+    if name == "signature":
+        data[:2] = b"XX"
+    elif name == "header":
+        del data[40:]
+    elif name == "depth":
+        data[28] = 16
+    elif name == "compressed":
+        data[30] = 1
+    elif name == "size":
+        data[18] = 121
+    elif name == "palette":
+        # claims more palette entries than the file holds
+        struct.pack_into("<I", data, 46, 1 << 20)
+    elif name == "palette_end":
+        del data[60:]
+    elif name == "rows":
+        del data[-5:]
+    return bytes(data)
+
+
+@pytest.mark.parametrize(
+    "name", ["signature", "header", "depth", "compressed", "size", "palette", "palette_end", "rows"]
+)
+def test_bad_files(display, name):
+    with pytest.raises(ValueError):
+        display.load_bmp(io.BytesIO(_broken(name)))
+
+
+def test_truncated_path(tmp_path, display):
+    path = tmp_path / "truncated.bmp"
+    path.write_bytes(_broken("rows"))
+    with pytest.raises(ValueError):
+        display.load_bmp(str(path))
+
+
+def test_streams_are_left_open(display):
+    stream = io.BytesIO(_bmp(_colors(122, 150, 1), 122, 150, 1))
+    display.load_bmp(stream)
+    assert not stream.closed
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Busy pin waits: the polling backoff, edge waits and settle times"""
+
+import asyncio
+import contextlib
+import types
+from collections import deque
+
+import pytest
+from simulator import SimulatedPin, simulate
+
+from adafruit_epd import busy
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+
+class _Clock:
+    """Stands in for the time module, sleeping only moves the clock on"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        # rounded, so a sleep cut short to end at a timeout lands on it
+        self.now = round(self.now + seconds, 9)
+
+    async def sleep_async(self, seconds):
+        self.sleep(seconds)
+
+
+class _Line:
+    """A busy line that is high until ``until`` on the clock. With ``settle`` it is
+    read the way a scanned pin is, reporting the level from ``settle`` seconds ago,
+    when it was still low"""
+
+    def __init__(self, clock, until, settle=0):
+        self._clock = clock
+        self._until = until
+        if settle:
+            self.settle = settle
+
+    @property
+    def value(self):
+        seen = self._clock.now - getattr(self, "settle", 0)
+        return 0 <= seen < self._until
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(busy, "time", clock)
+    return clock
+
+
+def test_ready_pin_returns_at_once(clock):
+    assert busy.wait(_Line(clock, 0), False, sleep=clock.sleep)
+    assert clock.sleeps == []
+
+
+def test_backoff_grows_to_the_interval(clock):
+    assert busy.wait(_Line(clock, 0.05), False, interval=0.01, sleep=clock.sleep)
+    assert clock.sleeps[:5] == [0.001, 0.002, 0.004, 0.008, 0.01]
+    assert set(clock.sleeps[4:]) == {0.01}
+    # returns within one interval of the line going low
+    assert 0.05 <= clock.now < 0.06
+
+
+def test_timeout(clock):
+    assert not busy.wait(_Line(clock, 10), False, timeout=0.025, interval=0.01, sleep=clock.sleep)
+    # the last sleep is cut short to end at the timeout
+    assert clock.now == pytest.approx(0.025)
+
+
+def test_poll_is_rate_limited(clock):
+    polls = []
+    busy.wait(
+        _Line(clock, 0.1),
+        False,
+        interval=0.02,
+        poll=lambda: polls.append(clock.now),
+        sleep=clock.sleep,
+    )
+    assert polls[0] == 0
+    assert all(b - a >= 0.02 - 1e-9 for a, b in zip(polls, polls[1:]))
+    assert len(polls) >= 4
+
+
+def test_edge_waits_block_instead_of_sleeping(clock):
+    calls = []
+
+    class _EdgePin(_Line):
+        def wait_for(self, value, timeout):
+            calls.append((value, timeout))
+            self._clock.now = max(self._clock.now, self._until)
+            return True
+
+    assert busy.wait(_EdgePin(clock, 0.3), False, timeout=1.0, sleep=clock.sleep)
+    assert calls == [(False, 1.0)]
+    assert clock.sleeps == []
+
+
+def test_edge_waits_wake_to_poll(clock):
+    calls = []
+
+    class _EdgePin(_Line):
+        def wait_for(self, value, timeout):
+            calls.append(timeout)
+            self._clock.now = round(self._clock.now + timeout, 9)
+            return False
+
+    polls = []
+    busy.wait(
+        _EdgePin(clock, 0.05), False, interval=0.02, poll=lambda: polls.append(1), sleep=clock.sleep
+    )
+    assert calls == [0.02, 0.02, 0.02]
+    assert len(polls) == 3
+
+
+def test_settle_waits_out_a_stale_level(clock):
+    pin = _Line(clock, 0.05, settle=0.002)
+    # without the settle time the stale level reads as ready
+    assert pin.value is False
+    assert busy.wait(pin, False, sleep=clock.sleep)
+    assert clock.sleeps[0] == 0.002
+    assert clock.now >= 0.05
+
+
+def test_wait_async(clock):
+    pin = _Line(clock, 0.05, settle=0.002)
+    assert asyncio.run(busy.wait_async(pin, False, interval=0.01, sleep=clock.sleep_async))
+    assert clock.sleeps[:4] == [0.002, 0.001, 0.002, 0.004]
+    assert clock.now >= 0.05
+    assert not asyncio.run(
+        busy.wait_async(_Line(clock, 10), False, timeout=0.01, sleep=clock.sleep_async)
+    )
+
+
+class _Keys:
+    """Stands in for keypad.Keys, with the changes to report queued in ``queued``"""
+
+    queued = deque()
+
+    def __init__(self, pins, *, value_when_pressed, pull, interval):
+        self.events = self
+
+    @staticmethod
+    def get_into(event):
+        if not _Keys.queued:
+            return False
+        event.pressed = _Keys.queued.popleft()
+        return True
+
+    def deinit(self):
+        pass
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    fake = types.SimpleNamespace(Keys=_Keys, Event=lambda: types.SimpleNamespace(pressed=False))
+    monkeypatch.setattr(busy, "keypad", fake)
+    monkeypatch.setattr(
+        busy, "digitalio", types.SimpleNamespace(DigitalInOut=contextlib.nullcontext)
+    )
+    _Keys.queued.clear()
+    return _Keys.queued
+
+
+def test_keypad_pin_reads_the_queue(keys):
+    pin = busy.KeypadBusyPin(SimulatedPin("busy", True), interval=0.005)
+    assert pin.settle == 0.01
+    assert pin.value is True
+    keys.extend([False, True, False])
+    # the last change queued wins
+    assert pin.value is False
+    assert not keys
+    assert pin.value is False
+
+
+def test_pins_need_their_modules(monkeypatch):
+    monkeypatch.setattr(busy, "keypad", None)
+    monkeypatch.setattr(busy, "gpiod", None)
+    with pytest.raises(RuntimeError):
+        busy.KeypadBusyPin(SimulatedPin("busy"))
+    with pytest.raises(RuntimeError):
+        busy.GPIODBusyPin(5)
+
+
+def test_busy_wait_times_out():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    display._busy = SimulatedPin("busy", True)
+    display.busy_timeout = 0.02
+    with pytest.raises(RuntimeError):
+        display.busy_wait()
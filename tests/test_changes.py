@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Frame diffing: display(if_changed=True) and changed_regions()"""
+
+from simulator import CommandLog, simulate
+
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1680b import Adafruit_SSD1680B
+
+
+def _shown(display):
+    display.fill(Adafruit_EPD.WHITE)
+    assert display.display(if_changed=True)
+
+
+def test_changed_regions_cover_the_drawing():
+    display, panel, _ = simulate(Adafruit_SSD1680, 122, 250)
+    assert display.changed_regions() == [(0, 0, 122, 250)]
+    _shown(display)
+    assert display.changed_regions() == []
+
+    display.fill_rect(10, 100, 20, 5, Adafruit_EPD.BLACK)
+    regions = display.changed_regions()
+    rows = {row for _, y, _, height in regions for row in range(y, y + height)}
+    assert set(range(100, 105)) <= rows < set(range(250))
+    assert all(width == 122 for _, _, width, _ in regions)
+    assert panel.refreshes == 1
+
+
+def test_unchanged_frame_skips_the_refresh():
+    display, panel, _ = simulate(Adafruit_SSD1680, 122, 250)
+    _shown(display)
+    log = CommandLog(panel)
+    assert display.display(if_changed=True) == []
+    assert log.packets == []
+    display.pixel(5, 5, Adafruit_EPD.BLACK)
+    assert display.display(if_changed=True)
+    assert panel.refreshes == 2
+
+
+def test_direct_writes_fall_back_to_a_full_refresh():
+    display, panel, _ = simulate(Adafruit_SSD1680B, 122, 250)
+    _shown(display)
+    # drawn straight into the framebuffer, so there is no dirty box
+    display._blackframebuf.fill_rect(8, 16, 16, 8, 0)
+    log = CommandLog(panel)
+    assert display.display(partial=True, if_changed=True)
+
+    assert sum(len(data) for data in log.data(0x24)) == len(display._buffer1)
+    assert bytes(panel.ram[0]) == bytes(display._buffer1)
+    assert display.display(if_changed=True) == []
+
+
+def test_frames_not_sent_are_not_remembered():
+    display, panel, _ = simulate(Adafruit_SSD1680B, 122, 250)
+    _shown(display)
+    display._blackframebuf.fill_rect(8, 16, 16, 8, 0)
+    # no dirty box and no diffing: nothing is sent
+    display.display(partial=True)
+    assert panel.refreshes == 1
+
+    assert display.display(if_changed=True)
+    assert bytes(panel.ram[0]) == bytes(display._buffer1)
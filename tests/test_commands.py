@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Command lists, and the init sequences drivers send with them"""
+
+import pytest
+from simulator import CommandLog, simulate
+
+from adafruit_epd import commands
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1683 import Adafruit_SSD1683
+
+
+def _display(driver, width, height):
+    display, panel, _ = simulate(driver, width, height, busy=False)
+    display._sleep = lambda seconds: None
+    return display, CommandLog(panel)
+
+
+def test_walk():
+    sequence = commands.compile_commands(
+        commands.command(0x01, b"\x02\x03"),
+        commands.delay(300),
+        commands.BUSY_WAIT,
+        commands.HARDWARE_RESET,
+        commands.command(0x04),
+    )
+    entries = [(cmd, bytes(sequence[start:end])) for cmd, start, end in commands.walk(sequence)]
+    assert entries == [
+        (0x01, b"\x02\x03"),
+        (commands.DELAY, b"\xff"),
+        (commands.DELAY, b"\x2d"),
+        (commands.BUSY, b""),
+        (commands.RESET, b""),
+        (0x04, b""),
+    ]
+
+
+def test_walk_stops_at_end():
+    sequence = bytes((0x01, 1, commands.END, commands.END, 0x02, 0))
+    assert [cmd for cmd, _, _ in commands.walk(sequence)] == [0x01]
+
+
+@pytest.mark.parametrize("cmd", [commands.DELAY, commands.END, commands.BUSY, commands.RESET])
+def test_reserved_commands(cmd):
+    with pytest.raises(ValueError):
+        commands.command(cmd)
+
+
+def test_too_much_data():
+    with pytest.raises(ValueError):
+        commands.command(0x01, bytes(256))
+
+
+def test_compile_drops_the_end_of_a_list():
+    custom = bytes((0x12, 0, 0xFF, 10, 0x3C, 1, 0xFE, 0xFE))
+    sequence = commands.compile_commands(custom, commands.command(0x44, b"\x00\x31"))
+    assert [cmd for cmd, _, _ in commands.walk(sequence)] == [0x12, commands.DELAY, 0x3C, 0x44]
+
+
+def test_power_up_sends_the_init_list():
+    display, wire = _display(Adafruit_SSD1680, 122, 250)
+    display.power_up()
+
+    sent = wire.sent()
+    expected = [cmd for cmd, _, _ in commands.walk(display._power_up_list())]
+    assert sent == [cmd for cmd in expected if cmd < commands.RESET]
+    assert sent[0] == 0x12  # software reset
+
+
+def test_ssd1683_custom_init_ending_in_end():
+    display, wire = _display(Adafruit_SSD1683, 400, 300)
+    # written the way the driver's default list used to be, ending in 0xFE
+    display._epd_init_code = bytes((0x12, 0, 0xFF, 50, 0x3C, 1, 0x05, 0x11, 1, 0x03, 0xFE))
+    display._epd_lut_code = bytes((0x32, 3, 0xAA, 0xBB, 0xCC, 0xFE))
+    display.power_up()
+
+    packets = {cmd: bytes(data) for cmd, data in wire.packets}
+    assert wire.sent() == [
+        0x12,
+        0x3C,
+        0x11,
+        0x44,
+        0x45,
+        0x4E,
+        0x4F,
+        0x32,
+        0x01,
+    ]
+    assert packets[0x44] == bytes((0, 400 // 8 - 1))
+    assert packets[0x45] == bytes((0, 0, 299 & 0xFF, 299 >> 8))
+    assert packets[0x32] == b"\xaa\xbb\xcc"
+    assert packets[0x01] == bytes((299 & 0xFF, 299 >> 8, 0))
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Dithered images, on their own and on the simulated panel"""
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from simulator import simulate  # noqa: E402
+
+from adafruit_epd import dither  # noqa: E402
+from adafruit_epd.jd79661 import Adafruit_JD79661  # noqa: E402
+from adafruit_epd.ssd1680 import Adafruit_SSD1680  # noqa: E402
+
+METHODS = (dither.FLOYD_STEINBERG, dither.ATKINSON, dither.BAYER)
+MONO = ((0, 0, 0), (255, 255, 255))
+TRICOLOR = ((0, 0, 0), (255, 255, 255), (255, 0, 0))
+
+
+def _gradient(width, height):
+    image = Image.new("RGB", (width, height))
+    image.putdata(
+        [
+            (x * 255 // (width - 1), y * 255 // (height - 1), (x + y) * 255 // (width + height))
+            for y in range(height)
+            for x in range(width)
+        ]
+    )
+    return image
+
+
+def _colors(image):
+    data = image.tobytes()
+    return [tuple(data[i : i + 3]) for i in range(0, len(data), 3)]
+
+
+def _gray(level, size=(32, 32)):
+    return Image.new("RGB", size, (level, level, level))
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_output_only_uses_the_palette(method):
+    result = dither.dither_image(_gradient(40, 30), TRICOLOR, method)
+    assert result.mode == "RGB"
+    assert result.size == (40, 30)
+    assert set(_colors(result)) <= set(TRICOLOR)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_palette_colors_pass_through(method):
+    image = Image.new("RGB", (16, 16), (255, 0, 0))
+    assert set(_colors(dither.dither_image(image, TRICOLOR, method))) == {(255, 0, 0)}
+
+
+# Atkinson drops a quarter of the error by design, so only these keep the mean
+@pytest.mark.parametrize("method", [dither.FLOYD_STEINBERG, dither.BAYER])
+@pytest.mark.parametrize("level", [64, 128, 192])
+def test_gray_keeps_its_brightness(method, level):
+    result = dither.dither_image(_gray(level), MONO, method)
+    white = sum(1 for pixel in _colors(result) if pixel == (255, 255, 255))
+    assert abs(white / (32 * 32) - level / 255) < 0.06
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_numpy_and_rows_agree(method, monkeypatch):
+    pytest.importorskip("numpy")
+    image = _gradient(24, 20)
+    with_numpy = dither.dither_image(image, TRICOLOR, method)
+    monkeypatch.setattr(dither, "numpy", None)
+    assert _colors(dither.dither_image(image, TRICOLOR, method)) == _colors(with_numpy)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        dither.dither_image(_gray(128), MONO, "random")
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_image_dithers_onto_the_panel(method):
+    display, panel, _ = simulate(Adafruit_SSD1680, 64, 48)
+    image = _gradient(64, 48)
+    expected = dither.dither_image(image, TRICOLOR, method)
+    display.image(image, dither=method)
+    display.display()
+
+    black = panel.pixels(0)
+    red = panel.pixels(1)
+    for y in range(48):
+        for x in range(64):
+            pixel = expected.getpixel((x, y))
+            # black is stored clear in the black RAM, red set in the red RAM
+            assert black[y][x] == (pixel != (0, 0, 0))
+            assert red[y][x] == (pixel == (255, 0, 0))
+
+
+def test_quad_color_image_dithers_onto_the_panel():
+    display, panel, _ = simulate(Adafruit_JD79661, 32, 16)
+    image = _gradient(32, 16)
+    palette = display._dither_palette()
+    expected = dither.dither_image(image, palette, dither.FLOYD_STEINBERG)
+    display.image(image, dither=dither.FLOYD_STEINBERG)
+    display.display()
+
+    colors = {tuple(color): code for code, color in enumerate(palette)}
+    codes = Adafruit_JD79661._CODES
+    rows = panel.pixels()
+    for y in range(16):
+        for x in range(32):
+            assert rows[y][x] == codes[colors[expected.getpixel((x, y))]]
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Frame files: the PackBits planes, and saving, loading and sending them"""
+
+import io
+
+import pytest
+from simulator import simulate
+
+from adafruit_epd import frame
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.uc8151d import Adafruit_UC8151D
+
+PLANES = [
+    b"",
+    b"\x00",
+    bytes(1000),
+    bytes(range(256)) * 3,
+    b"\x01\x02\x02\x03\x03\x03\x04\x04\x04\x04" * 40,
+    bytes((i * 7919 >> 3) & 0xFF if i % 50 < 25 else 0xAA for i in range(2000)),
+]
+
+
+def _decode(stream, stored, rle, size):
+    chunk = bytearray(size)
+    out = bytearray()
+    for count in frame.read_plane(stream, stored, rle, chunk):
+        out.extend(chunk[:count])
+    return bytes(out)
+
+
+@pytest.mark.parametrize("data", PLANES)
+@pytest.mark.parametrize("chunk", [1, 7, 128, 4096])
+def test_rle_round_trip(data, chunk):
+    encoded = frame.rle_encode(bytearray(data))
+    assert _decode(io.BytesIO(encoded), len(encoded), True, chunk) == data
+    assert _decode(io.BytesIO(data), len(data), False, chunk) == data
+
+
+def test_rle_compresses_runs():
+    assert frame.rle_encode(bytearray(1000)) == bytearray(b"\x81\x00" * 7 + b"\x99\x00")
+    assert frame.rle_encode(bytearray(b"abc")) == bytearray(b"\x02abc")
+
+
+def test_rle_encodes_a_slice():
+    data = bytearray(b"xxxx\x05\x05\x05\x05yyyy")
+    assert frame.rle_encode(data, 4, 8) == frame.rle_encode(bytearray(b"\x05" * 4))
+
+
+def test_truncated_plane():
+    encoded = frame.rle_encode(bytearray(range(100)))
+    with pytest.raises(ValueError):
+        _decode(io.BytesIO(encoded[:50]), len(encoded), True, 64)
+
+
+def test_header_round_trip():
+    header = frame.pack_header("Adafruit_SSD1680", 122, 250, frame.FLAG_RLE, (4000, 4000), (9, 8))
+    assert len(header) == frame.HEADER_SIZE
+    assert frame.read_header(io.BytesIO(header)) == (
+        "Adafruit_SSD1680",
+        122,
+        250,
+        frame.FLAG_RLE,
+        (4000, 4000),
+        (9, 8),
+    )
+
+
+@pytest.mark.parametrize("data", [b"", b"EPDX" + bytes(60), b"EPDF\x02" + bytes(60)])
+def test_bad_header(data):
+    with pytest.raises(ValueError):
+        frame.read_header(io.BytesIO(data))
+
+
+def _draw(display):
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(3, 5, 20, 10, Adafruit_EPD.BLACK)
+    display.line(0, 40, 60, 70, Adafruit_EPD.BLACK)
+    display.fill_rect(30, 80, 40, 30, Adafruit_EPD.RED)
+
+
+@pytest.mark.parametrize("rle", [True, False])
+@pytest.mark.parametrize("sram", [False, True])
+def test_save_and_load(rle, sram):
+    source, _, _ = simulate(Adafruit_SSD1680, 122, 250, sram=sram)
+    _draw(source)
+    stream = io.BytesIO()
+    source.save_frame(stream, rle=rle)
+
+    target, _, _ = simulate(Adafruit_SSD1680, 122, 250, sram=sram)
+    stream.seek(0)
+    target.load_frame(stream)
+    for display in (source, target):
+        if display.sram:
+            display.sram.flush()
+    assert _planes(target) == _planes(source)
+
+
+def _planes(display):
+    if display.sram:
+        size = display._buffer1_size + display._buffer2_size
+        return bytes(display.sram.read(0, size))
+    return bytes(display._buffer1) + bytes(display._buffer2)
+
+
+def test_rle_frame_is_smaller():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    _draw(display)
+    packed, plain = io.BytesIO(), io.BytesIO()
+    display.save_frame(packed, rle=True)
+    display.save_frame(plain, rle=False)
+    assert len(packed.getvalue()) < len(plain.getvalue()) // 4
+
+
+def test_load_checks_the_display():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    stream = io.BytesIO()
+    display.save_frame(stream)
+    other, _, _ = simulate(Adafruit_UC8151D, 128, 296)
+    stream.seek(0)
+    with pytest.raises(ValueError):
+        other.load_frame(stream)
+
+
+@pytest.mark.parametrize(
+    ("driver", "width", "height"),
+    [(Adafruit_SSD1680, 122, 250), (Adafruit_UC8151D, 128, 296), (Adafruit_JD79661, 128, 250)],
+)
+@pytest.mark.parametrize("rle", [True, False])
+def test_display_frame_matches_display(tmp_path, driver, width, height, rle):
+    display, panel, _ = simulate(driver, width, height)
+    _draw(display)
+    path = str(tmp_path / "frame.epd")
+    display.save_frame(path, rle=rle)
+    display.display()
+    shown = [bytes(ram) for ram in panel.ram]
+
+    replay, replay_panel, _ = simulate(driver, width, height)
+    replay.display_frame(path)
+    assert [bytes(ram) for ram in replay_panel.ram] == shown
+    assert replay_panel.refreshes == 1
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Glyph rendering and the glyph cache"""
+
+import adafruit_framebuf
+import pytest
+from simulator import simulate
+
+from adafruit_epd import glyphs
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+
+def test_glyph_matches_pixels(font_name):
+    font = glyphs.get_font(font_name)
+    for size in (1, 2):
+        width = font.font_width * size
+        expected = set(font.pixels("A", size))
+        lines = font.glyph("A", size, False, False, 1, 3)
+        drawn = set()
+        for y, line in enumerate(lines):
+            for offset, mask in line:
+                for bit in range(8):
+                    if mask >> (7 - bit) & 1:
+                        drawn.add((offset * 8 + bit - 3, y))
+        assert drawn == expected
+        assert all(0 <= x < width for x, _ in drawn)
+
+
+def test_transposed_glyph_is_the_columns(font_name):
+    font = glyphs.get_font(font_name)
+    rows = font.glyph("g", 1, False, False, 1, 0)
+    columns = font.glyph("g", 1, True, False, 1, 0)
+
+    def bits(lines, length):
+        return [
+            [
+                any(mask >> (7 - pos % 8) & 1 for offset, mask in line if offset == pos // 8)
+                for pos in range(length)
+            ]
+            for line in lines
+        ]
+
+    assert list(map(list, zip(*bits(rows, 5)))) == bits(columns, 8)
+
+
+def test_cache_is_bounded(font_name):
+    font = glyphs.get_font(font_name)
+    for code in range(glyphs._GLYPH_CACHE_SIZE + 40):
+        font.glyph(chr(code), 1, False, False, 1, 0)
+    assert len(font._glyphs) == glyphs._GLYPH_CACHE_SIZE
+
+
+def test_cache_drops_the_least_recently_used(font_name):
+    font = glyphs.get_font(font_name)
+    first = font.glyph("a", 1, False, False, 1, 0)
+    font.glyph("b", 1, False, False, 1, 0)
+    for code in range(glyphs._GLYPH_CACHE_SIZE - 2):
+        font.glyph(chr(0x100 + code), 1, False, False, 1, 0)
+    # "a" is used again, so "b" is now the oldest
+    assert font.glyph("a", 1, False, False, 1, 0) is first
+    font.glyph("c", 1, False, False, 1, 0)
+
+    keys = [key[0] for key in font._glyphs]
+    assert "a" in keys
+    assert "b" not in keys
+    assert keys[-1] == "c"
+
+
+def test_cache_keys_on_size_and_orientation(font_name):
+    font = glyphs.get_font(font_name)
+    font.glyph("x", 1, False, False, 1, 0)
+    font.glyph("x", 2, False, False, 1, 0)
+    font.glyph("x", 1, True, False, 1, 0)
+    font.glyph("x", 1, False, True, 1, 0)
+    font.glyph("x", 1, False, False, 2, 0)
+    font.glyph("x", 1, False, False, 1, 4)
+    assert len(font._glyphs) == 6
+
+
+def test_get_font_is_shared(font_name):
+    assert glyphs.get_font(font_name) is glyphs.get_font(font_name)
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+@pytest.mark.parametrize("size", [1, 2])
+def test_text_matches_framebuf(font_name, rotation, size):
+    display, panel, _ = simulate(Adafruit_SSD1680, 64, 64)
+    display.rotation = rotation
+    display.fill(Adafruit_EPD.WHITE)
+    display.text("Hi!\nab", 3, 5, Adafruit_EPD.BLACK, font_name=font_name, size=size)
+    display.text("edge", 50, 58, Adafruit_EPD.RED, font_name=font_name, size=size)
+
+    expected = [bytearray(len(display._buffer1)), bytearray(len(display._buffer2))]
+    planes = (
+        (expected[0], display._black_inverted, Adafruit_EPD.BLACK),
+        (expected[1], display._color_inverted, Adafruit_EPD.RED),
+    )
+    for buf, inverted, color in planes:
+        framebuf = adafruit_framebuf.FrameBuffer(buf, 64, 64, buf_format=adafruit_framebuf.MHMSB)
+        framebuf.rotation = rotation
+        framebuf.fill(inverted)
+        text = "Hi!\nab" if color == Adafruit_EPD.BLACK else "edge"
+        x, y = (3, 5) if color == Adafruit_EPD.BLACK else (50, 58)
+        for row, chunk in enumerate(text.split("\n")):
+            framebuf.text(
+                chunk, x, y + row * 8 * size, not inverted, font_name=font_name, size=size
+            )
+
+    assert bytes(display._buffer1) == bytes(expected[0])
+    assert bytes(display._buffer2) == bytes(expected[1])
+
+    display.display()
+    assert bytes(panel.ram[0]) == bytes(expected[0])
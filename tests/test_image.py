@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Pillow images packed into the bit planes in one pass"""
+
+import random
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from simulator import simulate  # noqa: E402
+
+from adafruit_epd.epd import Adafruit_EPD  # noqa: E402
+from adafruit_epd.ssd1608 import Adafruit_SSD1608  # noqa: E402
+from adafruit_epd.ssd1680 import Adafruit_SSD1680  # noqa: E402
+from adafruit_epd.uc8151d import Adafruit_UC8151D  # noqa: E402
+
+DRIVERS = [
+    (Adafruit_SSD1680, 122, 250),
+    (Adafruit_UC8151D, 128, 296),
+    (Adafruit_SSD1608, 200, 200),
+]
+
+
+def _noise(mode, width, height):
+    rng = random.Random(width * height)
+    channels = 3 if mode == "RGB" else 1
+    # mostly the extremes, so every color shows up, with values either side of 0x80
+    levels = (0x00, 0x7F, 0x80, 0xFF, 0x40, 0xC0)
+    data = bytes(rng.choice(levels) for _ in range(width * height * channels))
+    return Image.frombytes(mode, (width, height), data)
+
+
+def _reference(display, image):
+    """Draw an image pixel by pixel, the way image() does without Pillow"""
+    display.fill(Adafruit_EPD.WHITE)
+    pix = image.load()
+    for y in range(image.size[1]):
+        for x in range(image.size[0]):
+            pixel = pix[x, y]
+            if image.mode == "L":
+                if pixel < 0x80:
+                    display.pixel(x, y, Adafruit_EPD.BLACK)
+            elif pixel[1] < 0x80 <= pixel[0] and pixel[2] < 0x80:
+                display.pixel(x, y, Adafruit_EPD.RED)
+            elif pixel[0] < 0x80 and pixel[1] < 0x80 and pixel[2] < 0x80:
+                display.pixel(x, y, Adafruit_EPD.BLACK)
+
+
+@pytest.fixture(scope="module", params=DRIVERS, ids=lambda params: params[0].__name__)
+def displays(request):
+    """A display on a simulated panel and one to draw the expected image on, both
+    cleared by image() and _reference() so tests can share them"""
+    display, panel, _ = simulate(*request.param)
+    expected, _, _ = simulate(*request.param)
+    return display, panel, expected
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L"])
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+def test_image_matches_pixels(displays, mode, rotation):
+    display, panel, expected = displays
+    for target in (display, expected):
+        target.rotation = rotation
+    image = _noise(mode, display.width, display.height)
+
+    display.image(image)
+    _reference(expected, image)
+    assert bytes(display._buffer1) == bytes(expected._buffer1)
+    if expected._buffer2 is not None:
+        assert bytes(display._buffer2) == bytes(expected._buffer2)
+
+    display.display()
+    assert bytes(panel.ram[0]) == bytes(expected._buffer1)
+
+
+def test_image_replaces_the_drawing():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    blank, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    blank.fill(Adafruit_EPD.WHITE)
+    display.fill(Adafruit_EPD.BLACK)
+    display.image(Image.new("RGB", (122, 250), (255, 255, 255)))
+    assert bytes(display._buffer1) == bytes(blank._buffer1)
+    assert bytes(display._buffer2) == bytes(blank._buffer2)
+
+
+def test_image_size_is_checked():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    with pytest.raises(ValueError):
+        display.image(Image.new("RGB", (250, 122)))
+
+
+def test_image_mode_is_checked():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    with pytest.raises(ValueError):
+        display.image(Image.new("1", (122, 250)))
+
+
+def test_image_is_not_for_sram():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250, sram=True)
+    with pytest.raises(RuntimeError):
+        display.image(Image.new("RGB", (122, 250)))
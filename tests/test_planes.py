@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Drawing planes bound per color, and pixels()"""
+
+import pytest
+from simulator import simulate
+
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.ssd1608 import Adafruit_SSD1608
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1680b import Adafruit_SSD1680B
+from adafruit_epd.uc8151d import Adafruit_UC8151D
+
+COLORS = (
+    Adafruit_EPD.BLACK,
+    Adafruit_EPD.WHITE,
+    Adafruit_EPD.INVERSE,
+    Adafruit_EPD.RED,
+    Adafruit_EPD.DARK,
+    Adafruit_EPD.LIGHT,
+)
+
+CALLS = [
+    ("pixel", (5, 9)),
+    ("rect", (2, 3, 30, 17)),
+    ("fill_rect", (40, 50, 21, 13)),
+    ("line", (0, 100, 60, 140)),
+]
+
+
+def _color_dup(display, func, args, color):
+    """Draw on each plane the way the driver did before the planes were bound"""
+    black = getattr(display._blackframebuf, func)
+    red = getattr(display._colorframebuf, func)
+    if display._blackframebuf is display._colorframebuf:
+        black(*args, color=(color != Adafruit_EPD.WHITE) != display._black_inverted)
+    else:
+        black(*args, color=(color == Adafruit_EPD.BLACK) != display._black_inverted)
+        red(*args, color=(color == Adafruit_EPD.RED) != display._color_inverted)
+
+
+def _buffers(display):
+    return bytes(display._buffer1), bytes(display._buffer2 or b"")
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        (Adafruit_SSD1680, 122, 250),
+        (Adafruit_UC8151D, 128, 296),
+        (Adafruit_SSD1608, 200, 200),
+    ],
+    ids=lambda params: params[0].__name__,
+)
+def displays(request):
+    """A display to draw on and one to draw the expected planes on"""
+    return simulate(*request.param)[0], simulate(*request.param)[0]
+
+
+def _clear(*displays):
+    for display in displays:
+        display.rotation = 0
+        display._buffer1[:] = bytes(len(display._buffer1))
+        if display._buffer2 is not None:
+            display._buffer2[:] = bytes(len(display._buffer2))
+
+
+@pytest.mark.parametrize("color", COLORS)
+def test_drawing_matches_color_dup(displays, color):
+    display, expected = displays
+    _clear(display, expected)
+    for func, args in CALLS:
+        getattr(display, func)(*args, color)
+        _color_dup(expected, func, args, color)
+    assert _buffers(display) == _buffers(expected)
+
+
+@pytest.mark.parametrize("color", [Adafruit_EPD.BLACK, Adafruit_EPD.RED, 7])
+def test_buffers_are_rebound(color):
+    display, expected = (
+        simulate(Adafruit_SSD1680, 122, 250)[0],
+        simulate(Adafruit_SSD1680, 122, 250)[0],
+    )
+    for target in (display, expected):
+        target.set_black_buffer(1, False)
+        target.set_color_buffer(0, True)
+    for func, args in CALLS:
+        getattr(display, func)(*args, color)
+        _color_dup(expected, func, args, color)
+    assert _buffers(display) == _buffers(expected)
+
+
+def test_bad_buffer_index():
+    display = simulate(Adafruit_SSD1680, 122, 250)[0]
+    with pytest.raises(RuntimeError):
+        display.set_black_buffer(2, False)
+    with pytest.raises(RuntimeError):
+        display.set_color_buffer(2, False)
+
+
+POINTS = [(x, (x * 37) % 260 - 5) for x in range(-3, 140)] + [(1, 1), (1, 1)]
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+@pytest.mark.parametrize("color", COLORS)
+def test_pixels_match_pixel(displays, rotation, color):
+    display, expected = displays
+    _clear(display, expected)
+    display.rotation = expected.rotation = rotation
+    display.pixels(POINTS, color)
+    for x, y in POINTS:
+        expected.pixel(x, y, color)
+    assert _buffers(display) == _buffers(expected)
+
+
+def test_pixels_through_sram():
+    display = simulate(Adafruit_SSD1680, 122, 250, sram=True)[0]
+    expected = simulate(Adafruit_SSD1680, 122, 250)[0]
+    for target in (display, expected):
+        target.fill(Adafruit_EPD.WHITE)
+    display.pixels(POINTS, Adafruit_EPD.BLACK)
+    display.pixels(POINTS[::3], Adafruit_EPD.RED)
+    for x, y in POINTS:
+        expected.pixel(x, y, Adafruit_EPD.BLACK)
+    for x, y in POINTS[::3]:
+        expected.pixel(x, y, Adafruit_EPD.RED)
+
+    display.sram.flush()
+    size = display._buffer1_size + display._buffer2_size
+    assert bytes(display.sram.read(0, size)) == b"".join(_buffers(expected))
+
+
+def test_pixels_mark_the_dirty_box():
+    # only chipsets with RAM windows track the box
+    display = simulate(Adafruit_SSD1680B, 122, 250)[0]
+    display._dirty_box = None
+    display.pixels([], Adafruit_EPD.BLACK)
+    assert display._dirty_box is None
+    display.pixels([(10, 60), (20, 30), (500, 500)], Adafruit_EPD.BLACK)
+    assert display._dirty_box == [10, 30, 20, 60]
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Quad-color rectangles and lines filled with packed bytes"""
+
+import pytest
+from simulator import simulate
+
+from adafruit_epd import quad_color
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.jd79667 import Adafruit_JD79667
+
+SHAPES = [
+    ("fill_rect", (0, 0, 122, 150)),
+    ("fill_rect", (3, 5, 17, 9)),
+    ("fill_rect", (1, 1, 2, 2)),
+    ("fill_rect", (-4, -3, 10, 8)),
+    ("fill_rect", (110, 140, 40, 40)),
+    ("fill_rect", (200, 10, 5, 5)),
+    ("hline", (5, 20, 101)),
+    ("hline", (-10, 21, 30)),
+    ("vline", (7, 2, 60)),
+    ("vline", (121, 140, 30)),
+    ("rect", (2, 3, 33, 21)),
+    ("rect", (50, 60, 1, 9)),
+    ("line", (4, 30, 4, 90)),
+    ("line", (90, 12, 6, 12)),
+]
+
+
+def _reference(display, name, args, color):
+    """Draw a shape pixel by pixel"""
+    if name == "line":
+        x_0, y_0, x_1, y_1 = args
+        name, args = (
+            "fill_rect",
+            (min(x_0, x_1), min(y_0, y_1), abs(x_1 - x_0) + 1, abs(y_1 - y_0) + 1),
+        )
+    if name == "hline":
+        name, args = "fill_rect", (args[0], args[1], args[2], 1)
+    elif name == "vline":
+        name, args = "fill_rect", (args[0], args[1], 1, args[2])
+    x, y, width, height = args
+    points = set()
+    if name == "fill_rect":
+        points = {(col, row) for col in range(x, x + width) for row in range(y, y + height)}
+    else:
+        for col in range(x, x + width):
+            points |= {(col, y), (col, y + height - 1)}
+        for row in range(y, y + height):
+            points |= {(x, row), (x + width - 1, row)}
+    for col, row in points:
+        display.pixel(col, row, color)
+
+
+def _buffer(display):
+    if display.sram:
+        display.sram.flush()
+        return bytes(display.sram.read(0, display._buffer1_size))
+    return bytes(display._buffer1)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(Adafruit_JD79661, False), (Adafruit_JD79667, False), (Adafruit_JD79661, True)],
+    ids=["JD79661", "JD79667", "JD79661-sram"],
+)
+def displays(request):
+    """A display to draw on, with or without SRAM, and one for the expected pixels"""
+    driver, sram = request.param
+    display = simulate(driver, 122, 150, sram=sram)[0]
+    expected = simulate(driver, 122, 150)[0]
+    return display, expected
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+@pytest.mark.parametrize("color", [quad_color.BLACK, quad_color.YELLOW, quad_color.RED])
+def test_shapes_match_pixels(displays, rotation, color):
+    display, expected = displays
+    for name, args in SHAPES:
+        for target in (display, expected):
+            target.rotation = rotation
+            target.fill(target.WHITE)
+        getattr(display, name)(*args, color)
+        _reference(expected, name, args, color)
+        assert _buffer(display) == _buffer(expected), (name, args)
+
+
+def test_fill_span_wraps():
+    buffer = bytearray(b"\x55" * 8)
+    quad_color.fill_span(buffer, 8, 30, 5, quad_color.RED)
+    assert buffer == bytearray(b"\xfd\x55\x55\x55\x55\x55\x55\x5f")
+
+
+@pytest.mark.parametrize("start", range(8))
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 5, 9, 16])
+def test_fill_span_masks_the_edges(start, count):
+    buffer = bytearray(b"\x55" * 8)
+    quad_color.fill_span(buffer, 8, start, count, quad_color.BLACK)
+    for pixel in range(32):
+        code = buffer[pixel >> 2] >> (6 - 2 * (pixel & 3)) & 3
+        inside = start <= pixel < start + count
+        assert code == (quad_color.BLACK if inside else quad_color.WHITE)
+
+
+def test_fill_span_erases_whole_bytes_with_sram():
+    buffer = bytearray(b"\x55" * 8)
+    erased = []
+    quad_color.fill_span(
+        buffer,
+        8,
+        3,
+        20,
+        quad_color.YELLOW,
+        lambda address, length, value: erased.append((address, length, value)),
+    )
+    assert erased == [(1, 4, 0xAA)]
+    assert buffer[0] == 0x56
+    assert buffer[5] == 0xA9
@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""The packed 2 bit QuadColorFrameBuffer"""
+
+import pytest
+
+from adafruit_epd import glyphs
+from adafruit_epd.quad_color import BLACK, RED, WHITE, YELLOW, QuadColorFrameBuffer
+
+WIDTH, HEIGHT = 22, 13
+
+
+def _framebuf(rotation=0, width=WIDTH, height=HEIGHT, **kwargs):
+    # rows padded to whole bytes, as the drivers lay them out
+    stride = kwargs.pop("stride", (width + 3) & ~3)
+    framebuf = QuadColorFrameBuffer(
+        bytearray(stride * height // 4), width, height, stride, **kwargs
+    )
+    framebuf.fill(WHITE)
+    framebuf.rotation = rotation
+    return framebuf
+
+
+def _unrotated(framebuf):
+    """A rotation 0 framebuffer on the same buffer"""
+    return QuadColorFrameBuffer(
+        framebuf.buf, framebuf.width, framebuf.height, framebuf.stride, size=framebuf._size
+    )
+
+
+def _stored(rotation, x, y):
+    """Where a rotated pixel lands in the unrotated buffer"""
+    if rotation == 1:
+        return WIDTH - 1 - y, x
+    if rotation == 2:
+        return WIDTH - 1 - x, HEIGHT - 1 - y
+    if rotation == 3:
+        return y, HEIGHT - 1 - x
+    return x, y
+
+
+def _grid(framebuf):
+    width, height = framebuf._rotated_size()
+    return [[framebuf.pixel(x, y) for x in range(width)] for y in range(height)]
+
+
+def test_pixels_are_packed_msb_first():
+    framebuf = _framebuf()
+    framebuf.pixel(0, 0, BLACK)
+    framebuf.pixel(1, 0, YELLOW)
+    framebuf.pixel(3, 0, RED)
+    framebuf.pixel(0, 1, BLACK)
+    assert framebuf.buf[0] == 0b00_10_01_11
+    # the second row starts at pixel 24, after two padding pixels
+    assert framebuf.buf[5] == 0x55
+    assert framebuf.buf[6] == 0b00_01_01_01
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+def test_rotation(rotation):
+    framebuf = _framebuf(rotation)
+    width, height = framebuf._rotated_size()
+    assert (width, height) == ((HEIGHT, WIDTH) if rotation % 2 else (WIDTH, HEIGHT))
+    points = [(0, 0), (width - 1, 0), (3, height - 1), (5, 7)]
+    for x, y in points:
+        framebuf.pixel(x, y, RED)
+        assert framebuf.pixel(x, y) == RED
+    stored = _unrotated(framebuf)
+    drawn = {
+        (x, y) for y, row in enumerate(_grid(stored)) for x, code in enumerate(row) if code == RED
+    }
+    assert drawn == {_stored(rotation, x, y) for x, y in points}
+
+
+def test_bad_rotation():
+    with pytest.raises(RuntimeError):
+        _framebuf().rotation = 4
+
+
+def test_pixels_off_the_buffer():
+    framebuf = _framebuf(1)
+    before = bytes(framebuf.buf)
+    for x, y in [(-1, 0), (0, -1), (HEIGHT, 0), (0, WIDTH)]:
+        assert framebuf.pixel(x, y) is None
+        framebuf.pixel(x, y, BLACK)
+    framebuf.pixels([(-1, 0), (HEIGHT, 3)], BLACK)
+    assert bytes(framebuf.buf) == before
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+def test_pixels_match_pixel(rotation):
+    framebuf = _framebuf(rotation)
+    expected = _framebuf(rotation)
+    points = [(x, (x * 7) % 13) for x in range(13)]
+    framebuf.pixels(points, YELLOW)
+    for x, y in points:
+        expected.pixel(x, y, YELLOW)
+    assert framebuf.buf == expected.buf
+
+
+@pytest.mark.parametrize("color", [BLACK, WHITE, YELLOW, RED])
+def test_fill(color):
+    framebuf = _framebuf()
+    framebuf.fill(color)
+    assert set(framebuf.buf) == {(0x00, 0x55, 0xAA, 0xFF)[color]}
+
+
+def test_fill_with_erase():
+    erased = []
+    framebuf = QuadColorFrameBuffer(
+        None, 16, 4, erase=lambda address, length, value: erased.append((address, length, value))
+    )
+    framebuf.fill(YELLOW)
+    assert erased == [(0, 16, 0xAA)]
+
+
+def test_stride_pads_rows():
+    framebuf = _framebuf(stride=28)
+    framebuf.fill_rect(0, 0, WIDTH, HEIGHT, BLACK)
+    for y in range(HEIGHT):
+        row = framebuf.buf[y * 7 : (y + 1) * 7]
+        # the last six pixels of each row are padding
+        assert bytes(row) == b"\x00" * 5 + b"\x05\x55"
+
+
+@pytest.mark.parametrize("rotation", [1, 2])
+def test_offsets(rotation):
+    framebuf = _framebuf(rotation, offsets=(2, 2))
+    framebuf.pixel(0, 0, BLACK)
+    # shifted into the padding columns
+    x, y = _stored(rotation, 0, 0)
+    position = x + 2 + y * framebuf.stride
+    assert framebuf.buf[position >> 2] >> 2 * (3 - (position & 3)) & 3 == BLACK
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+def test_line_matches_pixels(rotation):
+    framebuf = _framebuf(rotation)
+    framebuf.line(1, 2, 11, 9, RED)
+    framebuf.line(12, 0, 12, 12, BLACK)
+
+    expected = _framebuf(rotation)
+    x, y, dx, dy, err = 1, 2, 10, 7, 3
+    while True:
+        expected.pixel(x, y, RED)
+        if (x, y) == (11, 9):
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x += 1
+        if e2 < dx:
+            err += dx
+            y += 1
+    for y in range(13):
+        expected.pixel(12, y, BLACK)
+    assert _grid(framebuf) == _grid(expected)
+
+
+def _pattern(rotation, width, height):
+    source = _framebuf(rotation, width, height)
+    for y in range(source._rotated_size()[1]):
+        for x in range(source._rotated_size()[0]):
+            source.pixel(x, y, (x * 3 + y) % 4)
+    return source
+
+
+@pytest.mark.parametrize("key", [-1, YELLOW])
+@pytest.mark.parametrize("rotation", [0, 1])
+@pytest.mark.parametrize("source_rotation", [0, 3])
+@pytest.mark.parametrize(("x", "y"), [(0, 0), (4, 2), (3, 1), (-5, -2), (15, 9)])
+def test_blit_matches_pixels(key, rotation, source_rotation, x, y):  # noqa: PLR0913, PLR0917
+    source = _pattern(source_rotation, 12, 8)
+    framebuf = _framebuf(rotation)
+    framebuf.blit(source, x, y, key)
+
+    expected = _framebuf(rotation)
+    width, height = source._rotated_size()
+    for row in range(height):
+        for col in range(width):
+            color = source.pixel(col, row)
+            if color != key:
+                expected.pixel(x + col, y + row, color)
+    assert _grid(framebuf) == _grid(expected)
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+@pytest.mark.parametrize("size", [1, 2])
+def test_text_matches_the_font(font_name, rotation, size):
+    framebuf = _framebuf(rotation, 48, 40)
+    framebuf.text("Ab\nc", 2, 3, RED, font_name=font_name, size=size)
+
+    expected = _framebuf(rotation, 48, 40)
+    font = glyphs.get_font(font_name)
+    for row, chunk in enumerate(["Ab", "c"]):
+        for i, char in enumerate(chunk):
+            for gx, gy in font.pixels(char, size):
+                expected.pixel(
+                    2 + i * (font.font_width + 1) * size + gx, 3 + row * 8 * size + gy, RED
+                )
+    assert _grid(framebuf) == _grid(expected)
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Quad-color images quantized and packed in one pass"""
+
+import random
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from simulator import simulate  # noqa: E402
+
+from adafruit_epd import quad_color  # noqa: E402
+from adafruit_epd.jd79661 import Adafruit_JD79661  # noqa: E402
+from adafruit_epd.jd79667 import Adafruit_JD79667  # noqa: E402
+
+LEVELS = (0, 40, 79, 80, 99, 100, 127, 128, 150, 199, 200, 255)
+
+
+@pytest.mark.parametrize(
+    ("rgb", "code"),
+    [
+        ((0, 0, 0), quad_color.BLACK),
+        ((255, 255, 255), quad_color.WHITE),
+        ((255, 255, 0), quad_color.YELLOW),
+        ((255, 0, 0), quad_color.RED),
+        ((200, 60, 40), quad_color.RED),
+        ((180, 160, 40), quad_color.YELLOW),
+        ((90, 90, 90), quad_color.BLACK),
+        ((210, 210, 210), quad_color.WHITE),
+    ],
+)
+def test_rgb_to_code(rgb, code):
+    assert quad_color.rgb_to_code(*rgb) == code
+
+
+def _noise(mode, width, height):
+    rng = random.Random(width + height)
+    channels = 3 if mode == "RGB" else 1
+    data = bytes(rng.choice(LEVELS) for _ in range(width * height * channels))
+    return Image.frombytes(mode, (width, height), data)
+
+
+def _gray_code(value):
+    if value < 64:
+        return quad_color.BLACK
+    if value < 128:
+        return quad_color.RED
+    if value < 192:
+        return quad_color.YELLOW
+    return quad_color.WHITE
+
+
+def _reference(display, image):
+    """Draw an image pixel by pixel"""
+    display.fill(display.WHITE)
+    pix = image.load()
+    for y in range(image.size[1]):
+        for x in range(image.size[0]):
+            if image.mode == "L":
+                display.pixel(x, y, _gray_code(pix[x, y]))
+            else:
+                display.pixel(x, y, quad_color.rgb_to_code(*pix[x, y]))
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(Adafruit_JD79661, 122, 150), (Adafruit_JD79667, 122, 150)],
+    ids=lambda params: params[0].__name__,
+)
+def displays(request):
+    """A display on a simulated panel and one to draw the expected image on"""
+    display, panel, _ = simulate(*request.param)
+    expected, _, _ = simulate(*request.param)
+    return display, panel, expected
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("mode", ["RGB", "L"])
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+def test_image_matches_pixels(monkeypatch, displays, use_numpy, mode, rotation):
+    if not use_numpy:
+        monkeypatch.setattr(quad_color, "numpy", None)
+    elif quad_color.numpy is None:
+        pytest.skip("numpy is not installed")
+    display, panel, expected = displays
+    for target in (display, expected):
+        target.rotation = rotation
+    image = _noise(mode, display.width, display.height)
+
+    display.image(image)
+    _reference(expected, image)
+    assert bytes(display._buffer1) == bytes(expected._buffer1)
+
+    display.display()
+    assert bytes(panel.ram[0]) == bytes(expected._buffer1)
+
+
+def test_palette_images_are_converted(displays):
+    display, _, expected = displays
+    display.rotation = expected.rotation = 0
+    image = _noise("RGB", display.width, display.height)
+    display.image(image.convert("P"))
+    _reference(expected, image.convert("P").convert("RGB"))
+    assert bytes(display._buffer1) == bytes(expected._buffer1)
+
+
+def test_image_mode_is_checked(displays):
+    display, _, _ = displays
+    display.rotation = 0
+    with pytest.raises(ValueError):
+        display.image(Image.new("1", (display.width, display.height)))
+    with pytest.raises(ValueError):
+        display.image(Image.new("RGB", (display.height, display.width + 1)))
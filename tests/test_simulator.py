@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Drivers on the simulated bus: what reaches the panel and what its RAM ends up holding"""
+
+import asyncio
+
+import pytest
+from simulator import CommandLog, simulate
+
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1680b import Adafruit_SSD1680B
+from adafruit_epd.uc8151d import Adafruit_UC8151D
+
+
+def _draw(display):
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(3, 5, 20, 10, Adafruit_EPD.BLACK)
+    display.line(0, 40, 60, 70, Adafruit_EPD.BLACK)
+    display.pixel(9, 2, Adafruit_EPD.RED)
+
+
+def _expected(display, x, y):
+    if display._black_inverted:
+        return display._blackframebuf.pixel(x, y)
+    return display._blackframebuf.pixel(x, y) ^ 1
+
+
+@pytest.mark.parametrize(
+    ("driver", "width", "height", "ram_write"),
+    [(Adafruit_SSD1680, 122, 250, 0x24), (Adafruit_UC8151D, 128, 296, 0x10)],
+)
+def test_display_sends_the_buffers(driver, width, height, ram_write):
+    display, panel, _ = simulate(driver, width, height)
+    wire = CommandLog(panel)
+    _draw(display)
+    display.display()
+
+    assert wire.data(ram_write) == [bytes(display._buffer1)]
+    assert bytes(panel.ram[0]) == bytes(display._buffer1)
+    assert bytes(panel.ram[1]) == bytes(display._buffer2)
+    assert panel.refreshes == 1
+    # black pixels are stored clear, the panel's RAM reads back the drawing
+    for x, y in ((3, 5), (22, 14), (0, 40), (60, 70), (2, 5), (23, 14)):
+        assert panel.pixel(x, y) == _expected(display, x, y)
+
+
+def test_power_up_comes_before_the_ram_write():
+    display, panel, _ = simulate(Adafruit_SSD1680, 122, 250)
+    wire = CommandLog(panel)
+    display.display()
+
+    commands = wire.sent()
+    assert commands[0] == 0x12  # software reset
+    assert commands.index(0x24) < commands.index(0x26) < commands.index(0x20)
+    assert commands[-1] == 0x20  # the refresh is the last thing sent
+
+
+def test_quad_color_ram_holds_the_color_codes():
+    display, panel, _ = simulate(Adafruit_JD79661, 128, 250)
+    display.fill(Adafruit_JD79661.WHITE)
+    display.fill_rect(0, 0, 4, 2, Adafruit_JD79661.BLACK)
+    display.fill_rect(4, 0, 4, 2, Adafruit_JD79661.YELLOW)
+    display.fill_rect(8, 0, 4, 2, Adafruit_JD79661.RED)
+    display.display()
+
+    codes = Adafruit_JD79661._CODES
+    row = panel.pixels()[1]
+    assert row[:12] == [codes[0]] * 4 + [codes[2]] * 4 + [codes[3]] * 4
+    assert row[12] == codes[1]
+    assert panel.commands[0x10] == 1
+    assert panel.refreshes == 1
+
+
+def test_sram_display_matches_the_host_buffers():
+    plain, plain_panel, _ = simulate(Adafruit_SSD1680, 122, 250)
+    assisted, sram_panel, _ = simulate(Adafruit_SSD1680, 122, 250, sram=True)
+    for display in (plain, assisted):
+        _draw(display)
+        display.display()
+
+    assert sram_panel.ram == plain_panel.ram
+
+
+def test_partial_display_only_writes_the_window():
+    display, panel, _ = simulate(Adafruit_SSD1680B, 122, 250)
+    display.fill(Adafruit_EPD.WHITE)
+    display.display()
+    wire = CommandLog(panel)
+    display.fill_rect(16, 32, 8, 4, Adafruit_EPD.BLACK)
+    display.display(partial=True)
+
+    sent = sum(len(data) for data in wire.data(0x24))
+    assert 0 < sent < len(display._buffer1)
+    assert bytes(panel.ram[0]) == bytes(display._buffer1)
+
+
+def test_unchanged_frame_sends_nothing():
+    display, panel, _ = simulate(Adafruit_SSD1680, 122, 250)
+    _draw(display)
+    display.display(if_changed=True)
+    wire = CommandLog(panel)
+
+    assert display.display(if_changed=True) == []
+    assert wire.packets == []
+    assert panel.refreshes == 1
+
+
+def test_display_async_matches_display():
+    sync, sync_panel, _ = simulate(Adafruit_UC8151D, 128, 296, refresh_time=0.05)
+    asynchronous, async_panel, _ = simulate(Adafruit_UC8151D, 128, 296, refresh_time=0.05)
+    _draw(sync)
+    _draw(asynchronous)
+    sync.display()
+    asyncio.run(asynchronous.display_async())
+
+    assert async_panel.ram == sync_panel.ram
+    assert async_panel.commands == sync_panel.commands
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Sprite blits against a pixel by pixel reference"""
+
+import adafruit_framebuf
+import pytest
+from simulator import simulate
+
+from adafruit_epd import sprite
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.quad_color import QuadColorFrameBuffer
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+
+def _sprite(width, height, seed):
+    buf = bytearray((width + 7) // 8 * height)
+    framebuf = adafruit_framebuf.FrameBuffer(buf, width, height, buf_format=adafruit_framebuf.MHMSB)
+    for y in range(height):
+        for x in range(width):
+            framebuf.pixel(x, y, (x * seed + y * 3 + x * y) % 5 < 2)
+    return framebuf
+
+
+_OPS = {
+    sprite.COPY: lambda data, bit: bit,
+    sprite.OR: lambda data, bit: data | bit,
+    sprite.AND: lambda data, bit: data & bit,
+    sprite.XOR: lambda data, bit: data ^ bit,
+}
+
+_displays = {}
+
+
+def _scene(rotation):
+    # building a display waits out its hardware reset, reuse one per rotation
+    if rotation not in _displays:
+        _displays[rotation] = simulate(Adafruit_SSD1680, 64, 64)[:2]
+    display, panel = _displays[rotation]
+    display.rotation = rotation
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(0, 0, 30, 12, Adafruit_EPD.BLACK)
+    display.fill_rect(10, 6, 30, 12, Adafruit_EPD.RED)
+    return display, panel
+
+
+def _buffers(display):
+    return bytes(display._buffer1), bytes(display._buffer2)
+
+
+def _reference(display, src, x, y, color, mask, op):
+    planes = (
+        (display._blackframebuf, display._black_inverted, color == Adafruit_EPD.BLACK),
+        (display._colorframebuf, display._color_inverted, color == Adafruit_EPD.RED),
+    )
+    for framebuf, inverted, drawn in planes:
+        for row in range(src.height):
+            for col in range(src.width):
+                px, py = x + col, y + row
+                if not (0 <= px < display.width and 0 <= py < display.height):
+                    continue
+                if mask is not None and not mask.pixel(col, row):
+                    continue
+                data = framebuf.pixel(px, py) ^ inverted
+                bit = src.pixel(col, row) if drawn else 0
+                value = _OPS[op](data, bit)
+                framebuf.pixel(px, py, value ^ inverted)
+
+
+@pytest.mark.parametrize("op", sprite.OPS)
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+@pytest.mark.parametrize(("x", "y"), [(8, 16), (5, 3), (-4, -2), (58, 60)])
+def test_blit_matches_pixels(op, rotation, x, y):
+    src = _sprite(11, 7, 3)
+    display, _ = _scene(rotation)
+    _reference(display, src, x, y, Adafruit_EPD.BLACK, None, op)
+    expected = _buffers(display)
+
+    _scene(rotation)
+    display.blit(src, x, y, color=Adafruit_EPD.BLACK, op=op)
+    assert _buffers(display) == expected
+
+
+@pytest.mark.parametrize("op", sprite.OPS)
+def test_masked_blit_only_changes_masked_pixels(op):
+    src = _sprite(13, 9, 2)
+    mask = _sprite(13, 9, 4)
+    display, _ = _scene(1)
+    _reference(display, src, 6, 5, Adafruit_EPD.RED, mask, op)
+    expected = _buffers(display)
+
+    _scene(1)
+    display.blit(src, 6, 5, color=Adafruit_EPD.RED, mask=mask, op=op)
+    assert _buffers(display) == expected
+
+
+def test_blit_reaches_the_panel():
+    src = _sprite(16, 8, 1)
+    display, panel = _scene(0)
+    display.blit(src, 40, 50, op=sprite.COPY)
+    display.display()
+
+    for row in range(src.height):
+        for col in range(src.width):
+            # black pixels are stored clear
+            assert panel.pixel(40 + col, 50 + row) == 1 - src.pixel(col, row)
+
+
+def test_blit_checks_its_arguments():
+    display, _ = _scene(0)
+    with pytest.raises(ValueError):
+        display.blit(_sprite(8, 8, 1), 0, 0, op="nand")
+    with pytest.raises(ValueError):
+        display.blit(_sprite(8, 8, 1), 0, 0, mask=_sprite(8, 4, 1))
+
+
+def test_sprite_rows_needs_mhmsb():
+    buf = bytearray(8)
+    framebuf = adafruit_framebuf.FrameBuffer(buf, 8, 8, buf_format=adafruit_framebuf.MVLSB)
+    with pytest.raises(ValueError):
+        sprite.sprite_rows(framebuf)
+
+
+def test_sprite_rows_reads_msb_first():
+    src = _sprite(11, 3, 3)
+    rows = sprite.sprite_rows(src)
+    for y, row in enumerate(rows):
+        assert [row >> (10 - x) & 1 for x in range(11)] == [src.pixel(x, y) for x in range(11)]
+
+
+@pytest.mark.parametrize("rotation", [1, 2, 3])
+def test_rotate_rows_four_times_is_identity(rotation):
+    rows = sprite.sprite_rows(_sprite(11, 7, 3))
+    rotated, width, height = rows, 11, 7
+    for _ in range(4 // (2 if rotation == 2 else 1)):
+        rotated, width, height = sprite.rotate_rows(rotated, width, height, rotation)
+    assert (rotated, width, height) == (rows, 11, 7)
+
+
+def _quad_sprite(width, height, rotation):
+    src = QuadColorFrameBuffer(bytearray(width * height // 4), width, height)
+    for y in range(height):
+        for x in range(width):
+            src.pixel(x, y, (x + 2 * y) % 4)
+    src.rotation = rotation
+    return src
+
+
+@pytest.mark.parametrize("rotation", [0, 1, 2, 3])
+@pytest.mark.parametrize("masked", [False, True])
+def test_quad_color_blit_reads_the_rotated_source(rotation, masked):
+    display, panel, _ = simulate(Adafruit_JD79661, 32, 24)
+    display.fill(Adafruit_JD79661.WHITE)
+    src = _quad_sprite(12, 4, rotation)
+    width, height = (4, 12) if rotation in {1, 3} else (12, 4)
+    mask = _sprite(width, height, 2) if masked else None
+    display.blit(src, 5, 3, mask=mask)
+    display.display()
+
+    rows = panel.pixels()
+    for y in range(height):
+        for x in range(width):
+            drawn = mask is None or mask.pixel(x, y)
+            expected = src.pixel(x, y) if drawn else Adafruit_JD79661.WHITE
+            assert rows[3 + y][5 + x] == expected
+    assert rows[3 + height][5] == Adafruit_JD79661.WHITE
+    assert rows[3][5 + width] == Adafruit_JD79661.WHITE
+
+
+def test_quad_color_blit_checks_the_rotated_mask():
+    display, _, _ = simulate(Adafruit_JD79661, 32, 24)
+    with pytest.raises(ValueError):
+        display.blit(_quad_sprite(12, 4, 1), 0, 0, mask=_sprite(12, 4, 1))
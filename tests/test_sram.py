@@ -0,0 +1,257 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""The SRAM page cache and views"""
+
+import pytest
+from simulator import SimulatedPin, SimulatedSPI, SimulatedSRAM, simulate
+
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.il0398 import Adafruit_IL0398
+from adafruit_epd.mcp_sram import Adafruit_MCP_SRAM
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+
+def _sram(**kwargs):
+    spi = SimulatedSPI()
+    cs_pin = SimulatedPin("sramcs", True)
+    chip = SimulatedSRAM(spi, cs_pin)
+    sram = Adafruit_MCP_SRAM(cs_pin, spi, **kwargs)
+    spi.reset_stats()
+    return sram, chip, spi
+
+
+def test_byte_writes_wait_for_a_flush():
+    sram, chip, spi = _sram()
+    for addr in range(100, 164):
+        sram.write8(addr, addr & 0xFF)
+    assert sram.read8(130) == 130
+    # one page load for each of the two pages touched, nothing written yet
+    assert spi.locks == 2
+    assert chip.memory[100:164] == bytes(64)
+
+    sram.flush()
+    assert chip.memory[100:164] == bytes(range(100, 164))
+    # both dirty pages go back in one sequential write
+    assert spi.locks == 3
+
+
+def test_lru_page_is_written_back_on_eviction():
+    sram, chip, _ = _sram(page_size=16, cache_pages=2)
+    sram.write8(0, 1)
+    sram.write8(16, 2)
+    sram.read8(0)
+    sram.write8(32, 3)
+    # page 1 was used least recently
+    assert chip.memory[16] == 2
+    assert chip.memory[0] == chip.memory[32] == 0
+    sram.flush()
+    assert chip.memory[0] == 1
+    assert chip.memory[32] == 3
+
+
+def test_views():
+    sram, chip, _ = _sram()
+    view = sram.get_view(1000)
+    view[3] = 0x5A
+    view[10:14] = b"\x01\x02\x03\x04"
+    assert view[3] == 0x5A
+    assert bytes(view[9:15]) == b"\x00\x01\x02\x03\x04\x00"
+    sram.flush()
+    assert chip.memory[1003] == 0x5A
+    assert chip.memory[1010:1014] == b"\x01\x02\x03\x04"
+
+
+def test_bulk_read_sees_cached_writes():
+    sram, _, _ = _sram(page_size=32, cache_pages=1)
+    sram.write8(5, 0x11)
+    sram.write8(40, 0x22)
+    data = sram.read(0, 64)
+    assert data[5] == 0x11
+    assert data[40] == 0x22
+
+
+def test_uncached():
+    sram, chip, spi = _sram(cache_pages=0)
+    sram.write8(7, 0x42)
+    assert chip.memory[7] == 0x42
+    assert sram.read8(7) == 0x42
+    assert spi.locks == 2
+
+
+@pytest.mark.parametrize("page_size", [0, 3, 48])
+def test_page_size_must_be_a_power_of_two(page_size):
+    sram, _, _ = _sram()
+    with pytest.raises(ValueError):
+        sram.configure_cache(page_size=page_size)
+
+
+def test_configure_writes_back_first():
+    sram, chip, _ = _sram()
+    sram.write8(9, 0x99)
+    sram.configure_cache(page_size=16, cache_pages=4)
+    assert chip.memory[9] == 0x99
+
+
+def _draw(display):
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(3, 5, 40, 20, Adafruit_EPD.BLACK)
+    display.line(0, 60, 90, 100, Adafruit_EPD.RED)
+    display.rect(20, 140, 60, 40, Adafruit_EPD.BLACK)
+    for i in range(50):
+        display.pixel(i * 2, 200 + i, Adafruit_EPD.BLACK)
+
+
+def test_drawing_through_sram_matches_host_buffers():
+    plain, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    backed, panel, spi = simulate(Adafruit_SSD1680, 122, 250, sram=True)
+    _draw(plain)
+    spi.reset_stats()
+    _draw(backed)
+    cached = spi.locks
+    backed.display()
+    assert bytes(panel.ram[0]) == bytes(plain._buffer1)
+    assert bytes(panel.ram[1]) == bytes(plain._buffer2)
+
+    # a transaction per page loaded or written, not one or two per byte touched
+    backed.sram.configure_cache(cache_pages=0)
+    spi.reset_stats()
+    _draw(backed)
+    assert cached * 10 < spi.locks
+    backed.display()
+    assert bytes(panel.ram[0]) == bytes(plain._buffer1)
+    assert bytes(panel.ram[1]) == bytes(plain._buffer2)
+
+
+def test_budget_sets_the_page_count():
+    sram, _, _ = _sram(page_size=32, budget=200)
+    for page in range(10):
+        sram.read8(page * 32)
+    stats = sram.cache_stats
+    assert stats["max_pages"] == 6
+    assert stats["budget"] == 192
+    assert stats["pages"] == 6
+
+
+def test_hit_stats():
+    sram, _, _ = _sram()
+    for addr in range(10):
+        sram.read8(addr)
+    stats = sram.cache_stats
+    assert (stats["hits"], stats["misses"]) == (9, 1)
+    assert stats["hit_rate"] == pytest.approx(0.9)
+    sram.reset_cache_stats()
+    assert sram.cache_stats["hit_rate"] == 0.0
+
+
+def test_mirrored_pages_serve_bulk_reads():
+    sram, chip, spi = _sram(page_size=32)
+    chip.memory[:64] = bytes(range(64))
+    sram.read8(0)
+    sram.read8(32)
+    spi.reset_stats()
+    assert bytes(sram.read(10, 40)) == bytes(range(10, 50))
+    assert spi.transfers == 0
+    # a range not wholly mirrored goes to the chip
+    assert bytes(sram.read(40, 40)) == bytes(range(40, 64)) + bytes(16)
+    assert spi.transfers
+
+
+def test_bulk_writes_keep_the_mirror():
+    sram, chip, spi = _sram(page_size=32)
+    sram.read8(0)
+    sram.write(20, b"\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10")
+    spi.reset_stats()
+    assert sram.read8(20) == 1
+    assert sram.read8(31) == 12
+    assert spi.transfers == 0
+    assert chip.memory[20:36] == bytes(range(1, 17))
+
+
+def test_write_through():
+    sram, chip, spi = _sram(page_size=32, cache_pages=1, write_through=True)
+    for addr in range(3, 10):
+        sram.write8(addr, addr)
+    assert chip.memory[3:10] == bytes(7)
+    # moving to another page writes the changed bytes in one burst
+    sram.write8(40, 0xAA)
+    assert chip.memory[3:10] == bytes(range(3, 10))
+    assert sram.cache_stats["writes"] == 1
+    locks = spi.locks
+    # the burst for the byte changed on page 1, then the page load, but evicting
+    # the page writes nothing more
+    sram.read8(100)
+    assert spi.locks == locks + 2
+    assert chip.memory[40] == 0xAA
+    sram.flush()
+    assert sram.cache_stats["writes"] == 2
+    assert spi.locks == locks + 2
+
+
+def test_drawing_with_a_small_budget():
+    plain, _, _ = simulate(Adafruit_SSD1680, 122, 250)
+    backed, panel, _ = simulate(Adafruit_SSD1680, 122, 250, sram=True)
+    backed.sram.configure_cache(page_size=32, budget=256, write_through=True)
+    _draw(plain)
+    _draw(backed)
+    assert backed.sram.cache_stats["pages"] <= 8
+    backed.display()
+    assert bytes(panel.ram[0]) == bytes(plain._buffer1)
+    assert bytes(panel.ram[1]) == bytes(plain._buffer2)
+
+
+def test_erase_streams_a_fill_block():
+    sram, chip, spi = _sram(cache_pages=0)
+    sram.erase(100, 1000, 0xA5)
+    assert chip.memory[100:1100] == b"\xa5" * 1000
+    assert chip.memory[99] == chip.memory[1100] == 0
+    # one transaction: the header, then 256 byte blocks and the rest
+    assert spi.locks == 1
+    assert spi.transfers == 1 + 4
+
+
+@pytest.mark.parametrize("addr", [0, 7])
+def test_fill_range_pattern(addr):
+    sram, chip, _ = _sram(cache_pages=0)
+    sram.fill_range_pattern(addr, 601, b"\x55\xaa\x0f")
+    assert chip.memory[addr : addr + 601] == (b"\x55\xaa\x0f" * 201)[:601]
+    assert chip.memory[addr + 601] == 0
+
+
+@pytest.mark.parametrize("pattern", [b"", bytes(257)])
+def test_bad_fill_patterns(pattern):
+    sram, _, _ = _sram()
+    with pytest.raises(ValueError):
+        sram.fill_range_pattern(0, 10, pattern)
+
+
+def test_empty_fill():
+    sram, _, spi = _sram()
+    sram.fill_range_pattern(0, 0, b"\x55")
+    assert spi.locks == 0
+
+
+def test_fills_keep_the_mirror():
+    sram, chip, spi = _sram(page_size=32, cache_pages=4)
+    sram.write8(5, 0x11)
+    sram.fill_range_pattern(3, 93, b"\x12\x34")
+    spi.reset_stats()
+    # the cached page was filled in place, whole pages were mirrored without reading
+    assert sram.read8(5) == 0x12
+    assert sram.read8(32) == 0x34
+    assert sram.read8(64) == 0x34
+    assert sram.read8(95) == 0x12
+    assert spi.transfers == 0
+    sram.flush()
+    assert chip.memory[3:96] == (b"\x12\x34" * 47)[:93]
+
+
+def test_clearing_a_large_panel():
+    display, _, spi = simulate(Adafruit_IL0398, 400, 300, sram=True)
+    display.sram.configure_cache(cache_pages=0)
+    spi.reset_stats()
+    display.fill(Adafruit_EPD.WHITE)
+    assert spi.locks == 2
+    size = display._buffer1_size + display._buffer2_size
+    assert spi.transfers < size // 256 + 6
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Transfer stats and tracing with enable_stats()"""
+
+import pytest
+from simulator import CommandLog, simulate
+
+from adafruit_epd import trace
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+
+def _display(sram=False):
+    display, panel, spi = simulate(Adafruit_SSD1680, 122, 250, sram=sram)
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(10, 20, 30, 40, Adafruit_EPD.BLACK)
+    return display, panel, spi
+
+
+def test_counts_match_the_bus():
+    display, panel, spi = _display()
+    events = []
+    stats = display.enable_stats(lambda event, value: events.append((event, value)))
+    log = CommandLog(panel)
+    spi.reset_stats()
+    display.display()
+
+    assert stats.commands == len(log.packets)
+    assert stats.data_bytes == sum(len(data) for _, data in log.packets)
+    assert stats.locks == spi.locks
+    assert stats.transfers == spi.transfers
+    assert stats.sram_bytes == 0
+    assert stats.busy_waits >= 1
+    assert stats.busy_polls >= stats.busy_waits
+    assert stats.cs_toggles >= 2 * stats.commands
+    assert [value for event, value in events if event == trace.COMMAND] == log.sent()
+    assert sum(value for event, value in events if event == trace.DATA) == stats.data_bytes
+    assert len([event for event, _ in events if event == trace.BUSY]) == stats.busy_waits
+
+
+def test_sram_traffic_is_counted_apart():
+    display, _, _ = _display(sram=True)
+    stats = display.enable_stats()
+    display.display()
+    size = display._buffer1_size + display._buffer2_size
+    assert stats.sram_bytes >= size
+    assert stats.data_bytes >= size
+
+
+def test_lock_spins():
+    display, _, spi = _display()
+
+    def release(event, value):
+        if event == trace.LOCK_SPIN:
+            spi.unlock()
+
+    stats = display.enable_stats(release)
+    spi.try_lock()
+    display.command(0x22)
+    assert stats.lock_spins == 1
+    assert stats.sleeps == 1
+    assert stats.locks == 1
+
+
+def test_reset_and_snapshot():
+    display, _, _ = _display()
+    stats = display.enable_stats()
+    display.command(0x22)
+    snapshot = stats.snapshot()
+    assert snapshot["commands"] == 1
+    assert snapshot["elapsed"] >= 0
+    stats.reset()
+    assert stats.commands == 0
+    assert set(stats.snapshot()) == set(snapshot)
+
+
+def test_disabling_puts_the_originals_back():
+    display, _, _ = _display(sram=True)
+    originals = (display.spi_device, display._cs, display._dc, display._busy)
+    sram_bus = (display.sram._spi.spi, display.sram.cs_pin)
+    assert display.stats is None
+
+    stats = display.enable_stats()
+    assert display.stats is stats
+    assert display.enable_stats() is stats
+    assert display.spi_device is not originals[0]
+    display.disable_stats()
+
+    assert display.stats is None
+    assert (display.spi_device, display._cs, display._dc, display._busy) == originals
+    assert (display.sram._spi.spi, display.sram.cs_pin) == sram_bus
+    for name in ("_sleep", "_sleep_async", "busy_wait", "busy_wait_async"):
+        assert name not in vars(display)
+    counted = stats.commands
+    display.command(0x22)
+    assert stats.commands == counted
+
+
+def test_stats_attach_once():
+    display, _, _ = _display()
+    stats = trace.EPDStats()
+    stats.attach(display)
+    with pytest.raises(RuntimeError):
+        stats.attach(display)
+    stats.detach()
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Command runs sent in one SPI bus transaction"""
+
+import pytest
+from simulator import CommandLog, simulate
+
+from adafruit_epd import commands
+from adafruit_epd.ek79686 import Adafruit_EK79686
+from adafruit_epd.il0373 import Adafruit_IL0373
+from adafruit_epd.il91874 import Adafruit_IL91874
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1683 import Adafruit_SSD1683
+from adafruit_epd.uc8179 import Adafruit_UC8179
+
+DRIVERS = [
+    Adafruit_EK79686,
+    Adafruit_IL0373,
+    Adafruit_IL91874,
+    Adafruit_JD79661,
+    Adafruit_SSD1680,
+    Adafruit_SSD1683,
+    Adafruit_UC8179,
+]
+
+
+def _display(driver=Adafruit_SSD1680):
+    display, panel, spi = simulate(driver, 128, 128)
+    display._sleep = lambda seconds: None
+    spi.reset_stats()
+    return display, CommandLog(panel), spi
+
+
+@pytest.mark.parametrize("driver", DRIVERS)
+def test_power_up_locks_the_bus_once(driver):
+    display, log, spi = _display(driver)
+    display.power_up()
+
+    entries = [cmd for cmd, _, _ in commands.walk(display._power_up_list())]
+    assert log.sent() == [cmd for cmd in entries if cmd < commands.RESET]
+    # the bus is let go for each busy wait, and taken again after it
+    assert spi.locks == 1 + entries.count(commands.BUSY)
+    assert spi.locks < len(log.sent())
+    assert not spi._locked
+
+
+def test_commands_in_a_transaction():
+    display, log, spi = _display()
+    with display.transaction():
+        display.command(0x01, bytearray((0x03, 0x04)))
+        with display.transaction():
+            display.command(0x22)
+        display.command(0x20)
+        assert spi._locked
+    assert spi.locks == 1
+    assert not spi._locked
+    # CS still frames each command
+    assert log.packets == [
+        [0x01, bytearray((0x03, 0x04))],
+        [0x22, bytearray()],
+        [0x20, bytearray()],
+    ]
+
+
+def test_commands_outside_a_transaction_lock_each_time():
+    display, _, spi = _display()
+    display.command(0x01, bytearray((0x03,)))
+    display.command(0x22)
+    assert spi.locks == 2
+    assert not spi._locked
+
+
+def test_an_error_releases_the_bus():
+    display, _, spi = _display()
+    with pytest.raises(ValueError), display.transaction():
+        display.command(0x22)
+        raise ValueError
+    assert not spi._locked
+    assert display._transaction_depth == 0
+
+
+def test_busy_wait_lets_go_of_the_bus():
+    display, _, spi = _display()
+    seen = []
+    display._busy = None
+    display._sleep = lambda seconds: seen.append(spi._locked)
+    with display.transaction():
+        display.busy_wait()
+        assert spi._locked
+    assert seen == [False]
+    assert spi.locks == 2
+
+
+def test_command_list_sends_data_in_place():
+    display, log, spi = _display()
+    sequence = commands.compile_commands(
+        commands.command(0x11, b"\x03"),
+        commands.delay(10),
+        commands.command(0x44, b"\x00\x0f"),
+        commands.command(0x20),
+    )
+    display._send_command_list(sequence)
+    assert log.packets == [
+        [0x11, bytearray(b"\x03")],
+        [0x44, bytearray(b"\x00\x0f")],
+        [0x20, bytearray()],
+    ]
+    assert spi.locks == 1
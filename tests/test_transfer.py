@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""RAM transfer modes: bytes, rows and planes reaching the simulated panel"""
+
+import pytest
+from simulator import CommandLog, simulate
+
+from adafruit_epd.epd import Adafruit_EPD
+from adafruit_epd.il91874 import Adafruit_IL91874
+from adafruit_epd.jd79661 import Adafruit_JD79661
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from adafruit_epd.ssd1683 import Adafruit_SSD1683
+from adafruit_epd.uc8151d import Adafruit_UC8151D
+from adafruit_epd.uc8253 import Adafruit_UC8253
+
+MODES = (Adafruit_EPD.TX_BYTE, Adafruit_EPD.TX_ROW, Adafruit_EPD.TX_PLANE)
+
+
+def _draw(display):
+    display.fill(Adafruit_EPD.WHITE)
+    display.fill_rect(3, 5, 40, 20, Adafruit_EPD.BLACK)
+    display.line(0, 60, 90, 100, Adafruit_EPD.BLACK)
+
+
+@pytest.mark.parametrize(
+    ("driver", "mode"),
+    [
+        (Adafruit_SSD1680, Adafruit_EPD.TX_PLANE),
+        (Adafruit_UC8151D, Adafruit_EPD.TX_PLANE),
+        (Adafruit_SSD1683, Adafruit_EPD.TX_ROW),
+        (Adafruit_UC8253, Adafruit_EPD.TX_ROW),
+        (Adafruit_IL91874, Adafruit_EPD.TX_BYTE),
+        (Adafruit_JD79661, Adafruit_EPD.TX_BYTE),
+    ],
+)
+def test_default_modes(driver, mode):
+    display, _, _ = simulate(driver, 128, 128, busy=False)
+    assert display.ram_transfer_mode == mode
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize(
+    ("driver", "width", "height", "ram_write"),
+    [
+        (Adafruit_SSD1680, 122, 250, 0x24),
+        (Adafruit_SSD1683, 400, 300, 0x24),
+        (Adafruit_UC8253, 240, 416, 0x10),
+    ],
+)
+@pytest.mark.parametrize("sram", [False, True])
+def test_modes_send_the_same_ram(mode, driver, width, height, ram_write, sram):  # noqa: PLR0913, PLR0917
+    display, panel, _ = simulate(driver, width, height, sram=sram, busy=False)
+    display._sleep = lambda seconds: None
+    display.ram_transfer_mode = mode
+    _draw(display)
+    log = CommandLog(panel)
+    display.display()
+
+    size = display._buffer1_size
+    assert sum(log.transfers(ram_write)) == size
+    if not sram:
+        assert bytes(panel.ram[0]) == bytes(display._buffer1)
+        writes = len(log.transfers(ram_write))
+        if mode == Adafruit_EPD.TX_BYTE:
+            assert writes == size
+        elif mode == Adafruit_EPD.TX_ROW:
+            assert writes == height
+        else:
+            assert writes == 1
+    else:
+        display.sram.flush()
+        assert bytes(panel.ram[0]) == bytes(display.sram.read(0, size))
+
+
+def test_mode_is_checked():
+    display, _, _ = simulate(Adafruit_SSD1680, 122, 250, busy=False)
+    with pytest.raises(ValueError):
+        display.ram_transfer_mode = 3